@@ -0,0 +1,59 @@
+"""
+对比 AddTableRow 迁移前逐行 table.loc[len(table)] = ... 追加与 op_utils.table_utils.append_rows 一次性追加的耗时，
+并检查追加后各列类型是否保持不变
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_append_rows.py [--rows 100 1000 10000]
+"""
+import argparse
+import time
+
+import numpy
+
+from video_graph.data_table import DataTable
+from video_graph.ops.op_utils.table_utils import append_rows
+
+
+def build_table():
+    return DataTable(name="TimelineTable", data={
+        'video_idx': numpy.arange(50, dtype='int32'),
+        'duration': numpy.random.default_rng(0).random(50),
+        'is_main_track': [True] * 50,
+        'video_blob_key': [f'ad_smart_video_{i}' for i in range(50)],
+        'input_file_map': [{} for _ in range(50)],
+    })
+
+
+# 迁移前的逐行实现，作为对照
+def legacy_append(table, row_num):
+    default_value = {}
+    for col in table.columns:
+        val = None
+        if table[col].dtype in ["int64", "float64"]:
+            val = 0
+        default_value.update({col: val})
+    for _ in range(row_num):
+        table.loc[len(table)] = default_value
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    for row_num in args.rows:
+        results = []
+        for name, func in (('loc per row', legacy_append), ('append_rows', append_rows)):
+            table = build_table()
+            start = time.perf_counter()
+            result = func(table, row_num)
+            elapsed = time.perf_counter() - start
+            results.append(elapsed)
+            dtypes = ', '.join(f'{column}={dtype}' for column, dtype in result.dtypes.items())
+            print(f'{row_num:>6} rows  {name:<12} {elapsed * 1000:10.2f}ms  {dtypes}')
+        print(f'{"":>6}       speedup={results[0] / results[1]:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+模拟同一节点上连续的多个请求下载同一批热门素材/BGM，对比 FileDownloaderOp 每个请求各自下载与
+op_utils.blob_utils.BlobCache 节点本地缓存(命中时硬链接)的总耗时、实际传输次数和命中/淘汰计数；
+每个请求从 --hot 个热门文件中按 Zipf 分布抽取 --files 个，复用 bench_file_download.py 中的桩服务和客户端
+
+只依赖标准库:
+    python benchmarks/bench_blob_cache.py [--requests 20] [--files 10] [--hot 30] [--size-kb 512]
+        [--cache-mb 16] [--concurrency 8]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, '算子列表', 'op_utils'))
+
+from bench_file_download import LocalBlobClient, ObjectServer  # noqa: E402
+from blob_utils import BlobCache, TransferTask, run_transfers  # noqa: E402
+
+
+def request_keys(rng, hot, files):
+    weights = [1.0 / (rank + 1) for rank in range(hot)]
+    return sorted(set(rng.choices(range(hot), weights, k=files)))
+
+
+def run_requests(client, key_lists, directory, concurrency, cache=None):
+    downloads = 0
+    lock = threading.Lock()
+
+    def download(task):
+        nonlocal downloads
+
+        def fetch(file_path):
+            nonlocal downloads
+            with lock:
+                downloads += 1
+            return client.download_file_with_retry(task.key, file_path)
+
+        if cache is None:
+            return fetch(task.file_path)
+        file_path, task.cache_hit, task.evicted = cache.fetch(task.cache_key, fetch, task.file_path)
+        task.file_path = file_path or task.file_path
+        return file_path is not None
+
+    os.makedirs(directory, exist_ok=True)
+    start = time.perf_counter()
+    for request_id, keys in enumerate(key_lists):
+        tasks = [TransferTask(f'material_{i}.mp4', client, f'material_{i}.mp4',
+                              os.path.join(directory, f'{request_id}-material_{i}.mp4'),
+                              f'{client.bucket}-material_{i}.mp4') for i in keys]
+        run_transfers(tasks, download, concurrency)
+        assert all(task.status for task in tasks)
+    return time.perf_counter() - start, downloads
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--files', type=int, default=10, help='每个请求抽取的文件数(去重前)')
+    parser.add_argument('--hot', type=int, default=30, help='热门文件总数')
+    parser.add_argument('--size-kb', type=int, default=512)
+    parser.add_argument('--cache-mb', type=float, default=16.0, help='缓存容量上限(MB)')
+    parser.add_argument('--latency', type=float, default=80.0, help='首字节延迟(毫秒)')
+    parser.add_argument('--bandwidth', type=float, default=50.0, help='单连接带宽(MB/s)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    bucket = 'ad-nieuwland-material'
+    objects = {f'{bucket}/material_{i}.mp4': os.urandom(args.size_kb * 1024) for i in range(args.hot)}
+    server = ObjectServer(objects, args.latency / 1000.0, args.bandwidth * 1024 * 1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    rng = random.Random(0)
+    key_lists = [request_keys(rng, args.hot, args.files) for _ in range(args.requests)]
+    total = sum(map(len, key_lists))
+
+    print(f'{args.requests} requests x {args.files} draws from {args.hot} hot files of {args.size_kb}KB '
+          f'({total} files), cache={args.cache_mb}MB, concurrency={args.concurrency}')
+    with tempfile.TemporaryDirectory() as directory:
+        client = LocalBlobClient(server.server_address[1], bucket)
+        legacy, legacy_downloads = run_requests(client, key_lists, os.path.join(directory, 'legacy'),
+                                                args.concurrency)
+        print(f'  no cache    wall={legacy * 1000:9.1f}ms  downloads={legacy_downloads}')
+
+        cache = BlobCache(os.path.join(directory, 'cache'), int(args.cache_mb * 1024 * 1024))
+        cached, cached_downloads = run_requests(client, key_lists, os.path.join(directory, 'cached'),
+                                                args.concurrency, cache)
+        print(f'  blob cache  wall={cached * 1000:9.1f}ms  downloads={cached_downloads}  hits={cache.hits} '
+              f'misses={cache.misses} evictions={cache.evictions}  speedup={legacy / cached:.1f}x')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+对比不同进程数下 OperatorCatalog 全量扫描解析合成算子树的耗时
+
+用法:
+    python benchmarks/bench_catalog_scan.py [--ops 5000] [--max-workers 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from bench_index_latency import build_synthetic_tree  # noqa: E402
+from operator_catalog import OperatorCatalog  # noqa: E402
+from operator_parser import parse_operator_file  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ops', type=int, default=5000, help='合成算子树的算子数量')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_synthetic_tree(tmp_dir, args.ops)
+        base_dirs = [os.path.join(tmp_dir, 'base_op'), os.path.join(tmp_dir, 'extend_op')]
+        baseline = None
+        workers = 1
+        while workers <= args.max_workers:
+            catalog = OperatorCatalog(base_dirs, parse_operator_file, workers=workers)
+            start = time.perf_counter()
+            parsed = catalog.refresh()
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f'workers={workers:<3} parsed={parsed}  {elapsed * 1000:9.1f}ms  speedup={baseline / elapsed:5.2f}x')
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+对比 DataFrame.query/eval 每次重新解析表达式与 op_utils.expr_utils 编译缓存后的耗时，
+以及 IfOp 原先 query(condition).shape[0] 与 any_row 分块短路判断的耗时，并检查结果一致
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_expression.py [--rows 50 10000 200000] [--repeat 50]
+"""
+import argparse
+import time
+
+import numpy
+import pandas
+
+from video_graph.data_table import DataTable
+from video_graph.ops.op_utils.expr_utils import any_row, eval_table, numexpr, query_table
+
+QUERY_EXPRESSIONS = ["duration > 3 & video_idx % 2 == 0", "material_type == 'video' and video_idx in [1, 2, 3]"]
+EVAL_EXPRESSION = "end_time = start_time + duration"
+# 没有赋值的 eval 返回 Series，行数不少于 NUMEXPR_MIN_ROWS 且安装了 numexpr 时走 numexpr
+EVAL_VALUE_EXPRESSION = "start_time + duration * 2"
+
+
+def build_table(rows):
+    rng = numpy.random.default_rng(0)
+    return DataTable(name="TimelineTable", data={
+        'video_idx': numpy.arange(rows),
+        'start_time': rng.random(rows) * 60,
+        'duration': rng.random(rows) * 5,
+        'material_type': rng.choice(['video', 'image', 'audio'], rows),
+    })
+
+
+def timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def report(label, legacy, compiled):
+    print(f'  {label:<60} {legacy * 1e6:10.0f}us {compiled * 1e6:10.0f}us  speedup={legacy / compiled:.1f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[50, 10000, 200000])
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    print(f'numexpr: {"installed" if numexpr is not None else "not installed"}')
+    for rows in args.rows:
+        table = build_table(rows)
+        print(f'{rows} rows {"":>55} {"pandas":>12} {"compiled":>12}')
+        for expression in QUERY_EXPRESSIONS:
+            legacy, expected = timeit(lambda: table.query(expression, engine="python"), args.repeat)
+            compiled, result = timeit(lambda: query_table(table, expression), args.repeat)
+            assert expected.equals(result)
+            report(f'query  {expression}', legacy, compiled)
+
+            legacy, expected = timeit(lambda: table.query(expression).shape[0] > 0, args.repeat)
+            compiled, result = timeit(lambda: any_row(table, expression), args.repeat)
+            assert expected == result
+            report(f'any    {expression}', legacy, compiled)
+
+        legacy, expected = timeit(lambda: table.eval(EVAL_EXPRESSION), args.repeat)
+        compiled, result = timeit(lambda: eval_table(table, EVAL_EXPRESSION), args.repeat)
+        assert numpy.allclose(expected['end_time'], result['end_time'])
+        report(f'eval   {EVAL_EXPRESSION}', legacy, compiled)
+
+        legacy, expected = timeit(lambda: table.eval(EVAL_VALUE_EXPRESSION), args.repeat)
+        compiled, result = timeit(lambda: eval_table(table, EVAL_VALUE_EXPRESSION), args.repeat)
+        assert isinstance(result, pandas.Series) and result.index.equals(expected.index)
+        assert numpy.allclose(expected, result)
+        report(f'eval   {EVAL_VALUE_EXPRESSION}', legacy, compiled)
+
+
+if __name__ == '__main__':
+    main()
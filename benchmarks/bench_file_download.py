@@ -0,0 +1,139 @@
+"""
+对比 FileDownloaderOp 逐个下载与 op_utils.blob_utils.run_transfers 线程池并发下载在不同并发数下的总耗时，
+使用脚本内置的 S3 兼容桩服务(只支持 GET /bucket/key)，每个请求先等待 --latency 毫秒模拟首字节延迟，
+再按 --bandwidth MB/s 分块返回对象内容；客户端每个线程保持一个长连接，模拟 BlobStoreClientManager 复用连接
+
+只依赖标准库:
+    python benchmarks/bench_file_download.py [--files 30] [--size-kb 512] [--latency 80] [--bandwidth 50]
+        [--concurrency 1 2 4 8 16]
+"""
+import argparse
+import http.client
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, '算子列表', 'op_utils'))
+
+from blob_utils import TransferTask, run_transfers  # noqa: E402
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ObjectHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = self.server.objects.get(self.path.lstrip('/'))
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        time.sleep(self.server.latency)
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), CHUNK_SIZE):
+            chunk = body[start:start + CHUNK_SIZE]
+            self.wfile.write(chunk)
+            time.sleep(len(chunk) / self.server.bandwidth)
+
+    def log_message(self, *args):
+        pass
+
+
+class ObjectServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, objects, latency, bandwidth):
+        super().__init__(('127.0.0.1', 0), ObjectHandler)
+        self.objects = objects
+        self.latency = latency
+        self.bandwidth = bandwidth
+
+
+class LocalBlobClient:
+    """
+    桩服务的客户端，接口与 Blob 存储客户端的 download_file_with_retry 一致，每个线程复用一个 HTTP 长连接
+
+    Attributes:
+        bucket (str): 对象所在的 bucket，对应 db-table
+    """
+
+    def __init__(self, port, bucket):
+        self.port = port
+        self.bucket = bucket
+        self.connections = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if getattr(self._local, 'connection', None) is None:
+            self._local.connection = http.client.HTTPConnection('127.0.0.1', self.port)
+            with self._lock:
+                self.connections += 1
+        return self._local.connection
+
+    def download_file_with_retry(self, key, file_path, retry=3):
+        for _ in range(retry):
+            connection = self._connection()
+            try:
+                connection.request('GET', f'/{self.bucket}/{key}')
+                response = connection.getresponse()
+                if response.status != 200:
+                    response.read()
+                    return False
+                with open(file_path, 'wb') as file:
+                    while True:
+                        chunk = response.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file.write(chunk)
+                return True
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                self._local.connection = None
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=30)
+    parser.add_argument('--size-kb', type=int, default=512)
+    parser.add_argument('--latency', type=float, default=80.0, help='首字节延迟(毫秒)')
+    parser.add_argument('--bandwidth', type=float, default=50.0, help='单连接带宽(MB/s)')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    bucket = 'ad-nieuwland-material'
+    objects = {f'{bucket}/material_{i}.mp4': os.urandom(args.size_kb * 1024) for i in range(args.files)}
+    server = ObjectServer(objects, args.latency / 1000.0, args.bandwidth * 1024 * 1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f'{args.files} files x {args.size_kb}KB, latency={args.latency}ms, bandwidth={args.bandwidth}MB/s per connection')
+    baseline = None
+    with tempfile.TemporaryDirectory() as directory:
+        for concurrency in args.concurrency:
+            client = LocalBlobClient(server.server_address[1], bucket)
+            tasks = [TransferTask(f'{bucket}/material_{i}.mp4', client, f'material_{i}.mp4',
+                                  os.path.join(directory, f'{concurrency}-material_{i}.mp4')) for i in range(args.files)]
+            start = time.perf_counter()
+            run_transfers(tasks, lambda task: task.client.download_file_with_retry(task.key, task.file_path),
+                          concurrency)
+            elapsed = time.perf_counter() - start
+            assert all(task.status for task in tasks)
+            assert all(os.path.getsize(task.file_path) == args.size_kb * 1024 for task in tasks)
+            baseline = baseline or elapsed
+            slowest = max(task.elapsed for task in tasks)
+            print(f'  concurrency={concurrency:<3} wall={elapsed * 1000:9.1f}ms  slowest file={slowest * 1000:7.1f}ms  '
+                  f'connections={client.connections:<3} speedup={baseline / elapsed:.1f}x')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
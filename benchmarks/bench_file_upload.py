@@ -0,0 +1,93 @@
+"""
+对比 FileUploaderOp 逐个上传(concurrency=1，与原先逐行上传一致)与并发上传、按内容去重后的总耗时和上传字节数，
+模拟一次渲染的产物：--files 个文件中有 --duplicates 个与其他文件内容相同(如重复生成的静音音频、未变化的片段)；
+直接调用 FileUploaderOp.compute，Blob 客户端替换为用 sleep 模拟每次上传的固定延迟和单连接带宽的客户端，
+object_exists 模拟一次元数据请求
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_file_upload.py [--files 40] [--duplicates 15] [--size-kb 512] [--concurrency 8]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from video_graph.common.utils.blobstore import BlobStoreClientManager
+from video_graph.data_table import DataTable
+from video_graph.op_context import OpContext
+from video_graph.ops.base_op.file_io_op.file_uploader_op import FileUploaderOp
+
+
+class SleepBlobClient:
+    """
+    模拟 Blob 存储客户端，接口与 upload_file_with_retry/object_exists 一致
+
+    Attributes:
+        objects (dict): 已上传的对象，Key -> 字节数
+        uploaded_bytes (int): 累计上传字节数
+    """
+
+    def __init__(self, latency, bandwidth):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects = {}
+        self.uploaded_bytes = 0
+        self._lock = threading.Lock()
+
+    def object_exists(self, key):
+        time.sleep(self.latency / 4)
+        return key in self.objects
+
+    def upload_file_with_retry(self, file_path, key):
+        size = os.path.getsize(file_path)
+        time.sleep(self.latency + size / self.bandwidth)
+        with self._lock:
+            self.objects[key] = size
+            self.uploaded_bytes += size
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=40)
+    parser.add_argument('--duplicates', type=int, default=15)
+    parser.add_argument('--size-kb', type=int, default=512)
+    parser.add_argument('--latency', type=float, default=60.0, help='每次请求的固定延迟(毫秒)')
+    parser.add_argument('--bandwidth', type=float, default=50.0, help='单连接带宽(MB/s)')
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    latency, bandwidth = args.latency / 1000.0, args.bandwidth * 1024 * 1024
+    with tempfile.TemporaryDirectory() as directory:
+        unique = args.files - args.duplicates
+        contents = [os.urandom(args.size_kb * 1024) for _ in range(unique)]
+        file_paths = []
+        for i in range(args.files):
+            file_path = os.path.join(directory, f'segment_{i}.mp4')
+            with open(file_path, 'wb') as file:
+                file.write(contents[i % unique])
+            file_paths.append(file_path)
+        print(f'{args.files} files x {args.size_kb}KB ({args.duplicates} duplicates), latency={args.latency}ms, '
+              f'bandwidth={args.bandwidth}MB/s per connection')
+
+        legacy = None
+        for concurrency, dedup in ((1, False), (args.concurrency, False), (args.concurrency, True)):
+            client = SleepBlobClient(latency, bandwidth)
+            op_context = OpContext('bench', 'bench', 'bench')
+            op_context.input_tables.append(DataTable(name='RenderTable', data={'file_path': file_paths}))
+            op = FileUploaderOp(name='FileUploaderOp', attrs={'concurrency': concurrency, 'dedup': dedup})
+            start = time.perf_counter()
+            with mock.patch.object(BlobStoreClientManager, 'get_client', return_value=client):
+                assert op.compute(op_context)
+            elapsed = time.perf_counter() - start
+            assert op_context.output_tables[0]['file_blob_key'].notna().all()
+            if legacy is None:
+                legacy = elapsed
+            label = f'concurrency={concurrency}' + (' dedup' if dedup else '')
+            print(f'  {label:<20} wall={elapsed * 1000:8.1f}ms  uploaded={client.uploaded_bytes >> 10}KB  '
+                  f'speedup={legacy / elapsed:.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+对比 GroupByColumnsOp 迁移前每次解析 agg_rules 并把 FunctionManager 函数直接交给 pandas 逐组调用，
+与 op_utils.agg_utils 缓存规则、按组号整列计算 list_merge 的耗时，以及 sort=False 不排序分组的耗时，并检查结果一致
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_group_by.py [--rows 100000] [--groups 1000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+
+import numpy
+
+from video_graph.data_table import DataTable
+from video_graph.ops.light_function.function_manager import FunctionManager
+from video_graph.ops.op_utils.agg_utils import group_aggregate, parse_agg_rules
+
+AGG_RULES = json.dumps({"clip_ids": "list_merge", "duration": "sum", "score": "max"})
+MULTI_AGG_RULES = json.dumps({"clip_ids": "list_merge", "duration": ["sum", "mean", "max"], "score": ["min", "max"]})
+
+
+def build_table(rows, groups):
+    rng = numpy.random.default_rng(0)
+    return DataTable(name="MaterialTable", data={
+        'material_id': [f'material_{i}' for i in rng.integers(0, groups, rows)],
+        'clip_ids': [[int(i)] * int(n) for i, n in zip(rng.integers(0, 10000, rows), rng.integers(0, 4, rows))],
+        'duration': rng.random(rows) * 5,
+        'score': rng.random(rows),
+    })
+
+
+# 迁移前的实现，作为对照
+def legacy_group_by(table, group_by_columns, agg_rules):
+    new_agg_rules = {}
+    function_manager = FunctionManager()
+    for column, function_name in json.loads(agg_rules).items():
+        function = function_manager.get_function(function_name)
+        new_agg_rules.update({column: function if function else function_name})
+    return table.groupby(group_by_columns).agg(new_agg_rules).reset_index()
+
+
+def timeit(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--groups', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    table = build_table(args.rows, args.groups)
+    group_by_columns = ['material_id']
+    legacy, expected = timeit(lambda: legacy_group_by(table, group_by_columns, AGG_RULES), args.repeat)
+    cached, result = timeit(lambda: group_aggregate(table, group_by_columns, parse_agg_rules(AGG_RULES)), args.repeat)
+    assert expected.equals(result)
+    unsorted, result = timeit(
+        lambda: group_aggregate(table, group_by_columns, parse_agg_rules(AGG_RULES), sort=False), args.repeat)
+    assert expected.equals(result.sort_values('material_id', ignore_index=True))
+    multi, result = timeit(
+        lambda: group_aggregate(table, group_by_columns, parse_agg_rules(MULTI_AGG_RULES)), args.repeat)
+
+    print(f'{args.rows} rows, {args.groups} groups, rules={AGG_RULES}')
+    print(f'  legacy agg             {legacy * 1000:10.2f}ms')
+    print(f'  group_aggregate        {cached * 1000:10.2f}ms  speedup={legacy / cached:.1f}x')
+    print(f'  group_aggregate unsort {unsorted * 1000:10.2f}ms  speedup={legacy / unsorted:.1f}x')
+    print(f'  multi agg ({len(result.columns) - 1} outputs)  {multi * 1000:10.2f}ms  columns={list(result.columns)}')
+
+
+if __name__ == '__main__':
+    main()
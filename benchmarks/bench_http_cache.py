@@ -0,0 +1,64 @@
+"""
+HTTP 缓存压测：对比不带缓存校验/压缩的请求与浏览器式请求(Accept-Encoding + If-None-Match)的传输字节数和延迟
+
+用法:
+    python benchmarks/bench_http_cache.py [--requests 200] [--concurrency 8]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ['/', '/about', '/image/video_graph_framework.png']
+
+
+# 响应在网络上传输的字节数近似为状态行+响应头+响应体
+def wire_bytes(response):
+    header_bytes = sum(len(key) + len(value) + 4 for key, value in response.headers.items())
+    return len(response.status) + 11 + header_bytes + len(response.get_data())
+
+
+def run_client(app, route, requests, revalidate):
+    client = app.test_client()
+    headers = {'Accept-Encoding': 'br, gzip'} if revalidate else {}
+    latencies, total_bytes = [], 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(route, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        total_bytes += wire_bytes(response)
+        if revalidate and 'ETag' in response.headers:
+            headers['If-None-Match'] = response.headers['ETag']
+    return latencies, total_bytes
+
+
+def load_test(app, route, requests, concurrency, revalidate):
+    per_client = max(requests // concurrency, 1)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: run_client(app, route, per_client, revalidate), range(concurrency)))
+    latencies = sorted(latency for result in results for latency in result[0])
+    total_bytes = sum(result[1] for result in results)
+    return latencies[int(len(latencies) * 0.99) - 1], total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    sys.path.insert(0, REPO_ROOT)
+    import docs_server
+
+    docs_server.catalog.refresh()
+    for route in ROUTES:
+        for label, revalidate in (('plain', False), ('cached', True)):
+            p99, total_bytes = load_test(docs_server.app, route, args.requests, args.concurrency, revalidate)
+            print(f'{route:<36} {label:<7} p99={p99:8.2f}ms  wire={total_bytes / 1024:10.1f}KB')
+
+
+if __name__ == '__main__':
+    main()
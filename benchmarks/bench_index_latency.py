@@ -0,0 +1,87 @@
+"""
+对比首页 `/` 的冷启动(每次请求全量解析算子文件)与热缓存(OperatorCatalog)延迟
+
+用法:
+    python benchmarks/bench_index_latency.py [--ops 5000] [--requests 20]
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_ROOT = os.path.join(REPO_ROOT, '算子列表')
+
+
+# 复制真实算子文件生成一个指定规模的合成算子树
+def build_synthetic_tree(target_dir, op_count, ops_per_category=50):
+    sources = []
+    for root, _, files in os.walk(SOURCE_ROOT):
+        sources.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.py'))
+    for i in range(op_count):
+        sub_root = 'base_op' if i % 2 == 0 else 'extend_op'
+        category_dir = os.path.join(target_dir, sub_root, f'category_{i // ops_per_category}')
+        os.makedirs(category_dir, exist_ok=True)
+        shutil.copyfile(sources[i % len(sources)], os.path.join(category_dir, f'synthetic_{i}_op.py'))
+
+
+def measure(client, requests):
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get('/')
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200
+    return latencies
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f'{label:<28} mean={statistics.mean(latencies):9.2f}ms  p50={statistics.median(latencies):9.2f}ms  '
+          f'p99={p99:9.2f}ms')
+
+
+def run(operator_root, requests):
+    os.environ['DOCS_OPERATOR_ROOT'] = operator_root
+    os.environ['DOCS_CATALOG_PATH'] = ''
+    os.chdir(REPO_ROOT)
+    sys.path.insert(0, REPO_ROOT)
+    sys.modules.pop('docs_server', None)
+    import docs_server
+
+    client = docs_server.app.test_client()
+    op_count = sum(len(ops) for categories in docs_server.catalog.get().values()
+                   for ops in categories.values())
+    print(f'== {operator_root} ({op_count} operators)')
+
+    # 冷启动：每个请求都清空缓存，等价于原先每次请求全量解析
+    cold = []
+    for _ in range(requests):
+        docs_server.catalog = docs_server.create_catalog(catalog_path=None)
+        cold.extend(measure(client, 1))
+    report('cold (parse per request)', cold)
+
+    docs_server.catalog = docs_server.create_catalog(catalog_path=None)
+    docs_server.catalog.refresh()
+    report('warm (cached catalog)', measure(client, requests))
+    print(f'{"page size":<28} {len(client.get("/").data) / 1024:.1f}KB')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ops', type=int, default=5000, help='合成算子树的算子数量')
+    parser.add_argument('--requests', type=int, default=20)
+    args = parser.parse_args()
+
+    run(SOURCE_ROOT, args.requests)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_synthetic_tree(tmp_dir, args.ops)
+        run(tmp_dir, args.requests)
+
+
+if __name__ == '__main__':
+    main()
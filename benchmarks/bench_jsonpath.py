@@ -0,0 +1,124 @@
+"""
+对比 jsonpath.jsonpath 逐行逐表达式解析与 op_utils.jsonpath_utils 编译缓存/批量提取的耗时，
+样本为 TextVideoMatchOp 的 video_match_res 和 VideoShotClipOp 的 clip_result 结构
+
+用法:
+    python benchmarks/bench_jsonpath.py [--rows 2000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import jsonpath
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, '算子列表', 'op_utils'))
+
+from jsonpath_utils import compile_path, compile_paths  # noqa: E402
+
+VIDEO_MATCH_RES_PATHS = [
+    '$.result_code',
+    '$.clips_info[0].tts_start_time',
+    '$.clips_info[0].tts_end_time',
+    '$.clips_info[0].video_clips[0].resource_id',
+    '$.clips_info[0].video_clips[0].video_idx',
+    '$.clips_info[1].video_clips_duration',
+]
+CLIP_RESULT_PATHS = [
+    '$.isSuccess',
+    '$.version',
+    '$.clips[0].resource_id',
+    '$.clips[0].start_time',
+    '$.clips[0].end_time',
+]
+# 复杂表达式仍走 jsonpath 库，用于确认回退路径没有额外开销
+COMPLEX_PATHS = ['$..resource_id']
+
+
+def build_video_match_res(rng):
+    clips_info = []
+    tts_start_time = 0
+    for _ in range(rng.randint(3, 8)):
+        tts_end_time = tts_start_time + rng.randint(1000, 5000)
+        video_clips = [{
+            'resource_id': f'ad_smart_video_{rng.randint(0, 10 ** 8)}',
+            'video_idx': rng.randint(1, 20),
+            'video_start_time': 0,
+            'video_end_time': rng.randint(500, 3000),
+        } for _ in range(rng.randint(1, 4))]
+        clips_info.append({
+            'tts_start_time': tts_start_time,
+            'tts_end_time': tts_end_time,
+            'video_clips_duration': sum(clip['video_end_time'] for clip in video_clips),
+            'video_clips': video_clips,
+        })
+        tts_start_time = tts_end_time
+    return {'result_code': 0, 'clips_info': clips_info}
+
+
+def build_clip_result(rng):
+    clips = []
+    start_time = 0
+    for _ in range(rng.randint(5, 30)):
+        end_time = start_time + rng.randint(500, 4000)
+        clips.append({'start_time': start_time, 'end_time': end_time,
+                      'resource_id': f'db_table_{rng.randint(0, 10 ** 8)}.mp4'})
+        start_time = end_time
+    return {'isSuccess': True, 'version': 'transnetv2', 'clips': clips}
+
+
+def legacy(payloads, exprs):
+    results = []
+    for payload in payloads:
+        row = []
+        for expr in exprs:
+            values = jsonpath.jsonpath(payload, expr)
+            row.append(values[0] if values and len(values) > 0 else None)
+        results.append(row)
+    return results
+
+
+def compiled(payloads, exprs):
+    paths = [compile_path(expr) for expr in exprs]
+    return [[path.first(payload) for path in paths] for payload in payloads]
+
+
+def batched(payloads, exprs):
+    paths = compile_paths(tuple(exprs))
+    return [paths.first(payload) for payload in payloads]
+
+
+def best_of(func, payloads, exprs, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(payloads, exprs)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cases = [
+        ('video_match_res', [build_video_match_res(rng) for _ in range(args.rows)], VIDEO_MATCH_RES_PATHS),
+        ('clip_result', [build_clip_result(rng) for _ in range(args.rows)], CLIP_RESULT_PATHS),
+        ('video_match_res(..)', [build_video_match_res(rng) for _ in range(args.rows)], COMPLEX_PATHS),
+    ]
+    for name, payloads, exprs in cases:
+        legacy_time, expected = best_of(legacy, payloads, exprs, args.repeat)
+        print(f'{name:<20} {args.rows} rows x {len(exprs)} paths  jsonpath={legacy_time * 1000:9.2f}ms')
+        for label, func in (('compiled', compiled), ('batched', batched)):
+            elapsed, result = best_of(func, payloads, exprs, args.repeat)
+            assert result == expected, f'{label} result mismatch on {name}'
+            print(f'{"":<20} {label:<10} {elapsed * 1000:9.2f}ms  speedup={legacy_time / elapsed:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+对比 AST 解析(operator_parser.parse_operator_tree)与旧版正则解析在真实算子文件和超大算子文件上的耗时
+
+用法:
+    python benchmarks/bench_operator_parser.py [--repeat 20] [--scale 50]
+"""
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from operator_parser import parse_operator_source_regex, parse_operator_tree  # noqa: E402
+
+
+def parse_ast(content):
+    return parse_operator_tree(ast.parse(content), content)
+
+
+def timeit(func, sources, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for content in sources:
+            func(content)
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+# 将 Examples 段重复 scale 次，模拟带超长示例的算子文件
+def inflate(content, scale):
+    head, sep, tail = content.partition('Examples:')
+    if not sep:
+        return content
+    examples, quote, rest = tail.partition('"""')
+    return head + sep + examples * scale + quote + rest
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--scale', type=int, default=50, help='大文件中 Examples 段的放大倍数')
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(REPO_ROOT, '算子列表', '**', '*.py'), recursive=True))
+    sources = [open(f, encoding='utf-8').read() for f in files]
+    large_sources = [inflate(content, args.scale) for content in sources]
+
+    for label, corpus in (('real files', sources), (f'examples x{args.scale}', large_sources)):
+        size_kb = sum(len(content.encode('utf-8')) for content in corpus) / 1024
+        regex_ms = timeit(parse_operator_source_regex, corpus, args.repeat)
+        ast_ms = timeit(parse_ast, corpus, args.repeat)
+        print(f'{label:<16} {len(corpus)} files {size_kb:9.1f}KB  regex={regex_ms:8.2f}ms  ast={ast_ms:8.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+对比 ExtractColumnFromRedisOp 逐行 GET 与 op_utils.redis_utils.batch_get 分块 MGET/pipeline 的耗时，
+使用脚本内置的 RESP 协议桩服务(只支持 GET/MGET)，每次网络往返额外延迟 --rtt 毫秒模拟跨机房访问
+
+需要安装 redis 客户端:
+    python benchmarks/bench_redis_batch_get.py [--rows 500] [--rtt 1.0] [--chunk-size 100]
+"""
+import argparse
+import os
+import socketserver
+import sys
+import threading
+import time
+
+import redis
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, '算子列表', 'op_utils'))
+
+from redis_utils import TTLCache, batch_get  # noqa: E402
+
+
+class RespHandler(socketserver.BaseRequestHandler):
+    # 每次 recv 视为一次网络往返：先等待 rtt，再依次执行缓冲区中的全部命令
+    def handle(self):
+        buffer = b''
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                return
+            buffer += data
+            commands, buffer = parse_commands(buffer)
+            if not commands:
+                continue
+            time.sleep(self.server.rtt)
+            self.request.sendall(b''.join(self.server.execute(command) for command in commands))
+
+
+class RespServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, data, rtt):
+        super().__init__(('127.0.0.1', 0), RespHandler)
+        self.data = data
+        self.rtt = rtt
+        self.round_trips = 0
+
+    def execute(self, command):
+        name = command[0].upper()
+        if name == b'GET':
+            return encode_bulk(self.data.get(command[1]))
+        if name == b'MGET':
+            return b'*%d\r\n' % (len(command) - 1) + b''.join(encode_bulk(self.data.get(key)) for key in command[1:])
+        # 连接建立时客户端发送的 CLIENT SETINFO 等命令统一返回 OK
+        return b'+OK\r\n'
+
+
+def encode_bulk(value):
+    if value is None:
+        return b'$-1\r\n'
+    return b'$%d\r\n%s\r\n' % (len(value), value)
+
+
+# 解析缓冲区中完整的 RESP 数组命令，返回 (命令列表, 剩余未解析的字节)
+def parse_commands(buffer):
+    commands = []
+    while buffer.startswith(b'*'):
+        offset = buffer.find(b'\r\n')
+        if offset < 0:
+            break
+        count = int(buffer[1:offset])
+        position = offset + 2
+        command = []
+        for _ in range(count):
+            end = buffer.find(b'\r\n', position)
+            if end < 0:
+                return commands, buffer
+            length = int(buffer[position + 1:end])
+            if len(buffer) < end + 2 + length + 2:
+                return commands, buffer
+            command.append(buffer[end + 2:end + 2 + length])
+            position = end + 2 + length + 2
+        commands.append(command)
+        buffer = buffer[position:]
+    return commands, buffer
+
+
+# 迁移前的逐行实现，作为对照(不存在的 key 跳过 decode)
+def legacy_get(redis_client, keys):
+    values = []
+    for key in keys:
+        value = redis_client.get(key) if key else None
+        values.append(value.decode('utf-8') if value is not None else None)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500)
+    parser.add_argument('--rtt', type=float, default=1.0, help='每次往返的模拟延迟(毫秒)')
+    parser.add_argument('--chunk-size', type=int, default=100)
+    args = parser.parse_args()
+
+    # 10% 的 key 不存在，5% 的行 key 重复
+    data = {f'material_{i}'.encode(): f'{{"video_id": {i}}}'.encode() for i in range(args.rows) if i % 10}
+    keys = [f'material_{i % (args.rows - args.rows // 20)}' for i in range(args.rows)]
+
+    server = RespServer(data, args.rtt / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # 桩服务只实现 RESP2
+    client = redis.Redis(host='127.0.0.1', port=server.server_address[1], protocol=2)
+
+    cases = [
+        ('single GET per row', lambda: legacy_get(client, keys)),
+        ('batch mget', lambda: batch_get(client, keys, args.chunk_size, 'mget')),
+        ('batch pipeline', lambda: batch_get(client, keys, args.chunk_size, 'pipeline')),
+    ]
+    cache = TTLCache()
+    batch_get(client, keys, args.chunk_size, 'mget', cache=cache, cache_ttl=60)
+    cases.append(('batch mget, warm cache', lambda: batch_get(client, keys, args.chunk_size, 'mget',
+                                                             cache=cache, cache_ttl=60)))
+
+    expected = None
+    print(f'{args.rows} rows, rtt={args.rtt}ms, chunk_size={args.chunk_size}')
+    for name, func in cases:
+        start = time.perf_counter()
+        values = func()
+        elapsed = time.perf_counter() - start
+        expected = expected or values
+        assert values == expected, f'{name} result mismatch'
+        print(f'{name:<24} {elapsed * 1000:9.2f}ms')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
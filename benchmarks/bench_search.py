@@ -0,0 +1,53 @@
+"""
+测试 OperatorSearchIndex 在合成算子树上的建索引耗时与单次检索延迟
+
+用法:
+    python benchmarks/bench_search.py [--ops 5000] [--repeat 200]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from bench_index_latency import build_synthetic_tree  # noqa: E402
+from operator_catalog import OperatorCatalog  # noqa: E402
+from operator_parser import parse_operator_file  # noqa: E402
+from operator_search import OperatorSearchIndex  # noqa: E402
+
+QUERIES = ['JoinTableOp', '合并表格', '下载文件', 'bgm', 'video_blob_key', '字幕 拆分', 'ocr 检测']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--ops', type=int, default=5000, help='合成算子树的算子数量')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        build_synthetic_tree(tmp_dir, args.ops)
+        catalog = OperatorCatalog([os.path.join(tmp_dir, 'base_op'), os.path.join(tmp_dir, 'extend_op')],
+                                  parse_operator_file, refresh_interval=float('inf'))
+        catalog.refresh()
+        index = OperatorSearchIndex(catalog)
+        start = time.perf_counter()
+        index.sync()
+        print(f'index build: {len(catalog.entries())} operators in {(time.perf_counter() - start) * 1000:.1f}ms')
+
+        for query in QUERIES:
+            latencies = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                index.search(query)
+                latencies.append((time.perf_counter() - start) * 1000)
+            latencies.sort()
+            print(f'{query:<16} p50={statistics.median(latencies):6.3f}ms  '
+                  f'p99={latencies[int(len(latencies) * 0.99) - 1]:6.3f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+对比 FileDownloaderOp 整批下载完成后再逐行探测视频信息，与 op_utils.blob_utils.start_streaming 流式下载时
+VideoBaseInfoOp 逐行 wait_for_file(ready=mp4_header_ready) 在 moov 写入后立即探测的耗时：
+分别统计第一行和最后一行可以开始探测的时间；视频为合成的 mp4 结构(ftyp + moov + mdat)，
+--layout faststart 时 moov 在文件开头，moov-at-end 时 moov 在文件末尾，只能等待下载完成
+复用 bench_file_download.py 中的桩服务和客户端(边接收边写文件)
+
+只依赖标准库:
+    python benchmarks/bench_streaming_download.py [--files 8] [--size-mb 8] [--bandwidth 20] [--concurrency 4]
+"""
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, '算子列表', 'op_utils'))
+
+from bench_file_download import LocalBlobClient, ObjectServer  # noqa: E402
+from blob_utils import TransferTask, mp4_header_ready, run_transfers, start_streaming, wait_for_file  # noqa: E402
+
+
+def box(box_type, payload):
+    return struct.pack('>I4s', len(payload) + 8, box_type) + payload
+
+
+def build_mp4(size, layout, moov_kb=64):
+    ftyp = box(b'ftyp', b'isom\x00\x00\x02\x00isomiso2mp41')
+    moov = box(b'moov', os.urandom(moov_kb * 1024))
+    mdat = box(b'mdat', os.urandom(size - len(ftyp) - len(moov) - 8))
+    return ftyp + moov + mdat if layout == 'faststart' else ftyp + mdat + moov
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--files', type=int, default=8)
+    parser.add_argument('--size-mb', type=float, default=8.0)
+    parser.add_argument('--latency', type=float, default=80.0, help='首字节延迟(毫秒)')
+    parser.add_argument('--bandwidth', type=float, default=20.0, help='单连接带宽(MB/s)')
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    bucket = 'ad-nieuwland-material'
+    size = int(args.size_mb * 1024 * 1024)
+    print(f'{args.files} videos x {args.size_mb}MB, latency={args.latency}ms, '
+          f'bandwidth={args.bandwidth}MB/s per connection, concurrency={args.concurrency}')
+    for layout in ('faststart', 'moov-at-end'):
+        objects = {f'{bucket}/{layout}_{i}.mp4': build_mp4(size, layout) for i in range(args.files)}
+        server = ObjectServer(objects, args.latency / 1000.0, args.bandwidth * 1024 * 1024)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        with tempfile.TemporaryDirectory() as directory:
+            results = {}
+            for mode in ('batch', 'stream'):
+                client = LocalBlobClient(server.server_address[1], bucket)
+                tasks = [TransferTask(f'{layout}_{i}.mp4', client, f'{layout}_{i}.mp4',
+                                      os.path.join(directory, f'{mode}-{layout}_{i}.mp4')) for i in range(args.files)]
+                start = time.perf_counter()
+                download = lambda task: task.client.download_file_with_retry(task.key, task.file_path)  # noqa: E731
+                if mode == 'batch':
+                    run_transfers(tasks, download, args.concurrency)
+                else:
+                    start_streaming(tasks, download, args.concurrency)
+                # 与 VideoBaseInfoOp 一致，逐行等待各自的文件后探测
+                probed = []
+                for task in tasks:
+                    # 流式下载时返回写入中的 .part 路径，moov 已完整写入
+                    assert wait_for_file(task.file_path, ready=mp4_header_ready) is not None
+                    probed.append(time.perf_counter() - start)
+                results[mode] = probed
+                # 等待后台下载结束再清理目录
+                for task in tasks:
+                    assert wait_for_file(task.file_path) is not None
+
+            batch, stream = results['batch'], results['stream']
+            print(f'  {layout:<12} first row probe {batch[0] * 1000:7.0f}ms -> {stream[0] * 1000:7.0f}ms   '
+                  f'last row probe {batch[-1] * 1000:7.0f}ms -> {stream[-1] * 1000:7.0f}ms  '
+                  f'speedup={batch[-1] / stream[-1]:.1f}x')
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
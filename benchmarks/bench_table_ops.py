@@ -0,0 +1,90 @@
+"""
+对比表格算子迁移到 op_utils.table_utils 按列执行后与原先 iterrows 逐行写回的耗时
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_table_ops.py [--sizes 10 1000 100000]
+"""
+import argparse
+import json
+import random
+import time
+
+from video_graph.data_table import DataTable
+from video_graph.op_context import OpContext
+from video_graph.ops.base_op.table_process_op.flat_double_list_op import FlatDoubleListOp
+from video_graph.ops.base_op.table_process_op.insert_column_by_random_list_op import InsertColumnByRandomListOp
+from video_graph.ops.base_op.table_process_op.insert_column_by_template_op import InsertColumnByTemplateOp
+from video_graph.ops.base_op.text_process_op.join_text_list_op import JoinTextListOp
+from video_graph.ops.base_op.text_process_op.json_dump_op import JsonDumpOp
+from video_graph.ops.base_op.text_process_op.json_load_op import JsonLoadOp
+from video_graph.ops.base_op.text_process_op.split_text_op import SplitTextOp
+
+
+def build_table(rows):
+    return DataTable(name="BenchTable", data={
+        'year': [2000 + i % 30 for i in range(rows)],
+        'month': [i % 12 + 1 for i in range(rows)],
+        'day': [i % 28 + 1 for i in range(rows)],
+        'text': ['第一句。第二句。第三句' for _ in range(rows)],
+        'text_list': [['第一句', '第二句', '第三句'] for _ in range(rows)],
+        'double_list': [[[1, 2], [3, 4], [5]] for _ in range(rows)],
+        'payload': [{'id': i, 'tags': ['a', 'b']} for i in range(rows)],
+        'payload_str': [json.dumps({'id': i, 'tags': ['a', 'b']}) for i in range(rows)],
+        'candidates': [['bgm_1', 'bgm_2', 'bgm_3'] for _ in range(rows)],
+    })
+
+
+# 迁移前的逐行实现，作为对照
+def legacy_loop(table, target_column, func, *source_columns):
+    table[target_column] = None
+    for index, row in table.iterrows():
+        table.at[index, target_column] = func(*[row.get(column) for column in source_columns])
+
+
+CASES = [
+    ('InsertColumnByTemplateOp', InsertColumnByTemplateOp, {
+        "template": "{}年{}月{}日", "new_column_name": "date",
+        "column_name_1": "year", "column_name_2": "month", "column_name_3": "day",
+    }, lambda t: legacy_loop(t, 'date', "{}年{}月{}日".format, 'year', 'month', 'day')),
+    ('JsonDumpOp', JsonDumpOp, {"source_column": "payload", "target_column": "dumped"},
+     lambda t: legacy_loop(t, 'dumped', json.dumps, 'payload')),
+    ('JsonLoadOp', JsonLoadOp, {"source_column": "payload_str", "target_column": "loaded"},
+     lambda t: legacy_loop(t, 'loaded', json.loads, 'payload_str')),
+    ('SplitTextOp', SplitTextOp, {"text_column": "text", "text_list_column": "split"},
+     lambda t: legacy_loop(t, 'split', lambda text: text.split("。"), 'text')),
+    ('JoinTextListOp', JoinTextListOp, {"text_list_column": "text_list", "joined_text_column": "joined"},
+     lambda t: legacy_loop(t, 'joined', "".join, 'text_list')),
+    ('FlatDoubleListOp', FlatDoubleListOp, {"source_column": "double_list", "target_column": "flat"},
+     lambda t: legacy_loop(t, 'flat', lambda first: [item for second in first for item in second], 'double_list')),
+    ('InsertColumnByRandomListOp', InsertColumnByRandomListOp, {"column_name": "bgm", "random_list": "candidates"},
+     lambda t: legacy_loop(t, 'bgm', random.choice, 'candidates')),
+]
+
+
+def run_op(op_class, attrs, table):
+    op_context = OpContext(graph_name="bench_graph", request_tag="bench_tag", request_id="bench")
+    op_context.input_tables.append(table)
+    op = op_class(name=op_class.__name__, attrs=attrs)
+    start = time.perf_counter()
+    assert op.process(op_context)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 1000, 100000])
+    args = parser.parse_args()
+
+    for rows in args.sizes:
+        for name, op_class, attrs, legacy in CASES:
+            table = build_table(rows)
+            start = time.perf_counter()
+            legacy(table)
+            legacy_time = time.perf_counter() - start
+            op_time = run_op(op_class, attrs, build_table(rows))
+            print(f'{rows:>7} rows  {name:<28} iterrows={legacy_time * 1000:10.2f}ms  '
+                  f'columnar={op_time * 1000:10.2f}ms  speedup={legacy_time / op_time:7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
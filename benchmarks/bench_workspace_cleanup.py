@@ -0,0 +1,64 @@
+"""
+对比请求结束时 TempFileRemoveOp 同步 rmtree 临时文件与 op_utils.workspace_utils 交给后台线程删除时，
+请求关键路径上的清理耗时；每个请求的临时目录中有 --files 个 --size-kb 大小的文件(下载素材、TTS、静音音频等)
+
+需要在安装了 video-graph 的环境中运行:
+    python benchmarks/bench_workspace_cleanup.py [--requests 20] [--files 200] [--size-kb 256]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.workspace_utils import get_workspace, release_workspace
+
+
+def fill_workspace(op_context, files, size_kb):
+    workspace = get_workspace(op_context)
+    payload = os.urandom(size_kb * 1024)
+    for i in range(files):
+        with open(workspace.path(f'{op_context.request_id}-segment-{i}.mp4'), 'wb') as file:
+            file.write(payload)
+    return workspace.directory
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--files', type=int, default=200)
+    parser.add_argument('--size-kb', type=int, default=256)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sync_cost = background_cost = 0.0
+        for i in range(args.requests):
+            op_context = OpContext('bench_graph', 'bench_tag', f'sync-{i}')
+            op_context.process_id = directory
+            workspace_directory = fill_workspace(op_context, args.files, args.size_kb)
+            start = time.perf_counter()
+            shutil.rmtree(workspace_directory)
+            sync_cost += time.perf_counter() - start
+
+            op_context = OpContext('bench_graph', 'bench_tag', f'background-{i}')
+            op_context.process_id = directory
+            fill_workspace(op_context, args.files, args.size_kb)
+            start = time.perf_counter()
+            release_workspace(op_context)
+            background_cost += time.perf_counter() - start
+
+        # 等待后台删除完成，确认没有遗留文件
+        deadline = time.monotonic() + 30
+        while os.listdir(directory) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not os.listdir(directory)
+
+    print(f'{args.requests} requests x {args.files} files x {args.size_kb}KB, cleanup cost on the request path:')
+    print(f'  sync rmtree         {sync_cost / args.requests * 1000:8.2f}ms per request')
+    print(f'  background reaper   {background_cost / args.requests * 1000:8.2f}ms per request  '
+          f'speedup={sync_cost / background_cost:.0f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,91 +1,305 @@
-import textwrap
-from doctest import debug
-
 import markdown2
-from flask import Flask, render_template, send_from_directory, jsonify
+from flask import Flask, render_template, send_from_directory, jsonify, request, abort, url_for
+import argparse
+import base64
+import bisect
+import json
 import os
-import ast
-import re
+import shutil
+import time
+
+from http_cache import CachedAsset, FileAssetCache, make_cached_response
+from operator_catalog import OperatorCatalog
+from operator_checker import check_catalog
+from operator_parser import parse_operator_file
+from operator_search import OperatorSearchIndex
+from operator_watcher import CatalogWatcher
 
 app = Flask(__name__)
 
+# 算子根目录，可通过环境变量指向其他算子仓库
+OPERATOR_ROOT = os.environ.get('DOCS_OPERATOR_ROOT', './算子列表')
+BASE_OP_DIR = os.path.join(OPERATOR_ROOT, 'base_op')
+EXTEND_OP_DIR = os.path.join(OPERATOR_ROOT, 'extend_op')
+# 预构建的算子目录文件，启动时若存在则直接加载
+CATALOG_PATH = os.environ.get('DOCS_CATALOG_PATH', './operator_catalog.json')
+# 两次校验算子文件 mtime/size 的最小间隔(秒)
+CATALOG_REFRESH_INTERVAL = float(os.environ.get('DOCS_CATALOG_REFRESH_INTERVAL', '5'))
+# 解析算子文件的进程数，1 为串行，0 为使用全部 CPU
+CATALOG_WORKERS = int(os.environ.get('DOCS_CATALOG_WORKERS', '1'))
+# 算子目录监听方式：auto(优先 inotify)/inotify/poll/off
+CATALOG_WATCH = os.environ.get('DOCS_CATALOG_WATCH', 'auto')
+# 算子列表接口每页默认/最大返回的算子数
+OPERATOR_PAGE_SIZE = 50
+OPERATOR_PAGE_SIZE_MAX = 500
+# 搜索接口默认/最大返回的结果数
+SEARCH_LIMIT = 20
+SEARCH_LIMIT_MAX = 200
+# 图片文件名固定不带版本号，缓存一周并通过 ETag 校验
+IMAGE_CACHE_CONTROL = 'public, max-age=604800'
+
+
 # 读取指定路径下所有算子的信息
 def get_operator_info():
-    base_operators_info = {}
-    extend_operators_info = {}
-
-    # 获取所有子文件夹（每个子文件夹代表一个功能类别）
-    base_dirs = ['./算子列表/base_op', './算子列表/extend_op']
-    for base_dir in base_dirs:
-        operators_info = base_operators_info if base_dir.endswith('base_op') else extend_operators_info
-        for category in os.listdir(base_dir):
-            category_path = os.path.join(base_dir, category)
-            if os.path.isdir(category_path):
-                operators_info[category] = []
-                for file_name in os.listdir(category_path):
-                    if file_name.endswith('.py'):
-                        op_info = parse_operator_file(os.path.join(category_path, file_name))
-                        operators_info[category].append(op_info)
-    return base_operators_info, extend_operators_info
-
-# 解析算子的 Python 文件
-def parse_operator_file(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content = file.read()
-
-    # 提取类名（算子的名称）
-    class_name = re.search(r'class (\w+)\(', content)
-    class_name = class_name.group(1) if class_name else "UnknownClass"
-
-    # 提取 docstring
-    docstring = re.search(r'\"\"\"(.*?)\"\"\"', content, re.DOTALL)
-    docstring = docstring.group(1) if docstring else ""
-
-    # 提取 Function 部分
-    function_description = ""
-    function_match = re.search(r'Function:\s*(.*?)\n', docstring)
-    if function_match:
-        function_description = function_match.group(1).strip()
-
-    # 提取 Attributes 部分
-    attributes = {}
-    attr_pattern = re.compile(r'^\s*(\w+)\s*\((.*?)\):\s*(.*)', re.M)
-    for match in attr_pattern.findall(docstring):
-        attr_name, attr_type, attr_desc = match
-        attributes[attr_name] = {'type': attr_type, 'desc': attr_desc.strip()}
-
-    # 提取 Hrefs 部分
-    hrefs = re.search(r'Href:\s*(\S+)', docstring)
-    href = hrefs.group(1) if hrefs else ""  # 如果没有找到 Hrefs，则为空字符串
-
-    # 提取 Examples 部分
-    examples = re.search(r'Examples:\s*(.*?)(?=\n\s*\"\"\"|\Z)', docstring, re.DOTALL)
-    example_code = examples.group(1).strip() if examples else ""
-
-    # 返回算子信息
-    return {
-        'name': class_name,
-        'function': function_description,
-        'attributes': attributes,
-        'examples': example_code,
-        'href': href
-    }
+    snapshot = catalog.get()
+    return snapshot[BASE_OP_DIR], snapshot[EXTEND_OP_DIR]
+
+
+# 将算子目录展开为按 (kind, category, name) 排序的列表和 name 索引，目录未变化时直接复用
+_operator_listing_cache = (None, None)
+
+
+def get_operator_listing():
+    global _operator_listing_cache
+    snapshot = catalog.get()
+    cached_snapshot, listing = _operator_listing_cache
+    if cached_snapshot is snapshot:
+        return listing
+
+    rows = []
+    for kind, operators_info in zip(('base', 'extend'), get_operator_info()):
+        for category, operators in operators_info.items():
+            for op_info in operators:
+                rows.append(((kind, category, op_info['name']), op_info))
+    rows.sort(key=lambda row: row[0])
+    keys = [key for key, _ in rows]
+    items = [{'kind': kind, 'category': category, 'name': name, 'function': op_info['function']}
+             for (kind, category, name), op_info in rows]
+    by_name = {item['name']: (item, op_info) for item, (_, op_info) in zip(items, rows)}
+    listing = (keys, items, by_name)
+    _operator_listing_cache = (snapshot, listing)
+    return listing
+
+
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key, ensure_ascii=False).encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    return tuple(json.loads(base64.urlsafe_b64decode(cursor.encode('ascii'))))
+
+# 首页按算子目录快照缓存渲染结果和压缩后的字节，目录未变化时不再渲染模板
+_index_page_cache = (None, None)
+
+
+# 页面中指向静态资源和 about 页的链接；静态导出时改为相对页面所在目录的路径，root 为到站点根目录的相对路径
+def site_links(root=None):
+    if root is None:
+        return {'static_url': lambda filename: url_for('static', filename=filename), 'about_url': '/about'}
+    return {'static_url': lambda filename: f'{root}static/{filename}', 'about_url': f'{root}about/index.html'}
+
+
+@app.context_processor
+def inject_site_links():
+    return site_links()
+
 
 @app.route('/')
 def index():
-    base_operators_info, extend_operators_info = get_operator_info()
-    return render_template('index.html', base_operators_info=base_operators_info, extend_operators_info=extend_operators_info)
+    global _index_page_cache
+    snapshot = catalog.get()
+    cached_snapshot, asset = _index_page_cache
+    if cached_snapshot is not snapshot:
+        base_operators_info, extend_operators_info = get_operator_info()
+        html = render_template('index.html', base_operators_info=base_operators_info, extend_operators_info=extend_operators_info,
+                               static_export=False)
+        asset = CachedAsset(html.encode('utf-8'), 'text/html; charset=utf-8', time.time())
+        _index_page_cache = (snapshot, asset)
+    return make_cached_response(asset)
+
+# 算子签名(op_register 注册的输入/输出/属性)，供外部工具在不引入 video_graph 的情况下读取
+def get_operator_signature(op_info):
+    return {
+        'name': op_info['name'],
+        'inputs': op_info['inputs'],
+        'outputs': op_info['outputs'],
+        'attrs': op_info['registered_attrs'],
+        'parallel': op_info['parallel'],
+    }
+
+
+@app.route('/api/signatures')
+def signatures():
+    result = []
+    for operators_info in get_operator_info():
+        for operators in operators_info.values():
+            result.extend(get_operator_signature(op_info) for op_info in operators)
+    return jsonify(result)
+
+
+@app.route('/api/signatures/<name>')
+def signature(name):
+    _, _, by_name = get_operator_listing()
+    if name not in by_name:
+        return jsonify({'error': f'operator {name} not found'}), 404
+    return jsonify(get_operator_signature(by_name[name][1]))
+
+
+# 轻量的算子列表(类别/名称/功能)，按游标分页，cursor 为上一页返回的 next_cursor
+@app.route('/api/operators')
+def operators():
+    keys, items, _ = get_operator_listing()
+    limit = min(max(request.args.get('limit', OPERATOR_PAGE_SIZE, type=int), 1), OPERATOR_PAGE_SIZE_MAX)
+    cursor = request.args.get('cursor')
+    start = 0
+    if cursor:
+        try:
+            start = bisect.bisect_right(keys, decode_cursor(cursor))
+        except (ValueError, TypeError):
+            return jsonify({'error': 'invalid cursor'}), 400
+
+    page = items[start:start + limit]
+    next_cursor = encode_cursor(keys[start + limit - 1]) if start + limit < len(items) else None
+    return jsonify({'operators': page, 'next_cursor': next_cursor, 'total': len(items)})
+
+
+# 单个算子的详情(属性、示例、注册信息)，供页面按需加载
+@app.route('/api/operators/<name>')
+def operator_detail(name):
+    detail = get_operator_detail(name)
+    if detail is None:
+        return jsonify({'error': f'operator {name} not found'}), 404
+    return jsonify(detail)
+
+
+def get_operator_detail(name):
+    _, _, by_name = get_operator_listing()
+    if name not in by_name:
+        return None
+    item, op_info = by_name[name]
+    detail = dict(item)
+    detail.update({
+        'href': op_info['href'],
+        'attributes': op_info['attributes'],
+        'input_tables': op_info['input_tables'],
+        'output_tables': op_info['output_tables'],
+        'examples': op_info['examples'],
+    })
+    detail.update(get_operator_signature(op_info))
+    return detail
+
+
+# 算子属性一致性报告：compute 中读取的属性与 op_register 注册、docstring 说明的属性对比
+@app.route('/api/consistency')
+def consistency():
+    return jsonify(check_catalog(catalog))
+
+
+# 全文检索算子名、功能描述、属性及注册的列名
+@app.route('/api/search')
+def search():
+    query = request.args.get('q', '')
+    limit = min(max(request.args.get('limit', SEARCH_LIMIT, type=int), 1), SEARCH_LIMIT_MAX)
+    return jsonify({'query': query, 'results': search_index.search(query, limit=limit)})
+
+# 健康检查只读取内存中的算子目录，不访问文件系统
+@app.route('/healthz')
+def healthz():
+    snapshot = catalog.peek()
+    if snapshot is None:
+        return jsonify({'status': 'starting'}), 503
+    operator_count = sum(len(operators) for operators_info in snapshot.values() for operators in operators_info.values())
+    return jsonify({'status': 'ok', 'operators': operator_count})
+
 @app.route('/about')
 def about():
-    with open('static/markdown/introduction.md', 'r') as file:
-        markdown_content = file.read()
-    return markdown_content
+    asset = markdown_assets.get('introduction.md')
+    if asset is None:
+        abort(404)
+    return make_cached_response(asset)
 
 @app.route('/image/<filename>', methods=['GET'])
 def image(filename):
-  return send_from_directory('image', filename)
+    asset = image_assets.get(filename)
+    if asset is None:
+        abort(404)
+    return make_cached_response(asset, cache_control=IMAGE_CACHE_CONTROL)
 
-if __name__ == '__main__':
+# 创建算子目录缓存，优先加载预构建的 JSON
+def create_catalog(catalog_path=CATALOG_PATH, workers=CATALOG_WORKERS):
+    operator_catalog = OperatorCatalog([BASE_OP_DIR, EXTEND_OP_DIR], parse_operator_file,
+                                       refresh_interval=CATALOG_REFRESH_INTERVAL, workers=workers)
+    if catalog_path:
+        operator_catalog.load(catalog_path)
+    return operator_catalog
+
+
+catalog = create_catalog()
+search_index = OperatorSearchIndex(catalog)
+# markdown 与图片在启动时读入内存并预压缩，沿用原先 /about 返回 text/html 的内容类型
+markdown_assets = FileAssetCache('static/markdown', mimetype='text/html').preload()
+image_assets = FileAssetCache('image').preload()
+
+
+# 导出静态站点：首页、每个算子的详情页和 JSON、about 页以及检索索引，任意静态文件服务器即可托管
+def export_site(output_dir):
+    catalog.refresh()
+    os.makedirs(os.path.join(output_dir, 'operators'), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, 'about'), exist_ok=True)
+
+    with app.test_request_context('/'):
+        base_operators_info, extend_operators_info = get_operator_info()
+        write_text(os.path.join(output_dir, 'index.html'),
+                   render_template('index.html', base_operators_info=base_operators_info,
+                                   extend_operators_info=extend_operators_info, static_export=True,
+                                   **site_links('')))
+
+        _, items, _ = get_operator_listing()
+        for item in items:
+            detail = get_operator_detail(item['name'])
+            operator_path = os.path.join(output_dir, 'operators', item['name'])
+            write_text(operator_path + '.html', render_template('operator.html', operator=detail, **site_links('../')))
+            write_text(operator_path + '.json', json.dumps(detail, ensure_ascii=False))
+
+        with open('static/markdown/introduction.md', 'r', encoding='utf-8') as file:
+            content = markdown2.markdown(file.read(), extras=['fenced-code-blocks', 'highlightjs-lang', 'tables'])
+        write_text(os.path.join(output_dir, 'about', 'index.html'),
+                   render_template('about.html', content=content, **site_links('../')))
+
+    write_text(os.path.join(output_dir, 'search_index.json'), json.dumps(search_index.export(), ensure_ascii=False))
+    for directory in ('static', 'image'):
+        shutil.copytree(directory, os.path.join(output_dir, directory), dirs_exist_ok=True)
+    return len(items)
+
+
+def write_text(path, text):
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='video-graph 算子文档服务')
+    parser.add_argument('--workers', type=int, default=CATALOG_WORKERS, help='解析算子文件的进程数，0 为使用全部 CPU')
+    parser.add_argument('--watch', choices=['auto', 'inotify', 'poll', 'off'], default=CATALOG_WATCH,
+                        help='监听算子目录变化并增量更新')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('serve', help='启动文档服务(默认)')
+    build_parser = subparsers.add_parser('build-catalog', help='预构建算子目录 JSON')
+    build_parser.add_argument('output', nargs='?', default=CATALOG_PATH, help='输出文件路径')
+    export_parser = subparsers.add_parser('export', help='导出静态文档站点')
+    export_parser.add_argument('output_dir', help='输出目录')
+    args = parser.parse_args()
+    catalog.workers = args.workers or os.cpu_count() or 1
+
+    if args.command == 'build-catalog':
+        parsed = catalog.refresh()
+        catalog.save(args.output)
+        print(f'parsed {parsed} operator files, catalog saved to {args.output}')
+        return
+    if args.command == 'export':
+        exported = export_site(args.output_dir)
+        print(f'exported {exported} operators to {args.output_dir}')
+        return
+
+    # 启动前先完成一次全量校验，保证第一个请求不需要解析文件
+    catalog.refresh()
+    search_index.sync()
+    if args.watch != 'off':
+        CatalogWatcher(catalog, mode=args.watch, poll_interval=CATALOG_REFRESH_INTERVAL).start()
     #port = int(os.environ.get('PORT', 5000))  # 获取端口号，如果没有设置，使用 5000
     #app.run(debug=False, host='0.0.0.0', port=port)
-    app.run(debug=False)
\ No newline at end of file
+    app.run(debug=False)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
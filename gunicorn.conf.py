@@ -0,0 +1,18 @@
+import multiprocessing
+import os
+
+# 文档服务的 gunicorn 配置：python docs_server.py 仅用于本地调试，线上使用
+#   gunicorn -c gunicorn.conf.py wsgi:app
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('DOCS_WEB_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('DOCS_WEB_THREADS', '4'))
+worker_class = 'gthread'
+# 在 master 进程中导入 wsgi 并构建算子目录，worker 通过 fork 共享
+preload_app = True
+timeout = 30
+accesslog = '-'
+
+
+def post_fork(server, worker):
+    from wsgi import start_watcher
+    start_watcher()
@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+
+import brotli
+from flask import Response, request
+
+# 只对文本类内容做压缩，图片等本身已压缩的格式直接返回原始字节
+COMPRESSIBLE_MIMETYPES = ('text/', 'application/json', 'application/javascript', 'image/svg+xml')
+# 小于该字节数的内容压缩收益不明显
+MIN_COMPRESS_SIZE = 512
+
+
+class CachedAsset:
+    """
+    常驻内存的响应内容，启动或内容变化时计算一次 ETag 并预压缩
+
+    Attributes:
+        body (bytes): 原始内容
+        mimetype (str): 内容类型
+        last_modified (float): 最后修改时间(时间戳)
+        etag (str): 基于内容哈希的 ETag(不含引号和编码后缀)
+        encodings (dict): 预压缩的内容, {'br': bytes, 'gzip': bytes}
+    """
+
+    def __init__(self, body, mimetype, last_modified):
+        self.body = body
+        self.mimetype = mimetype
+        self.last_modified = int(last_modified)
+        self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        self.encodings = {}
+        if len(body) >= MIN_COMPRESS_SIZE and mimetype.startswith(COMPRESSIBLE_MIMETYPES):
+            self.encodings['br'] = brotli.compress(body, quality=11)
+            self.encodings['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+
+
+class FileAssetCache:
+    """
+    文件内容缓存，按 mtime/size 判断文件是否变化，变化时重新读取并预压缩
+
+    Attributes:
+        directory (str): 文件所在目录, 只允许访问该目录下的文件
+        mimetype (str, optional): 固定的内容类型, 默认按文件后缀推断
+    """
+
+    def __init__(self, directory, mimetype=None):
+        self.directory = directory
+        self.mimetype = mimetype
+        # file_name -> (mtime_ns, size, CachedAsset)
+        self._assets = {}
+        self._lock = threading.Lock()
+
+    # 预加载目录下的全部文件
+    def preload(self):
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                self.get(file_name)
+        return self
+
+    # 获取文件对应的 CachedAsset，文件不存在或不在目录内时返回 None
+    def get(self, file_name):
+        if os.path.basename(file_name) != file_name or file_name.startswith('.'):
+            return None
+        file_path = os.path.join(self.directory, file_name)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        cached = self._assets.get(file_name)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        with open(file_path, 'rb') as file:
+            body = file.read()
+        mimetype = self.mimetype or mimetypes.guess_type(file_name)[0] or 'application/octet-stream'
+        if mimetype.startswith('text/') and 'charset' not in mimetype:
+            mimetype += '; charset=utf-8'
+        asset = CachedAsset(body, mimetype, stat.st_mtime)
+        with self._lock:
+            self._assets[file_name] = (stat.st_mtime_ns, stat.st_size, asset)
+        return asset
+
+
+# 按 Accept-Encoding 选择预压缩的编码，优先 br，其次 gzip，q=0 表示客户端拒绝该编码
+def choose_encoding(asset, accept_encoding):
+    accepted = {}
+    for part in accept_encoding.split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    for coding in ('br', 'gzip'):
+        if coding in asset.encodings and accepted.get(coding, accepted.get('*', 0.0)) > 0:
+            return coding
+    return None
+
+
+# 判断客户端缓存是否仍然有效：优先比较 If-None-Match，没有时再比较 If-Modified-Since
+def is_not_modified(asset):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        for tag in if_none_match.split(','):
+            tag = tag.strip()
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            # 不同编码的 ETag 带有 -br/-gzip 后缀，内容相同即视为未修改
+            if tag.strip('"').split('-', 1)[0] == asset.etag:
+                return True
+        return False
+    if_modified_since = request.headers.get('If-Modified-Since')
+    if if_modified_since:
+        try:
+            return asset.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+# 生成带 ETag/Last-Modified/Cache-Control 的响应，支持条件请求(304)和内容协商压缩
+def make_cached_response(asset, cache_control='no-cache'):
+    encoding = choose_encoding(asset, request.headers.get('Accept-Encoding', ''))
+    etag = f'"{asset.etag}-{encoding}"' if encoding else f'"{asset.etag}"'
+    headers = {
+        'ETag': etag,
+        'Last-Modified': formatdate(asset.last_modified, usegmt=True),
+        'Cache-Control': cache_control,
+    }
+    if asset.encodings:
+        headers['Vary'] = 'Accept-Encoding'
+
+    if is_not_modified(asset):
+        return Response(status=304, headers=headers)
+    body = asset.body
+    if encoding:
+        body = asset.encodings[encoding]
+        headers['Content-Encoding'] = encoding
+    return Response(body, content_type=asset.mimetype, headers=headers)
@@ -0,0 +1,196 @@
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CATALOG_VERSION = 3
+
+
+class OperatorCatalog:
+    """
+    算子目录缓存：启动时解析一次全部算子文件并常驻内存，之后只按文件 mtime/size 重新解析变化的文件
+
+    Attributes:
+        base_dirs (list): 需要扫描的算子根目录, 如 ./算子列表/base_op
+        parser (callable): 单个算子文件的解析函数, 入参为文件路径, 返回算子信息 dict
+        refresh_interval (float): 两次 stat 校验之间的最小间隔(秒), 0 表示每次读取都校验
+        workers (int): 解析文件的进程数, 1 表示在当前进程串行解析, 0 表示使用全部 CPU
+    """
+
+    # 待解析文件少于该数量时不启动进程池
+    PARALLEL_MIN_FILES = 64
+
+    def __init__(self, base_dirs, parser, refresh_interval=5.0, workers=1):
+        self.base_dirs = list(base_dirs)
+        self.parser = parser
+        self.refresh_interval = refresh_interval
+        self.workers = workers or os.cpu_count() or 1
+        # file_path -> {'root', 'category', 'mtime_ns', 'size', 'info'}
+        self._entries = {}
+        # root -> [category, ...]，保留没有算子文件的空类别
+        self._categories = {}
+        self._snapshot = None
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    # 遍历算子目录，返回 (root, category, file_path, stat) 列表
+    def _scan(self):
+        categories = {}
+        files = []
+        for base_dir in self.base_dirs:
+            categories[base_dir] = []
+            if not os.path.isdir(base_dir):
+                continue
+            with os.scandir(base_dir) as category_entries:
+                category_entries = sorted((entry for entry in category_entries if entry.is_dir()),
+                                          key=lambda entry: entry.name)
+            for category_entry in category_entries:
+                categories[base_dir].append(category_entry.name)
+                with os.scandir(category_entry.path) as file_entries:
+                    file_entries = sorted((entry for entry in file_entries
+                                           if entry.name.endswith('.py') and entry.is_file()),
+                                          key=lambda entry: entry.name)
+                for file_entry in file_entries:
+                    files.append((base_dir, category_entry.name, file_entry.path, file_entry.stat()))
+        return categories, files
+
+    # 解析一批文件，文件数较多且 workers > 1 时分块提交到进程池
+    def _parse_files(self, file_paths):
+        if self.workers <= 1 or len(file_paths) < self.PARALLEL_MIN_FILES:
+            return [self.parser(file_path) for file_path in file_paths]
+        # 每个进程分到多个块，平衡各文件解析耗时不均的情况
+        chunk_size = math.ceil(len(file_paths) / (self.workers * 4))
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, len(file_paths), chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk_result in executor.map(_parse_chunk, [self.parser] * len(chunks), chunks):
+                results.extend(chunk_result)
+        return results
+
+    # 重新校验所有文件，只解析新增或 mtime/size 变化的文件，返回重新解析的文件数
+    def refresh(self):
+        with self._lock:
+            categories, files = self._scan()
+            entries = {}
+            changed = []
+            for root, category, file_path, stat in files:
+                entry = self._entries.get(file_path)
+                if entry is None or entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                    entry = {
+                        'root': root,
+                        'category': category,
+                        'mtime_ns': stat.st_mtime_ns,
+                        'size': stat.st_size,
+                    }
+                    changed.append(file_path)
+                entries[file_path] = entry
+
+            for file_path, info in zip(changed, self._parse_files(changed)):
+                entries[file_path]['info'] = info
+            parsed = len(changed)
+
+            if (self._snapshot is None or parsed or entries.keys() != self._entries.keys()
+                    or categories != self._categories):
+                self._entries = entries
+                self._categories = categories
+                self._snapshot = self._build_snapshot()
+            self._last_refresh = time.monotonic()
+            return parsed
+
+    # 只重新解析指定的算子文件：文件存在则解析，已删除则移除；
+    # 路径不在已知类别目录下(如新增类别)时退回全量 refresh，返回重新解析的文件数
+    def update_files(self, file_paths):
+        file_paths = [file_path for file_path in file_paths if file_path.endswith('.py')]
+        with self._lock:
+            locations = {file_path: self._locate(file_path) for file_path in file_paths}
+            if self._snapshot is not None and None not in locations.values():
+                entries = dict(self._entries)
+                changed = []
+                for file_path, (root, category) in locations.items():
+                    try:
+                        stat = os.stat(file_path)
+                    except FileNotFoundError:
+                        entries.pop(file_path, None)
+                        continue
+                    entries[file_path] = {
+                        'root': root,
+                        'category': category,
+                        'mtime_ns': stat.st_mtime_ns,
+                        'size': stat.st_size,
+                    }
+                    changed.append(file_path)
+                for file_path, info in zip(changed, self._parse_files(changed)):
+                    entries[file_path]['info'] = info
+                # 新的 entries 和 snapshot 构建完成后再整体替换，读者不会看到构建到一半的目录
+                self._entries = entries
+                self._snapshot = self._build_snapshot()
+                return len(changed)
+        return self.refresh()
+
+    # 根据文件路径找到所属的 (root, category)，不属于已知类别时返回 None
+    def _locate(self, file_path):
+        category_path, _ = os.path.split(file_path)
+        root, category = os.path.split(category_path)
+        if category in self._categories.get(root, ()):
+            return root, category
+        return None
+
+    # 按 root/category 组装成模板使用的结构，返回 {root: {category: [op_info, ...]}}
+    def _build_snapshot(self):
+        snapshot = {root: {category: [] for category in categories}
+                    for root, categories in self._categories.items()}
+        for file_path in sorted(self._entries):
+            entry = self._entries[file_path]
+            snapshot[entry['root']][entry['category']].append(entry['info'])
+        return snapshot
+
+    # 获取当前算子目录，超过 refresh_interval 时先做一次增量校验
+    def get(self):
+        if self._snapshot is None or time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh()
+        return self._snapshot
+
+    # 返回内存中的当前快照，不做任何文件校验，尚未构建时返回 None
+    def peek(self):
+        return self._snapshot
+
+    # 获取所有算子文件的解析结果 {file_path: entry}，返回的 dict 只会被整体替换，不会原地修改
+    def entries(self):
+        self.get()
+        return self._entries
+
+    # 将解析结果持久化为 JSON，供服务启动时直接加载
+    def save(self, path):
+        with self._lock:
+            data = {
+                'version': CATALOG_VERSION,
+                'base_dirs': self.base_dirs,
+                'categories': self._categories,
+                'entries': self._entries,
+            }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    # 加载预构建的 JSON，版本或目录不一致时忽略；加载后仍需 refresh 校验文件是否变化
+    def load(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if data.get('version') != CATALOG_VERSION or data.get('base_dirs') != self.base_dirs:
+            return False
+        with self._lock:
+            self._entries = data['entries']
+            self._categories = data['categories']
+            self._snapshot = None
+        return True
+
+
+# 进程池中执行的解析任务，需定义在模块顶层以便 pickle
+def _parse_chunk(parser, file_paths):
+    return [parser(file_path) for file_path in file_paths]
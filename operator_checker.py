@@ -0,0 +1,77 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from operator_catalog import OperatorCatalog
+from operator_parser import parse_operator_file
+
+# 问题类型说明
+ISSUE_KINDS = {
+    'read_not_registered': '代码中读取但未在 op_register 中注册的属性',
+    'registered_not_read': '已注册但代码中从未读取的属性',
+    'read_not_documented': '代码中读取但 docstring Attributes 中未说明的属性',
+    'documented_not_read': 'docstring Attributes 中说明但代码中从未读取的属性',
+}
+
+
+# 对比单个算子读取的属性、注册的属性和 docstring 中的属性，返回 {issue_kind: [attr, ...]}
+def check_operator(op_info, kinds=tuple(ISSUE_KINDS)):
+    read = set(op_info['read_attrs'])
+    registered = {str(attr.get('name')) for attr in op_info['registered_attrs']}
+    documented = set(op_info['attributes'])
+    issues = {
+        'read_not_registered': read - registered,
+        'registered_not_read': registered - read,
+        'read_not_documented': read - documented,
+        'documented_not_read': documented - read,
+    }
+    return {kind: sorted(attrs) for kind, attrs in issues.items() if attrs and kind in kinds}
+
+
+# 对算子目录中的全部算子做一致性检查，返回可序列化为 JSON 的报告
+def check_catalog(catalog, kinds=tuple(ISSUE_KINDS)):
+    operators = []
+    summary = dict.fromkeys(kinds, 0)
+    for file_path, entry in sorted(catalog.entries().items()):
+        issues = check_operator(entry['info'], kinds)
+        for kind in issues:
+            summary[kind] += 1
+        if issues:
+            operators.append({
+                'name': entry['info']['name'],
+                'category': entry['category'],
+                'file': file_path,
+                'issues': issues,
+            })
+    return {'checked': len(catalog.entries()), 'summary': summary, 'operators': operators}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='检查算子 op_register 注册的属性与 compute 中读取的属性是否一致')
+    parser.add_argument('root', nargs='?', default='./算子列表', help='算子根目录')
+    parser.add_argument('--output', help='JSON 报告输出路径，默认输出到标准输出')
+    parser.add_argument('--kinds', nargs='+', choices=list(ISSUE_KINDS), default=list(ISSUE_KINDS),
+                        help='只统计指定类型的问题')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = OperatorCatalog([os.path.join(args.root, 'base_op'), os.path.join(args.root, 'extend_op')],
+                              parse_operator_file)
+    catalog.refresh()
+    report = check_catalog(catalog, args.kinds)
+    report['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 1)
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            file.write(text)
+    else:
+        print(text)
+    # 存在读取但未注册的属性时返回非 0，便于接入 CI
+    sys.exit(1 if any('read_not_registered' in op['issues'] for op in report['operators']) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+import ast
+import re
+
+# docstring 中识别的段落标题
+DOC_SECTIONS = ('Function', 'Attributes', 'Args', 'InputTables', 'OutputTables', 'Href', 'Examples')
+SECTION_PATTERN = re.compile(r'^\s*(%s):\s*(.*)$' % '|'.join(DOC_SECTIONS))
+ATTR_PATTERN = re.compile(r'^\s*(\w+)\s*\((.*?)\):\s*(.*)')
+# op_register 链式调用中收集的方法
+REGISTER_METHODS = {'add_input': 'inputs', 'add_output': 'outputs', 'add_attr': 'registered_attrs'}
+REGISTER_FIELDS = ('name', 'type', 'desc')
+
+
+# 解析算子的 Python 文件，语法错误时退回到正则解析
+def parse_operator_file(file_path):
+    with open(file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    try:
+        tree = ast.parse(content, filename=file_path)
+    except SyntaxError:
+        return parse_operator_source_regex(content)
+    return parse_operator_tree(tree, content)
+
+
+# 基于 AST 一次解析出类名、docstring 各段落以及 op_register 注册的输入/输出/属性
+def parse_operator_tree(tree, content):
+    classes = {}
+    registration = None
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = node
+        elif isinstance(node, ast.Expr) and registration is None:
+            registration = parse_register_chain(node.value)
+
+    class_node = None
+    if registration and registration['class_name'] in classes:
+        class_node = classes[registration['class_name']]
+    elif classes:
+        class_node = next(iter(classes.values()))
+
+    op_info = parse_docstring(get_raw_docstring(class_node, content) if class_node else "")
+    op_info['name'] = class_node.name if class_node else "UnknownClass"
+    registration = registration or {}
+    op_info['inputs'] = registration.get('inputs', [])
+    op_info['outputs'] = registration.get('outputs', [])
+    op_info['registered_attrs'] = registration.get('registered_attrs', [])
+    op_info['parallel'] = registration.get('parallel', False)
+    op_info['read_attrs'] = collect_attr_reads(class_node) if class_node else []
+    return op_info
+
+
+# 收集类中以字面量读取的属性名：self.attrs.get('x')、self.attrs['x']、'x' in self.attrs
+def collect_attr_reads(class_node):
+    keys = set()
+    for node in ast.walk(class_node):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            if node.func.attr in ('get', 'pop', 'setdefault') and _is_self_attrs(node.func.value) and node.args:
+                key = node.args[0]
+            else:
+                continue
+        elif isinstance(node, ast.Subscript) and _is_self_attrs(node.value):
+            key = node.slice
+        elif (isinstance(node, ast.Compare) and isinstance(node.ops[0], (ast.In, ast.NotIn))
+              and _is_self_attrs(node.comparators[0])):
+            key = node.left
+        else:
+            continue
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            keys.add(key.value)
+    return sorted(keys)
+
+
+def _is_self_attrs(node):
+    return (isinstance(node, ast.Attribute) and node.attr == 'attrs'
+            and isinstance(node.value, ast.Name) and node.value.id == 'self')
+
+
+# 取 docstring 在源码中的原文，Examples 中的转义字符(如 \n)需要按源码原样展示
+def get_raw_docstring(class_node, content):
+    if not class_node.body or not isinstance(class_node.body[0], ast.Expr):
+        return ""
+    node = class_node.body[0].value
+    if not isinstance(node, ast.Constant) or not isinstance(node.value, str):
+        return ""
+    # col_offset 为 UTF-8 字节偏移，只对首尾两行做编码转换，避免 ast.get_source_segment 整体切分源码
+    start = _line_offset(content, node.lineno)
+    end = _line_offset(content, node.end_lineno, start)
+    first_line = content[start:content.find('\n', start)].encode('utf-8')
+    last_line = content[end:content.find('\n', end)].encode('utf-8')
+    segment_start = start + len(first_line[:node.col_offset].decode('utf-8'))
+    segment_end = end + len(last_line[:node.end_col_offset].decode('utf-8'))
+    segment = content[segment_start:segment_end].lstrip('rRuUbBfF')
+    quote = segment[:3] if segment[:3] in ('"""', "'''") else segment[:1]
+    return segment[len(quote):len(segment) - len(quote)]
+
+
+# 返回第 lineno 行(从 1 开始)在 content 中的字符偏移，可从已知的行首偏移继续查找
+def _line_offset(content, lineno, start=0):
+    offset = start
+    for _ in range(lineno - 1 - content.count('\n', 0, start)):
+        offset = content.index('\n', offset) + 1
+    return offset
+
+
+# 将 docstring 按段落标题切分并解析，Examples 之后的内容全部视为示例代码
+def parse_docstring(docstring):
+    sections = {}
+    current = None
+    lines = docstring.split('\n')
+    for index, line in enumerate(lines):
+        match = SECTION_PATTERN.match(line)
+        if match:
+            current = match.group(1)
+            if current == 'Examples':
+                sections[current] = '\n'.join([match.group(2)] + lines[index + 1:])
+                break
+            sections.setdefault(current, [])
+            if match.group(2):
+                sections[current].append(match.group(2))
+        elif current is not None:
+            sections[current].append(line)
+
+    function_lines = [line.strip() for line in sections.get('Function', []) if line.strip()]
+    attributes = {}
+    for section in ('Attributes', 'Args'):
+        for line in sections.get(section, []):
+            match = ATTR_PATTERN.match(line)
+            if match:
+                attr_name, attr_type, attr_desc = match.groups()
+                attributes[attr_name] = {'type': attr_type, 'desc': attr_desc.strip()}
+    href_tokens = ' '.join(sections.get('Href', [])).split()
+
+    return {
+        'function': function_lines[0] if function_lines else "",
+        'attributes': attributes,
+        'input_tables': '\n'.join(sections.get('InputTables', [])).strip(),
+        'output_tables': '\n'.join(sections.get('OutputTables', [])).strip(),
+        'examples': sections.get('Examples', "").strip(),
+        'href': href_tokens[0] if href_tokens else "",
+    }
+
+
+# 解析 op_register.register_op(Cls).add_input(...).add_attr(...).set_parallel(True) 调用链
+def parse_register_chain(node):
+    calls = []
+    while isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        calls.append(node)
+        node = node.func.value
+    if not calls or calls[-1].func.attr != 'register_op' or not calls[-1].args:
+        return None
+
+    root = calls[-1]
+    class_arg = root.args[0]
+    registration = {
+        'class_name': class_arg.id if isinstance(class_arg, ast.Name) else None,
+        'inputs': [],
+        'outputs': [],
+        'registered_attrs': [],
+        'parallel': False,
+    }
+    for call in reversed(calls[:-1]):
+        method = call.func.attr
+        if method in REGISTER_METHODS:
+            item = dict(zip(REGISTER_FIELDS, (_literal(arg) for arg in call.args)))
+            for keyword in call.keywords:
+                if keyword.arg:
+                    item[keyword.arg] = _literal(keyword.value)
+            registration[REGISTER_METHODS[method]].append(item)
+        elif method == 'set_parallel':
+            registration['parallel'] = bool(_literal(call.args[0])) if call.args else True
+    return registration
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return ast.unparse(node)
+
+
+# 旧版基于正则的解析，仅在文件存在语法错误时使用
+def parse_operator_source_regex(content):
+    # 提取类名（算子的名称）
+    class_name = re.search(r'class (\w+)\(', content)
+    class_name = class_name.group(1) if class_name else "UnknownClass"
+
+    # 提取 docstring
+    docstring = re.search(r'\"\"\"(.*?)\"\"\"', content, re.DOTALL)
+    docstring = docstring.group(1) if docstring else ""
+
+    # 提取 Function 部分
+    function_description = ""
+    function_match = re.search(r'Function:\s*(.*?)\n', docstring)
+    if function_match:
+        function_description = function_match.group(1).strip()
+
+    # 提取 Attributes 部分
+    attributes = {}
+    attr_pattern = re.compile(r'^\s*(\w+)\s*\((.*?)\):\s*(.*)', re.M)
+    for match in attr_pattern.findall(docstring):
+        attr_name, attr_type, attr_desc = match
+        attributes[attr_name] = {'type': attr_type, 'desc': attr_desc.strip()}
+
+    # 提取 Hrefs 部分
+    hrefs = re.search(r'Href:\s*(\S+)', docstring)
+    href = hrefs.group(1) if hrefs else ""  # 如果没有找到 Hrefs，则为空字符串
+
+    # 提取 Examples 部分
+    examples = re.search(r'Examples:\s*(.*?)(?=\n\s*\"\"\"|\Z)', docstring, re.DOTALL)
+    example_code = examples.group(1).strip() if examples else ""
+
+    # 返回算子信息
+    return {
+        'name': class_name,
+        'function': function_description,
+        'attributes': attributes,
+        'input_tables': "",
+        'output_tables': "",
+        'examples': example_code,
+        'href': href,
+        'inputs': [],
+        'outputs': [],
+        'registered_attrs': [],
+        'parallel': False,
+        'read_attrs': [],
+    }
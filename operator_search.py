@@ -0,0 +1,155 @@
+import heapq
+import math
+import re
+import threading
+
+# 算子名与查询完全一致时的额外加分，保证精确匹配排在最前
+EXACT_NAME_BONUS = 1000.0
+# 各字段命中的权重
+FIELD_WEIGHTS = {
+    'name': 5.0,
+    'function': 3.0,
+    'attribute_name': 2.0,
+    'column': 2.0,
+    'attribute_desc': 1.0,
+}
+ASCII_PATTERN = re.compile(r'[A-Za-z0-9]+')
+CJK_PATTERN = re.compile(r'[\u4e00-\u9fff]+')
+CAMEL_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+# 分词：英文按单词/下划线/驼峰切分，中文取相邻两字的 bigram
+def tokenize(text):
+    if not text:
+        return []
+    tokens = []
+    for word in ASCII_PATTERN.findall(text):
+        tokens.append(word.lower())
+        parts = CAMEL_PATTERN.findall(word)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    for word in CJK_PATTERN.findall(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+# 算子中参与检索的字段，返回 [(field, text), ...]
+def iter_operator_fields(op_info):
+    yield 'name', op_info['name']
+    yield 'function', op_info['function']
+    for attr_name, attr_info in op_info['attributes'].items():
+        yield 'attribute_name', attr_name
+        yield 'attribute_desc', attr_info['desc']
+    for key in ('inputs', 'outputs', 'registered_attrs'):
+        for item in op_info.get(key, []):
+            yield 'column', str(item.get('name', ''))
+            yield 'attribute_desc', str(item.get('desc', ''))
+
+
+class OperatorSearchIndex:
+    """
+    算子文档的内存倒排索引，按 OperatorCatalog 的变化增量更新
+
+    Attributes:
+        catalog (OperatorCatalog): 算子目录缓存, 检索前会同步其中新增/变化/删除的算子
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        # token -> {doc_id: 加权词频}
+        self._postings = {}
+        # doc_id(文件路径) -> (entry, 该文档包含的 token 集合)
+        self._docs = {}
+        # 小写算子名 -> {doc_id}
+        self._names = {}
+        self._synced_entries = None
+        self._lock = threading.Lock()
+
+    # 与 catalog 同步，只重建 info 发生变化的算子，返回更新的文档数
+    def sync(self):
+        entries = self.catalog.entries()
+        if entries is self._synced_entries:
+            return 0
+        with self._lock:
+            updated = 0
+            for doc_id in [doc_id for doc_id in self._docs if doc_id not in entries]:
+                self._remove(doc_id)
+                updated += 1
+            for doc_id, entry in entries.items():
+                indexed = self._docs.get(doc_id)
+                if indexed is not None and indexed[0]['info'] is entry['info']:
+                    continue
+                if indexed is not None:
+                    self._remove(doc_id)
+                self._add(doc_id, entry)
+                updated += 1
+            self._synced_entries = entries
+            return updated
+
+    def _add(self, doc_id, entry):
+        weights = {}
+        for field, text in iter_operator_fields(entry['info']):
+            for token in tokenize(text):
+                weights[token] = weights.get(token, 0.0) + FIELD_WEIGHTS[field]
+        for token, weight in weights.items():
+            self._postings.setdefault(token, {})[doc_id] = weight
+        self._docs[doc_id] = (entry, set(weights))
+        self._names.setdefault(entry['info']['name'].lower(), set()).add(doc_id)
+
+    def _remove(self, doc_id):
+        entry, tokens = self._docs.pop(doc_id)
+        self._names[entry['info']['name'].lower()].discard(doc_id)
+        for token in tokens:
+            postings = self._postings[token]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[token]
+
+    # 检索算子，按 tf-idf 打分排序，算子名完全匹配的排在最前
+    def search(self, query, limit=20):
+        self.sync()
+        query_tokens = set(tokenize(query))
+        if not query_tokens:
+            return []
+        with self._lock:
+            doc_count = len(self._docs)
+            scores = {}
+            for token in query_tokens:
+                postings = self._postings.get(token)
+                if not postings:
+                    continue
+                idf = math.log(1 + doc_count / len(postings))
+                for doc_id, weight in postings.items():
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf
+
+            for doc_id in self._names.get(query.strip().lower(), ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + EXACT_NAME_BONUS
+
+            results = []
+            for doc_id, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1]):
+                entry = self._docs[doc_id][0]
+                results.append({
+                    'name': entry['info']['name'],
+                    'category': entry['category'],
+                    'function': entry['info']['function'],
+                    'score': round(score, 4),
+                })
+            return results
+
+    # 导出为静态站点使用的 JSON：docs 为算子列表，postings 为 token -> [[doc 下标, 权重], ...]
+    def export(self):
+        self.sync()
+        with self._lock:
+            doc_ids = sorted(self._docs)
+            positions = {doc_id: position for position, doc_id in enumerate(doc_ids)}
+            docs = []
+            for doc_id in doc_ids:
+                entry = self._docs[doc_id][0]
+                docs.append({'name': entry['info']['name'], 'category': entry['category'],
+                             'function': entry['info']['function']})
+            postings = {token: [[positions[doc_id], round(weight, 2)] for doc_id, weight in doc_postings.items()]
+                        for token, doc_postings in self._postings.items()}
+        return {'docs': docs, 'postings': postings}
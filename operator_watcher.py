@@ -0,0 +1,151 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+
+# inotify 事件掩码，见 <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class CatalogWatcher:
+    """
+    监听算子目录变化并增量更新 OperatorCatalog，Linux 下使用 inotify，其他平台退回定时轮询
+
+    Attributes:
+        catalog (OperatorCatalog): 需要更新的算子目录缓存
+        mode (str): auto/inotify/poll, auto 表示 inotify 可用时使用 inotify, 否则轮询
+        poll_interval (float): 轮询模式下两次校验之间的间隔(秒)
+        debounce (float): inotify 模式下收到事件后继续合并事件的时间(秒)
+    """
+
+    def __init__(self, catalog, mode='auto', poll_interval=5.0, debounce=0.2):
+        self.catalog = catalog
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.mode = mode
+        if mode in ('auto', 'inotify'):
+            self._libc = _load_inotify()
+            if self._libc is None and mode == 'inotify':
+                raise RuntimeError('inotify is not available on this platform')
+            self.mode = 'inotify' if self._libc is not None else 'poll'
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        # 监听期间读取目录不再做 stat 校验，页面渲染只读取内存中的快照
+        self.catalog.refresh()
+        self.catalog.refresh_interval = float('inf')
+        target = self._run_inotify if self.mode == 'inotify' else self._run_poll
+        self._thread = threading.Thread(target=target, name='catalog-watcher', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run_poll(self):
+        while not self._stop.wait(self.poll_interval):
+            self.catalog.refresh()
+
+    def _run_inotify(self):
+        fd = self._libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if fd < 0:
+            self.mode = 'poll'
+            return self._run_poll()
+        watches = {}
+        try:
+            for base_dir in self.catalog.base_dirs:
+                self._add_watch(fd, watches, base_dir)
+                if os.path.isdir(base_dir):
+                    with os.scandir(base_dir) as entries:
+                        for entry in entries:
+                            if entry.is_dir():
+                                self._add_watch(fd, watches, entry.path)
+
+            while not self._stop.is_set():
+                readable, _, _ = select.select([fd], [], [], 1.0)
+                if not readable:
+                    continue
+                # 合并短时间内的连续事件(如编辑器先写临时文件再 rename)，一次性更新
+                changed, full_refresh = set(), False
+                deadline = time.monotonic() + self.debounce
+                while True:
+                    batch_changed, batch_full = self._read_events(fd, watches)
+                    changed |= batch_changed
+                    full_refresh = full_refresh or batch_full
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0 or not select.select([fd], [], [], timeout)[0]:
+                        break
+
+                if full_refresh:
+                    self.catalog.refresh()
+                elif changed:
+                    self.catalog.update_files(sorted(changed))
+        finally:
+            os.close(fd)
+
+    def _add_watch(self, fd, watches, path):
+        wd = self._libc.inotify_add_watch(fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            watches[wd] = path
+
+    # 读取并解析 inotify 事件，返回 (变化的文件路径集合, 是否需要全量刷新)
+    def _read_events(self, fd, watches):
+        changed, full_refresh = set(), False
+        try:
+            data = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, full_refresh
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_len].rstrip(b'\0'))
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                full_refresh = True
+                continue
+            directory = watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_DELETE_SELF:
+                watches.pop(wd, None)
+                full_refresh = True
+            elif mask & IN_ISDIR:
+                # 类别目录的增删改名需要重新扫描，新增的目录同时加入监听
+                path = os.path.join(directory, name)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self._add_watch(fd, watches, path)
+                full_refresh = True
+            elif name.endswith('.py'):
+                changed.add(os.path.join(directory, name))
+        return changed, full_refresh
+
+
+# 加载 libc 中的 inotify 接口，不支持的平台返回 None
+def _load_inotify():
+    library = ctypes.util.find_library('c')
+    if library is None:
+        return None
+    try:
+        libc = ctypes.CDLL(library, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):
+        return None
+    return libc
@@ -0,0 +1,20 @@
+import gc
+
+from docs_server import app, catalog, search_index, CATALOG_REFRESH_INTERVAL, CATALOG_WATCH
+from operator_watcher import CatalogWatcher
+
+# 生产环境入口(配合 gunicorn preload_app 使用)：在 master 进程中构建一次算子目录、检索索引和首页缓存，
+# fork 出的 worker 以写时复制的方式共享这些只读数据，请求期间不再扫描文件
+catalog.refresh()
+search_index.sync()
+catalog.refresh_interval = float('inf')
+with app.test_client() as client:
+    client.get('/')
+# 把启动阶段创建的对象移出 GC 跟踪，避免 worker 中的 GC 触碰这些页面导致写时复制失效
+gc.freeze()
+
+
+# 在每个 worker 中启动目录监听(线程无法跨 fork 继承)，由 gunicorn 的 post_fork 钩子调用
+def start_watcher():
+    if CATALOG_WATCH != 'off':
+        CatalogWatcher(catalog, mode=CATALOG_WATCH, poll_interval=CATALOG_REFRESH_INTERVAL).start()
@@ -5,6 +5,7 @@ from video_graph.common.utils.tools import audio_normalization
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.workspace_utils import get_workspace
 
 
 class AudioNormalizationOp(Op):
@@ -37,7 +38,7 @@ input_table = DataTable(
 )
 
 # 设置 OpContext
-#process_id是存放输出文件的文件夹
+#输出文件存放在请求临时目录 process_id/request_id 下
 process_id = "test_op"
 op_context = OpContext("graph_name", "request_tag", "request_id")
 op_context.process_id = process_id
@@ -63,7 +64,8 @@ else:
         shot_table: DataTable = op_context.input_tables[0]
         audio_file_column = self.attrs.get("audio_file_column", "audio_file_path")
         output_file_column = self.attrs.get("output_file_column", "normalized_audio_file")
-        file_directory = f"{op_context.process_id}"
+        # 写入请求临时目录 {process_id}/{request_id}，请求结束后由后台线程删除
+        file_directory = get_workspace(op_context).directory
 
         shot_table[output_file_column] = None
         for index, row in shot_table.iterrows():
@@ -4,6 +4,7 @@ from video_graph.common.utils.tools import generate_random_string
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.workspace_utils import get_workspace
 
 
 class MergeAudioOp(Op):
@@ -35,7 +36,7 @@ input_table = DataTable(
     }
 )
 # 设置 OpContext
-#process_id是用于设置存放输出文件的文件夹，request_id和thread_id用于组成文件名前缀，可对比输出表的文件路径查看
+#输出文件存放在请求临时目录 process_id/request_id 下，request_id和thread_id用于组成文件名前缀，可对比输出表的文件路径查看
 op_context = OpContext("graph_name", "request_tag", "request_id")
 op_context.process_id = "test_op"
 op_context.request_id = "merge"
@@ -65,7 +66,8 @@ else:
         audio_file_list_column = self.attrs.get("audio_file_list_column", "audio_file_list")
         target_audio_file_column = self.attrs.get("target_audio_file_column", "target_audio_file")
         target_audio_file_prefix = f"{op_context.request_id}-{op_context.thread_id}"
-        file_directory = f"{op_context.process_id}"
+        # 写入请求临时目录 {process_id}/{request_id}，请求结束后由后台线程删除
+        file_directory = get_workspace(op_context).directory
 
         shot_table[target_audio_file_column] = None
         for index, row in shot_table.iterrows():
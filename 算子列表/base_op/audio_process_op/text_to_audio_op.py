@@ -9,6 +9,7 @@ from video_graph.common.utils.logger import logger
 from video_graph.data_table import DataTable
 from video_graph.op import Op,op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.workspace_utils import get_workspace
 
 
 class TextToAudioOp(Op):
@@ -48,7 +49,7 @@ input_table = DataTable(
     }
 )
 # 设置 OpContext
-#process_id是用于设置存放输出文件的文件夹，request_id和thread_id用于组成文件名前缀，可对比输出表的文件路径查看
+#输出文件存放在请求临时目录 process_id/request_id 下，request_id和thread_id用于组成文件名前缀，可对比输出表的文件路径查看
 op_context = OpContext("graph_name", "request_tag", "request_id")
 op_context.process_id = "test_op"
 op_context.request_id = "test-to"
@@ -85,7 +86,8 @@ else:
         reading_track_column = self.attrs.get("reading_track_column", "reading_track")
         random_reading_track_list = self.attrs.get("random_reading_track_list", ["混剪女声", "和蔼男声120"])
         tts_filename_prefix = f"{op_context.request_id}-{op_context.thread_id}"
-        file_directory = f"{op_context.process_id}"
+        # 写入请求临时目录 {process_id}/{request_id}，请求结束后由后台线程删除
+        file_directory = get_workspace(op_context).directory
 
         kconf_params: dict = get_kconf_value("ad.algorithm.nieuwlandGeneration", "json")
         tts_cfg: dict = kconf_params["tts_cfg"]
@@ -1,3 +1,4 @@
+import hashlib
 import os
 
 from video_graph.common.utils.blobstore import BlobStoreClientManager
@@ -6,6 +7,13 @@ from video_graph.common.utils.tools import parse_bbs_resource_id
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_CACHE_MAX_BYTES, DEFAULT_CONCURRENCY, TransferTask, \
+    get_blob_cache, pending_column, run_transfers, start_streaming
+from video_graph.ops.op_utils.table_utils import assign_column, column_values
+from video_graph.ops.op_utils.workspace_utils import get_workspace
+
+# 本地文件名中完整 key 哈希的长度
+KEY_DIGEST_LENGTH = 12
 
 
 class FileDownloaderOp(Op):
@@ -16,6 +24,15 @@ class FileDownloaderOp(Op):
     Attributes:
         file_blob_key_column (str): 输入表格中存储文件 Blob Key 的列名。
         file_path_column (str): 输入表格中保存文件路径的列名。
+        concurrency (int, optional): 同时下载的文件数上限，默认为 8，设为 1 时逐个下载。
+        cache_dir (str, optional): 节点本地缓存目录，为空时不使用缓存。设置后同一 db-table-key 在节点上只下载一次，
+            命中时以只读文件的硬链接放到原路径(跨文件系统时直接返回缓存路径)，下游算子不能原地修改下载的文件。
+        cache_max_bytes (int, optional): 本地缓存的总大小上限(字节)，超过时按最近最少使用淘汰，默认为 10GB。
+        stream (bool, optional): 是否流式下载，默认为 False，不能与 cache_dir 同时使用(同时设置时按非流式下载)。
+            开启后算子不等待下载完成，立即把各行的目标路径写入 {file_path_column}_pending 列，file_path_column 列不写入，
+            下载在后台继续。VideoBaseInfoOp/VideoExtractCoverOp/VideoExtractAudioOp 会读取该列并逐行等待各自的文件，
+            faststart 的 mp4 在 moov 写入后即可探测信息；其他算子读取文件前需经过 FileWaitOp 等待下载完成并写入
+            file_path_column 列。下载失败或等待超时的行按文件不存在处理。
 
     InputTables:
         in_table: 输入表格。
@@ -60,24 +77,79 @@ else:
         file_blob_key_column = self.attrs.get("file_blob_key_column", "file_blob_key")
         file_path_column = self.attrs.get("file_path_column", "file_path")
         filename_prefix = f"{op_context.request_id}-{op_context.thread_id}"
-        file_directory = f"{op_context.process_id}"
-
-        in_table[file_path_column] = None
-        for index, row in in_table.iterrows():
-            file_blob_key = row.get(file_blob_key_column)
+        # 写入请求临时目录 {process_id}/{request_id}，请求结束后由后台线程删除
+        file_directory = get_workspace(op_context).directory
+        concurrency = self.attrs.get("concurrency", DEFAULT_CONCURRENCY)
+        cache_dir = self.attrs.get("cache_dir")
+        cache = get_blob_cache(cache_dir, self.attrs.get("cache_max_bytes", DEFAULT_CACHE_MAX_BYTES)) if cache_dir else None
+        stream = self.attrs.get("stream", False)
+        if stream and cache is not None:
+            # 缓存命中时可能改用缓存中的只读路径，流式下载输出路径时还无法确定，因此不同时使用
+            logger.error(f"{self.name}: stream can not be used with cache_dir, fall back to non-streaming download")
+            stream = False
+
+        # 按 (db, table, key) 去重，同一文件只下载一次；本地文件名带完整 key 的哈希，
+        # 不同目录下同名的 key(如 a/x.mp4 与 b/x.mp4)各自下载到不同的文件
+        tasks = {}
+        for position, file_blob_key in enumerate(column_values(in_table, file_blob_key_column)):
             if str(file_blob_key) == 'nan' or file_blob_key is None:
                 continue
             db, table, key = parse_bbs_resource_id(file_blob_key)
-            target_key = os.path.basename(key)
-            file_name = f"{filename_prefix}-{target_key}"
-            file_path = os.path.join(file_directory, file_name)
-            blob_client = BlobStoreClientManager().get_client(f"{db}-{table}")
-            status = blob_client.download_file_with_retry(key, file_path)
-            if status is False:
-                logger.error(f"file_blob_key:{file_blob_key} download failed")
-                continue
-
-            in_table.loc[index, file_path_column] = file_path
+            if (db, table, key) not in tasks:
+                key_digest = hashlib.sha256(f"{db}-{table}-{key}".encode("utf-8")).hexdigest()[:KEY_DIGEST_LENGTH]
+                file_name = f"{filename_prefix}-{key_digest}-{os.path.basename(key)}"
+                file_path = os.path.join(file_directory, file_name)
+                # 同一 db-table 由 BlobStoreClientManager 返回同一个客户端，各下载线程复用其连接
+                blob_client = BlobStoreClientManager().get_client(f"{db}-{table}")
+                tasks[(db, table, key)] = TransferTask(file_blob_key, blob_client, key, file_path, f"{db}-{table}-{key}")
+            tasks[(db, table, key)].rows.append(position)
+
+        file_paths = [None] * len(in_table)
+        finished = 0
+
+        # 每个文件下载结束后逐行上报进度和失败原因
+        def report(task):
+            nonlocal finished
+            finished += 1
+            if task.status:
+                for position in task.rows:
+                    file_paths[position] = task.file_path
+                source = "cache hit" if task.cache_hit else "downloaded"
+                logger.info(f"file_blob_key:{task.resource_id} {source} in {task.elapsed:.2f}s, "
+                            f"rows:{task.rows}, progress:{finished}/{len(tasks)}")
+            else:
+                error = f", error:{task.error!r}" if task.error is not None else ""
+                logger.error(f"file_blob_key:{task.resource_id} download failed, rows:{task.rows}, "
+                             f"progress:{finished}/{len(tasks)}{error}")
+
+        # 使用缓存时先下载到缓存目录，再链接到本请求的路径；缓存无法链接时 file_path 改为缓存中的只读路径
+        def download(task):
+            if cache is None:
+                return task.client.download_file_with_retry(task.key, task.file_path)
+            file_path, task.cache_hit, task.evicted = cache.fetch(
+                task.cache_key, lambda tmp_path: task.client.download_file_with_retry(task.key, tmp_path), task.file_path)
+            if file_path is None:
+                return False
+            task.file_path = file_path
+            return True
+
+        if stream:
+            # 先把目标路径写入 pending 列，下游算子通过 blob_utils.wait_for_file 等待各自的文件；
+            # report 在后台线程中只记录日志，等待耗时由下游算子在各自算子内上报
+            pending_paths = [None] * len(in_table)
+            for task in tasks.values():
+                for position in task.rows:
+                    pending_paths[position] = task.file_path
+            start_streaming(list(tasks.values()), download, concurrency, report)
+            assign_column(in_table, pending_column(file_path_column), pending_paths)
+        else:
+            run_transfers(list(tasks.values()), download, concurrency, report)
+            if cache is not None:
+                hits = sum(task.cache_hit for task in tasks.values())
+                op_context.perf_ctx("blob_cache", micros=hits, extra1="hit")
+                op_context.perf_ctx("blob_cache", micros=len(tasks) - hits, extra1="miss")
+                op_context.perf_ctx("blob_cache", micros=sum(task.evicted for task in tasks.values()), extra1="eviction")
+            assign_column(in_table, file_path_column, file_paths)
 
         op_context.output_tables.append(in_table)
         return True
@@ -88,4 +160,8 @@ op_register.register_op(FileDownloaderOp) \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
     .add_attr(name="file_blob_key_column", type="str", desc="blobstore地址列名") \
     .add_attr(name="file_path_column", type="str", desc="文件地址列名") \
+    .add_attr(name="concurrency", type="int", desc="最大并发下载数") \
+    .add_attr(name="cache_dir", type="str", desc="节点本地缓存目录，为空时不使用缓存") \
+    .add_attr(name="cache_max_bytes", type="int", desc="本地缓存总大小上限(字节)") \
+    .add_attr(name="stream", type="bool", desc="是否流式下载，不等待下载完成") \
     .set_parallel(True)
@@ -1,10 +1,14 @@
 import os
+import threading
 
 from video_graph.common.utils.blobstore import BlobStoreClientManager
+from video_graph.common.utils.logger import logger
 from video_graph.common.utils.tools import build_bbs_resource_id
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_CONCURRENCY, TransferTask, file_digest, run_transfers
+from video_graph.ops.op_utils.table_utils import assign_column, column_values
 
 
 class FileUploaderOp(Op):
@@ -18,6 +22,9 @@ class FileUploaderOp(Op):
         blob_db (str): Blob 存储的数据库名称，默认为 "ad"。
         blob_table (str): Blob 存储的表名称，默认为 "nieuwland-material"。
         blob_key_prefix (str): Blob Key 的前缀，默认为空字符串。
+        concurrency (int, optional): 同时上传的文件数上限，默认为 8，设为 1 时逐个上传。
+        dedup (bool, optional): 是否按文件内容去重，默认为 False。开启后 Blob Key 为 前缀+内容 sha256+原后缀，
+            内容相同的文件只上传一次，存储中已有同内容对象时直接复用，不再上传。
 
     InputTables:
         in_table: 输入表格。
@@ -72,17 +79,67 @@ else:
         blob_table = self.attrs.get("blob_table", "nieuwland-material")
         blob_key_prefix = self.attrs.get("blob_key_prefix", "")
 
-        in_table[file_blob_key_column] = None
-        for index, row in in_table.iterrows():
-            file_path = row.get(file_path_column)
+        concurrency = self.attrs.get("concurrency", DEFAULT_CONCURRENCY)
+        dedup = self.attrs.get("dedup", False)
+        blob_client = BlobStoreClientManager().get_client(f"{blob_db}-{blob_table}")
+
+        # 不去重时按 Blob Key 合并任务，同一 Key 只上传一次，Key 相同的文件以最后一行为准，与逐行覆盖上传的结果一致；
+        # 去重时 Blob Key 取决于文件内容，先按文件路径合并，在上传线程中计算 sha256 后确定 Key
+        tasks = {}
+        total_bytes = 0
+        for position, file_path in enumerate(column_values(in_table, file_path_column)):
             if file_path is None or not os.path.exists(file_path):
                 continue
-
             blob_key = f"{blob_key_prefix}{os.path.basename(file_path)}"
-            blob_client = BlobStoreClientManager().get_client(f"{blob_db}-{blob_table}")
-            blob_client.upload_file_with_retry(file_path, blob_key)
-
-            in_table.loc[index, file_blob_key_column] = build_bbs_resource_id((blob_db, blob_table, blob_key))
+            task_key = file_path if dedup else blob_key
+            if task_key not in tasks:
+                tasks[task_key] = TransferTask(file_path, blob_client, blob_key, file_path)
+            tasks[task_key].file_path = tasks[task_key].resource_id = file_path
+            tasks[task_key].rows.append(position)
+            total_bytes += os.path.getsize(file_path)
+
+        # 去重时同一 Key 的任务串行执行，先完成的上传后其余任务直接复用
+        key_locks = {}
+        uploaded_keys = set()
+        key_locks_lock = threading.Lock()
+
+        # 去重时先检查本次或存储中是否已有同内容的对象，已有时直接复用
+        def upload(task):
+            if not dedup:
+                return task.client.upload_file_with_retry(task.file_path, task.key)
+            file_name = f"{file_digest(task.file_path)}{os.path.splitext(task.file_path)[1]}"
+            task.key = f"{blob_key_prefix}{file_name}"
+            with key_locks_lock:
+                key_lock = key_locks.setdefault(task.key, threading.Lock())
+            with key_lock:
+                if task.key in uploaded_keys or task.client.object_exists(task.key):
+                    task.cache_hit = True
+                    return True
+                if task.client.upload_file_with_retry(task.file_path, task.key) is False:
+                    return False
+                uploaded_keys.add(task.key)
+                return True
+
+        def report(task):
+            if task.status is False:
+                error = f", error:{task.error!r}" if task.error is not None else ""
+                logger.error(f"file_path:{task.file_path} upload to {task.key} failed, rows:{task.rows}{error}")
+
+        run_transfers(list(tasks.values()), upload, concurrency, report)
+        # 与逐行上传一致，上传抛出异常时算子失败
+        for task in tasks.values():
+            if task.error is not None:
+                raise task.error
+
+        blob_keys = [None] * len(in_table)
+        for task in tasks.values():
+            for position in task.rows:
+                blob_keys[position] = build_bbs_resource_id((blob_db, blob_table, task.key))
+        assign_column(in_table, file_blob_key_column, blob_keys)
+
+        uploaded_bytes = sum(os.path.getsize(task.file_path) for task in tasks.values() if not task.cache_hit)
+        op_context.perf_ctx("blob_upload_bytes", micros=uploaded_bytes, extra1="uploaded")
+        op_context.perf_ctx("blob_upload_bytes", micros=total_bytes - uploaded_bytes, extra1="saved")
 
         op_context.output_tables.append(in_table)
         return True
@@ -96,4 +153,6 @@ op_register.register_op(FileUploaderOp) \
     .add_attr(name="blob_db", type="str", desc="blob db") \
     .add_attr(name="blob_table", type="str", desc="blob table") \
     .add_attr(name="blob_key_prefix", type="str", desc="blob key前缀") \
+    .add_attr(name="concurrency", type="int", desc="最大并发上传数") \
+    .add_attr(name="dedup", type="bool", desc="是否按文件内容去重") \
     .set_parallel(True)
@@ -0,0 +1,86 @@
+from video_graph.common.utils.logger import logger
+from video_graph.data_table import DataTable
+from video_graph.op import Op, op_register
+from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_WAIT_TIMEOUT, pending_column, wait_for_file
+from video_graph.ops.op_utils.table_utils import assign_column, column_values
+
+
+class FileWaitOp(Op):
+    """
+    Function:
+        文件等待算子，等待 FileDownloaderOp 流式下载(stream=True)的文件全部下载完成，
+        把 {file_path_column}_pending 列中的路径写入 file_path_column 列，供未适配流式下载的算子使用
+
+    Attributes:
+        file_path_columns (str or List[str]): 文件路径列名或列名列表，默认为 "file_path"。
+        wait_timeout (float, optional): 等待单个文件的超时(秒)，默认为 600。
+
+    InputTables:
+        in_table: FileDownloaderOp 流式下载输出的表格。
+
+    OutputTables:
+        in_table: 文件下载完成后写入了文件路径的输入表格，下载失败或超时的行路径为 None。
+
+    Href:
+        https://git.corp.kuaishou.com/ad-aigc-algo-engine/video-graph/-/blob/master/video_graph/ops/base_op/file_io_op/file_wait_op.py?ref_type=heads
+
+    Examples:
+from video_graph.ops.base_op.file_io_op.file_downloader_op import *
+from video_graph.ops.base_op.file_io_op.file_wait_op import *
+
+# 创建输入表数据
+input_table = DataTable(
+    name="TestTable",
+    data={
+    "file_blob_key": ["ad_nieuwland-material_"]
+})
+op_context = OpContext("graph_name","request_tag","request_id")
+op_context.input_tables.append(input_table)
+
+# 流式下载，算子返回时文件可能仍在下载，路径写在 file_path_pending 列
+FileDownloaderOp(name="FileDownloaderOp", attrs={"stream": True}).process(op_context)
+
+# 等待下载完成，路径写入 file_path 列
+wait_context = OpContext("graph_name","request_tag","request_id")
+wait_context.input_tables.append(op_context.output_tables[0])
+success = FileWaitOp(name="FileWaitOp", attrs={"file_path_columns": "file_path"}).process(wait_context)
+
+# 检查结果
+if success:
+    output_table = wait_context.output_tables[0]
+    display(output_table)
+else:
+    print("算子计算失败")
+    """
+
+    def compute(self, op_context: OpContext) -> bool:
+        in_table: DataTable = op_context.input_tables[0]
+        file_path_columns = self.attrs.get("file_path_columns", "file_path")
+        wait_timeout = self.attrs.get("wait_timeout", DEFAULT_WAIT_TIMEOUT)
+        if isinstance(file_path_columns, str):
+            file_path_columns = [file_path_columns]
+
+        for file_path_column in file_path_columns:
+            pending = pending_column(file_path_column)
+            if pending not in in_table.columns:
+                continue
+            file_paths = []
+            for file_path in column_values(in_table, pending):
+                readable_file = wait_for_file(file_path, timeout=wait_timeout, op_context=op_context)
+                if readable_file is None and isinstance(file_path, str) and file_path:
+                    logger.error(f"{file_path} download failed or timed out after {wait_timeout}s")
+                file_paths.append(readable_file)
+            assign_column(in_table, file_path_column, file_paths)
+            del in_table[pending]
+
+        op_context.output_tables.append(in_table)
+        return True
+
+
+op_register.register_op(FileWaitOp) \
+    .add_input(name="any_table", type="DataTable", desc="placeholder") \
+    .add_output(name="any_table", type="DataTable", desc="placeholder") \
+    .add_attr(name="file_path_columns", type="list/str", desc="文件地址列名") \
+    .add_attr(name="wait_timeout", type="float", desc="等待单个文件的超时(秒)") \
+    .set_parallel(True)
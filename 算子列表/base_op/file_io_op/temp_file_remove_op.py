@@ -4,6 +4,7 @@ import shutil
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.workspace_utils import release_workspace, remove_in_background
 
 
 class TempFileRemoveOp(Op):
@@ -13,6 +14,9 @@ class TempFileRemoveOp(Op):
 
     Attributes:
         file_path_columns (str or List[str]): 指定要删除的文件路径列名或列名列表。
+        background (bool, optional): 是否交给后台线程删除，默认为 False；开启后算子不等待删除完成。
+        release_workspace (bool, optional): 是否同时释放当前请求的临时目录(见 op_utils.workspace_utils)，
+            由后台线程整体删除，默认为 False。
 
     InputTables:
         in_table: 输入表格。
@@ -62,6 +66,7 @@ print("TempFileRemoveOp test passed successfully!")
     def compute(self, op_context: OpContext) -> bool:
         in_table: DataTable = op_context.input_tables[0]
         file_path_columns = self.attrs.get("file_path_columns", "file_path")
+        background = self.attrs.get("background", False)
         if isinstance(file_path_columns, str):
             file_path_columns = [file_path_columns]
 
@@ -70,11 +75,16 @@ print("TempFileRemoveOp test passed successfully!")
                 file_path = row.get(file_path_column)
                 if not file_path:
                     continue
-                if os.path.isfile(file_path):
+                if background:
+                    remove_in_background(file_path)
+                elif os.path.isfile(file_path):
                     os.remove(file_path)
                 elif os.path.isdir(file_path):
                     shutil.rmtree(file_path)
 
+        if self.attrs.get("release_workspace", False):
+            release_workspace(op_context)
+
         op_context.output_tables.append(in_table)
         return True
 
@@ -82,4 +92,6 @@ print("TempFileRemoveOp test passed successfully!")
 op_register.register_op(TempFileRemoveOp) \
     .add_input(name="any_table", type="DataTable", desc="placeholder") \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
-    .add_attr(name="file_path_columns", type="list/str", desc="文件地址列名")
+    .add_attr(name="file_path_columns", type="list/str", desc="文件地址列名") \
+    .add_attr(name="background", type="bool", desc="是否后台删除") \
+    .add_attr(name="release_workspace", type="bool", desc="是否释放请求临时目录")
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op,op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.expr_utils import any_row
 
 
 class IfOp(Op):
@@ -61,9 +62,9 @@ else:
         target_table: DataTable = op_context.input_tables[table_index]
         condition = self.attrs.get("condition")
 
-        row_num = target_table.query(condition).shape[0]
+        # 按块计算条件，找到满足条件的行即停止，不生成过滤后的表格
         # 表达式结果为空时，If算子失败
-        if row_num == 0:
+        if not any_row(target_table, condition):
             op_context.output_tables.extend(op_context.input_tables)
             return False
 
@@ -1,12 +1,13 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import append_rows
 
 
 class AddTableRow(Op):
     """
     Function:
-        在表里增加行，增加的行的列默认值为0/None
+        在表里增加行，增加的行的列默认值为0/None，所有新行一次性追加并保持原列类型
 
     Attributes:
         row_num (int): 增加的行数
@@ -58,15 +59,7 @@ else:
         in_table: DataTable = op_context.input_tables[0]
         row_num = self.attrs.get("row_num", 1)
 
-        default_value = {}
-        for col in in_table.columns:
-            val = None
-            if in_table[col].dtype in ["int64", "float64"]:
-                val = 0
-            default_value.update({col: val})
-
-        for _ in range(row_num):
-            in_table.loc[len(in_table)] = default_value
+        in_table = append_rows(in_table, row_num)
 
         op_context.output_tables.append(in_table)
         return True
@@ -1,10 +1,10 @@
 import json
 
-import jsonpath
-
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.jsonpath_utils import compile_paths
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class ExtractColumnFromDictOp(Op):
@@ -84,21 +84,19 @@ else:
         if dict_column not in in_table.columns or len(extracted_column) != len(alias_column_name):
             return False
 
-        for col in alias_column_name:
-            in_table[col] = None
+        # 多个提取路径合并后对每行只遍历一次
+        paths = compile_paths(tuple(extracted_column))
 
-        for index, row in in_table.iterrows():
-            dict_value = row.get(dict_column)
+        def extract(dict_value):
             if not dict_value:
-                continue
+                return [None] * len(alias_column_name)
             if is_json_dump:
                 dict_value = json.loads(dict_value)
-            for idx, col in enumerate(extracted_column):
-                if not col:
-                    continue
-                extracted_values = jsonpath.jsonpath(dict_value, col)
-                if extracted_values and len(extracted_values) > 0:
-                    in_table.at[index, alias_column_name[idx]] = extracted_values[0]
+            return paths.first(dict_value)
+
+        extracted_rows = map_columns(in_table, extract, dict_column)
+        for idx, col in enumerate(alias_column_name):
+            assign_column(in_table, col, [extracted_values[idx] for extracted_values in extracted_rows])
 
         op_context.output_tables.append(in_table)
         return True
@@ -1,11 +1,10 @@
 import time
 
-import jsonpath
-
 from video_graph.common.utils.kconf import get_kconf_value
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.jsonpath_utils import compile_path
 
 
 class ExtractColumnFromKconfOp(Op):
@@ -78,8 +77,8 @@ else:
 
         kconf_value = get_kconf_value(kconf_key_name, kconf_value_type)
         if kconf_value_type == "json" and json_extracted_column:
-            target_values = jsonpath.jsonpath(kconf_value, json_extracted_column)
-            target_value = target_values[-1] if target_values and len(target_values) > 0 else None
+            target_values = compile_path(json_extracted_column).find(kconf_value)
+            target_value = target_values[-1] if target_values else None
         elif kconf_value_type == "tail_number":
             tail_number_random = 0
             if tail_number_use_timestamp:
@@ -1,8 +1,8 @@
-import jsonpath
-
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.jsonpath_utils import compile_path
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class ExtractColumnFromListDictOp(Op):
@@ -72,20 +72,14 @@ else:
         if list_dict_column not in in_table.columns:
             return False
 
-        in_table[alias_column_name] = None
-        for index, row in in_table.iterrows():
-            list_dict_value = row.get(list_dict_column)
+        path = compile_path(extracted_column)
+
+        def extract(list_dict_value):
             if not list_dict_value:
-                continue
-            value_list = []
-            for dict_value in list_dict_value:
-                extracted_values = jsonpath.jsonpath(dict_value, extracted_column)
-                if extracted_values and len(extracted_values) > 0:
-                    value_list.append(extracted_values[0])
-                else:
-                    value_list.append(None)
-
-            in_table.at[index, alias_column_name] = value_list
+                return None
+            return [path.first(dict_value) for dict_value in list_dict_value]
+
+        assign_column(in_table, alias_column_name, map_columns(in_table, extract, list_dict_column))
 
         op_context.output_tables.append(in_table)
         return True
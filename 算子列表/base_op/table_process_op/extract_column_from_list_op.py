@@ -1,8 +1,8 @@
-import random
-
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.random_utils import choose_each, get_rng
+from video_graph.ops.op_utils.table_utils import assign_column
 
 
 class ExtractColumnFromListOp(Op):
@@ -71,9 +71,13 @@ else:
         alias_column_name = self.attrs.get("alias_column_name", f"{list_column}_{extracted_index}")
 
         if list_column in in_table.columns:
-            in_table[alias_column_name] = in_table[list_column].apply(
-                lambda x: x[extracted_index] if x and 0 <= extracted_index < len(x) else x[
-                    random.choice(range(len(x)))])
+            values = in_table[list_column].tolist()
+            # 下标越界或列表为空的行随机选取，随机数按 request_id 确定种子，一次生成所有随机下标
+            in_range = [bool(x) and 0 <= extracted_index < len(x) for x in values]
+            random_values = iter(choose_each(get_rng(op_context, self.name),
+                                             [x for x, valid in zip(values, in_range) if not valid]))
+            extracted = [x[extracted_index] if valid else next(random_values) for x, valid in zip(values, in_range)]
+            assign_column(in_table, alias_column_name, extracted, dtype=None)
 
         op_context.output_tables.append(in_table)
         return True
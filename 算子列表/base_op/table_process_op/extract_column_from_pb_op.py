@@ -1,9 +1,10 @@
-import jsonpath
 from google.protobuf.json_format import MessageToDict
 
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.jsonpath_utils import compile_path
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class ExtractColumnFromPBOp(Op):
@@ -74,15 +75,14 @@ else:
         if pb_column not in in_table.columns:
             return False
 
-        in_table[alias_column_name] = None
-        for index, row in in_table.iterrows():
-            pb_value = row.get(pb_column)
+        path = compile_path(extracted_column)
+
+        def extract(pb_value):
             if not pb_value:
-                continue
-            dict_value = MessageToDict(pb_value)
-            extracted_values = jsonpath.jsonpath(dict_value, extracted_column)
-            if extracted_values and len(extracted_values) > 0:
-                in_table.at[index, alias_column_name] = extracted_values[0]
+                return None
+            return path.first(MessageToDict(pb_value))
+
+        assign_column(in_table, alias_column_name, map_columns(in_table, extract, pb_column))
 
         op_context.output_tables.append(in_table)
         return True
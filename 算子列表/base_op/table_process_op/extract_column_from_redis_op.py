@@ -2,17 +2,22 @@ from video_graph.common.utils.redis import RedisManager
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.redis_utils import batch_get, get_ttl_cache
+from video_graph.ops.op_utils.table_utils import assign_column, column_values
 
 
 class ExtractColumnFromRedisOp(Op):
     """
     Function:
-        从 Redis 中提取列算子，仅支持字符串类型的 Value
+        从 Redis 中提取列算子，仅支持字符串类型的 Value，按块批量读取，不存在的 Key 对应的值为 None
 
     Attributes:
         redis_cluster (str): Redis 集群名称。
         redis_key_column (str): Redis Key 列名。
         redis_value_column (str): Redis Value 列名。
+        batch_mode (str, optional): 批量读取方式，可选 "mget"、"pipeline"、"single"，默认为 "pipeline"；mget 仅适用于单节点，集群上自动改用 pipeline。
+        chunk_size (int, optional): 每次请求的 Key 数量，默认为 100。
+        cache_ttl (float, optional): 进程内缓存时间(秒)，默认为 0 即不缓存。
 
     InputTables:
         in_table: 输入表格。
@@ -65,15 +70,15 @@ else:
         redis_key_column = self.attrs.get("redis_key_column")
         redis_value_column = self.attrs.get("redis_value_column")
 
-        redis_client = RedisManager().get_client(redis_cluster)
-        in_table[redis_value_column] = None
-        for index, row in in_table.iterrows():
-            redis_key = row.get(redis_key_column)
-            if not redis_key:
-                continue
+        batch_mode = self.attrs.get("batch_mode", "pipeline")
+        chunk_size = self.attrs.get("chunk_size", 100)
+        cache_ttl = self.attrs.get("cache_ttl", 0)
 
-            redis_value = redis_client.get(redis_key)
-            in_table.at[index, redis_value_column] = redis_value.decode('utf-8')
+        redis_client = RedisManager().get_client(redis_cluster)
+        redis_values = batch_get(redis_client, column_values(in_table, redis_key_column),
+                                 chunk_size=chunk_size, mode=batch_mode,
+                                 cache=get_ttl_cache(redis_cluster), cache_ttl=cache_ttl)
+        assign_column(in_table, redis_value_column, redis_values)
 
         op_context.output_tables.append(in_table)
         return True
@@ -84,5 +89,8 @@ op_register.register_op(ExtractColumnFromRedisOp) \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
     .add_attr(name="redis_cluster", type="str", desc="redis集群地址") \
     .add_attr(name="redis_key_column", type="str", desc="redis key列名") \
-    .add_attr(name="redis_value_column", type="str", desc="redis value 列名")
+    .add_attr(name="redis_value_column", type="str", desc="redis value 列名") \
+    .add_attr(name="batch_mode", type="str", desc="批量读取方式 mget/pipeline/single") \
+    .add_attr(name="chunk_size", type="int", desc="每次请求的key数量") \
+    .add_attr(name="cache_ttl", type="float", desc="进程内缓存时间(秒)")
 
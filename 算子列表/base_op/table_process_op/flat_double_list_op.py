@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class FlatDoubleListOp(Op):
@@ -68,15 +69,9 @@ else:
         source_column = self.attrs.get("source_column")
         target_column = self.attrs.get("target_column")
 
-        in_table[target_column] = None
-        for index, row in in_table.iterrows():
-            flat_res = []
-            first_list = row.get(source_column)
-            for second_list in first_list:
-                for item in second_list:
-                    flat_res.append(item)
-
-            in_table.at[index, target_column] = flat_res
+        flat_lists = map_columns(in_table, lambda first_list: [item for second_list in first_list for item in second_list],
+                                 source_column)
+        assign_column(in_table, target_column, flat_lists)
 
         op_context.output_tables.append(in_table)
         return True
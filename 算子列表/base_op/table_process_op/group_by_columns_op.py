@@ -3,7 +3,7 @@ import json
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
-from video_graph.ops.light_function.function_manager import FunctionManager
+from video_graph.ops.op_utils.agg_utils import group_aggregate, parse_agg_rules
 
 
 class GroupByColumnsOp(Op):
@@ -13,8 +13,10 @@ class GroupByColumnsOp(Op):
 
     Attributes:
         group_by_columns (list): 分组列名列表。
-        agg_rules (dict): 聚合规则，键为列名，值为聚合函数名或函数。
+        agg_rules (dict): 聚合规则，键为列名，值为聚合函数名；也可以是函数名列表(输出列名为 列名_函数名)，
+            或 {输出列名: 函数名} 的字典，用于同一列的多个聚合。
         table_name (str): 新表的名称。
+        sort (bool, optional): 是否按分组列排序输出，默认为 True；大表可设为 False，按各组首次出现的顺序输出，省去排序。
 
     InputTables:
         in_table: 输入表格。
@@ -72,19 +74,14 @@ else:
     def compute(self, op_context: OpContext) -> bool:
         in_table: DataTable = op_context.input_tables[0]
         group_by_columns = self.attrs.get("group_by_columns", [])
-        agg_rules = json.loads(self.attrs.get("agg_rules", "{}"))
+        agg_rules = self.attrs.get("agg_rules", "{}")
         table_name = self.attrs.get("table_name", f"new_{in_table.name}")
+        sort = self.attrs.get("sort", True)
 
-        new_agg_rules = {}
-        function_manager = FunctionManager()
-        for column, function_name in agg_rules.items():
-            function = function_manager.get_function(function_name)
-            if function:
-                new_agg_rules.update({column: function})
-            else:
-                new_agg_rules.update({column: function_name})
-
-        new_df = in_table.groupby(group_by_columns).agg(new_agg_rules).reset_index()
+        # 聚合规则按 JSON 文本缓存解析结果，list_merge 等函数按组号整列计算，其余函数名交给 pandas 聚合
+        if not isinstance(agg_rules, str):
+            agg_rules = json.dumps(agg_rules)
+        new_df = group_aggregate(in_table, group_by_columns, parse_agg_rules(agg_rules), sort=sort)
         new_table = DataTable(name=table_name, data=new_df)
 
         op_context.output_tables.append(new_table)
@@ -96,4 +93,5 @@ op_register.register_op(GroupByColumnsOp) \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
     .add_attr(name="group_by_columns", type="list", desc="分组列名") \
     .add_attr(name="agg_rules", type="list", desc="聚合规则") \
-    .add_attr(name="table_name", type="str", desc="新表名")
+    .add_attr(name="table_name", type="str", desc="新表名") \
+    .add_attr(name="sort", type="bool", desc="是否按分组列排序")
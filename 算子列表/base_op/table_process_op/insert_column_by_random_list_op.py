@@ -1,8 +1,8 @@
-import random
-
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.random_utils import choose_each, get_rng
+from video_graph.ops.op_utils.table_utils import assign_column, column_values
 
 
 class InsertColumnByRandomListOp(Op):
@@ -67,17 +67,16 @@ else:
         column_name = self.attrs.get("column_name")
         random_list = self.attrs.get("random_list")
 
-        in_table[column_name] = None
-        for index, row in in_table.iterrows():
-            real_random_list = random_list
-            if isinstance(random_list, str):
-                random_list_data = row.get(random_list)
-                if isinstance(random_list_data, list):
-                    real_random_list = random_list_data
-                elif isinstance(random_list_data, dict):
-                    real_random_list = list(random_list_data.keys())
-            column_value = random.choice(real_random_list)
-            in_table.at[index, column_name] = column_value
+        # 随机数按 request_id 确定种子，同一请求重放时选择结果相同
+        rng = get_rng(op_context, self.name)
+
+        # random_list 为列名时，每行从该列的 list 或 dict 的 key 中随机选择，其余类型的值从 random_list 本身中选择
+        if isinstance(random_list, str):
+            candidates = [list(value.keys()) if isinstance(value, dict) else value if isinstance(value, list)
+                          else random_list for value in column_values(in_table, random_list)]
+        else:
+            candidates = [random_list] * len(in_table)
+        assign_column(in_table, column_name, choose_each(rng, candidates))
 
         op_context.output_tables.append(in_table)
         return True
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class InsertColumnByTemplateOp(Op):
@@ -72,14 +73,8 @@ else:
         column_name_2 = self.attrs.get("column_name_2")
         column_name_3 = self.attrs.get("column_name_3")
 
-        in_table[new_column_name] = None
-        for index, row in in_table.iterrows():
-            column_1 = row.get(column_name_1)
-            column_2 = row.get(column_name_2)
-            column_3 = row.get(column_name_3)
-
-            new_column_value = template.format(column_1, column_2, column_3)
-            in_table.at[index, new_column_name] = new_column_value
+        new_column_values = map_columns(in_table, template.format, column_name_1, column_name_2, column_name_3)
+        assign_column(in_table, new_column_name, new_column_values)
 
         op_context.output_tables.append(in_table)
         return True
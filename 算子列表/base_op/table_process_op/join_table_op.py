@@ -1,19 +1,22 @@
-import pandas
-
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.join_utils import join_tables
 
 
 class JoinTableOp(Op):
     """
     Function:
-        两表 join 算子，支持 left/right/inner/outer 四种 join 方式
+        两表 join 算子，支持 left/right/inner/outer 四种 join 方式，支持多列 join；
+        右表 join 列唯一或两表已按 join 列升序排列时不调用 pandas.merge，行顺序不变的一侧不拷贝列数据
 
     Attributes:
         table_name (str): join 后的表格名称
-        on_column (str): join 的列
+        on_column (str/list, optional): 两表同名的 join 列, 可以是多列, 与 left_on/right_on 二选一
+        left_on (str/list, optional): 左表的 join 列
+        right_on (str/list, optional): 右表的 join 列, 列数需与 left_on 一致
         how (str, optional): join 方式, left/right/inner/outer, 默认 inner
+        reuse_index (bool, optional): 是否复用同一张表上已建立的 join 列索引, 适用于同一张表多次 join 且不修改 join 列的场景, 默认 False
 
     InputTables:
         两张表, 第一张表为左表, 第二张表为右表
@@ -74,12 +77,16 @@ else:
     def compute(self, op_context: OpContext) -> bool:
         table_name = self.attrs.get('table_name')
         on_column = self.attrs.get('on_column')
+        left_on = self.attrs.get('left_on')
+        right_on = self.attrs.get('right_on')
         how = self.attrs.get('how', 'inner')
+        reuse_index = self.attrs.get('reuse_index', False)
 
         left_table = op_context.input_tables[0]
         right_table = op_context.input_tables[1]
 
-        new_df = pandas.merge(left_table, right_table, on=on_column, how=how)
+        new_df = join_tables(left_table, right_table, on=on_column, left_on=left_on, right_on=right_on, how=how,
+                             reuse_index=reuse_index)
         new_table = DataTable(name=table_name, data=new_df)
         op_context.output_tables.append(new_table)
 
@@ -91,5 +98,8 @@ op_register.register_op(JoinTableOp) \
     .add_input(name="right_table", type="DataTable", desc="右表") \
     .add_output(name="new_table", type="DataTable", desc="join 出来的表") \
     .add_attr(name="table_name", type="str", desc="join 后的表格名称") \
-    .add_attr(name="extracted_column", type="str", desc="join 的列") \
-    .add_attr(name="how", type="str", desc="join 方式, left/right/inner/outer")
+    .add_attr(name="on_column", type="str", desc="join 的列") \
+    .add_attr(name="left_on", type="str", desc="左表 join 的列") \
+    .add_attr(name="right_on", type="str", desc="右表 join 的列") \
+    .add_attr(name="how", type="str", desc="join 方式, left/right/inner/outer") \
+    .add_attr(name="reuse_index", type="bool", desc="是否复用 join 列索引")
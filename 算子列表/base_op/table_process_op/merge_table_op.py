@@ -12,6 +12,7 @@ class MergeTableOp(Op):
 
     Attributes:
         table_name (str): 合并后的表格名称。
+        reset_index (bool, optional): 是否将合并后的行索引重置为 0..n-1，避免输入表的行索引重复导致按索引读写出错，默认为 False。
 
     InputTables:
         多表输入，不限制输入表的数量。
@@ -68,12 +69,15 @@ else:
 
     def compute(self, op_context: OpContext) -> bool:
         table_name = self.attrs.get("table_name")
+        reset_index = self.attrs.get("reset_index", False)
 
         table_list = []
         for table in op_context.input_tables:
             table_list.append(table)
 
-        new_df = pandas.concat(table_list)
+        # pandas.concat 按 block 合并，object 列中的 dict/list 对象按引用共享，不会深拷贝；
+        # ignore_index 在合并时直接生成新的行索引，不需要再 reset_index 复制一遍
+        new_df = pandas.concat(table_list, ignore_index=reset_index)
         new_table = DataTable(name=table_name, data=new_df)
         op_context.output_tables.append(new_table)
 
@@ -84,4 +88,5 @@ op_register.register_op(MergeTableOp) \
     .add_input(name="any_table", type="DataTable", desc="placeholder") \
     .add_input(name="...", type="DataTable", desc="placeholder") \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
-    .add_attr(name="table_name", type="str", desc="新表名")
+    .add_attr(name="table_name", type="str", desc="新表名") \
+    .add_attr(name="reset_index", type="bool", desc="是否重置行索引")
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.expr_utils import eval_table
 
 
 class TableModifyOp(Op):
@@ -13,6 +14,7 @@ class TableModifyOp(Op):
         expression (str): 修改表达式
         inplace (bool, optional): 是否在原表上进行操作，默认为 True
         table_name (str, optional): 新表的名称，仅在inplace为False时有效
+        engine (str, optional): 计算引擎，python/numexpr，默认根据列类型和行数自动选择
 
     InputTables:
         in_table: 输入表格
@@ -66,8 +68,9 @@ else:
         expression = self.attrs.get("expression")
         inplace = self.attrs.get("inplace", True)
         table_name = self.attrs.get("table_name")
+        engine = self.attrs.get("engine")
 
-        new_df = in_table.eval(expression, inplace=inplace)
+        new_df = eval_table(in_table, expression, engine=engine, inplace=inplace)
         if inplace:
             op_context.output_tables.append(in_table)
         else:
@@ -81,4 +84,5 @@ op_register.register_op(TableModifyOp) \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
     .add_attr(name="expression", type="str", desc="修改表达式") \
     .add_attr(name="inplace", type="bool", desc="是否就地处理") \
-    .add_attr(name="table_name", type="str", desc="新表名")
+    .add_attr(name="table_name", type="str", desc="新表名") \
+    .add_attr(name="engine", type="str", desc="计算引擎")
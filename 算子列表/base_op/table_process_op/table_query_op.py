@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.expr_utils import query_table
 
 
 class TableQueryOp(Op):
@@ -13,7 +14,7 @@ class TableQueryOp(Op):
         expression (str): 查询表达式
         inplace (bool, optional): 是否在原表上进行操作，默认为 False
         table_name (str, optional): 新表的名称，仅在inplace为False时有效
-        engine (str, optional): 查询引擎，默认为 python
+        engine (str, optional): 查询引擎，python/numexpr，默认根据列类型和行数自动选择，数值列且行数较多时使用 numexpr
         reset_index (bool, optional): 是否重置索引，默认为 True
 
     InputTables:
@@ -70,10 +71,11 @@ else:
         expression = self.attrs.get("expression")
         inplace = self.attrs.get("inplace", False)
         table_name = self.attrs.get("table_name")
-        engine = self.attrs.get("engine", "python")
+        engine = self.attrs.get("engine")
         reset_index = self.attrs.get("reset_index", True)
 
-        new_df = in_table.query(expression, inplace=inplace, engine=engine)
+        # 表达式按文本和列类型编译缓存，超出支持范围时由 pandas 解析
+        new_df = query_table(in_table, expression, engine=engine, inplace=inplace)
 
         if inplace:
             if reset_index:
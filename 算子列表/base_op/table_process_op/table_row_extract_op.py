@@ -2,6 +2,7 @@ from video_graph.common.utils.logger import logger
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.row_rules import RowRule, compile_rules, rules_mask, take_rows
 
 
 class TableRowExtractOp(Op):
@@ -12,8 +13,9 @@ class TableRowExtractOp(Op):
     Attributes:
         table_name (str): 表的名称
         column (str): 列名
-        rule (str): 提取规则，可选值为 "in", "not_in", ">", "<", ">=", "<="
+        rule (str): 提取规则，可选值为 "=", "in", "not_in", ">", "<", ">=", "<=", "contains", "contains_any", "is_empty"
         value (Union[list, int, float]): 提取规则对应的值，类型根据规则而定
+        rules (list, optional): 多个规则，每个规则为包含 column、rule、value 的 dict，提取同时满足所有规则的行，设置后忽略 column/rule/value
 
     InputTables:
         in_table: 输入表
@@ -69,30 +71,15 @@ else:
         column = self.attrs.get("column")
         rule = self.attrs.get("rule")
         value = self.attrs.get("value")
+        rules = self.attrs.get("rules")
 
-        rule_func_map = {
-            "in": lambda x: x[column].isin(value),
-            "not_in": lambda x: ~x[column].isin(value),
-            ">": lambda x: x[column] > value,
-            "<": lambda x: x[column] < value,
-            ">=": lambda x: x[column] >= value,
-            "<=": lambda x: x[column] <= value
-        }
-
-        rule_type_map = {
-            "in": lambda x: isinstance(x, list),
-            "not_in": lambda x: isinstance(x, list),
-            ">": lambda x: isinstance(x, (int, float)),
-            "<": lambda x: isinstance(x, (int, float)),
-            ">=": lambda x: isinstance(x, (int, float)),
-            "<=": lambda x: isinstance(x, (int, float))
-        }
-
-        if rule not in rule_type_map or not rule_type_map[rule](value):
-            logger.info(f"params error, rule:{rule} value:{value},{type(value)} ")
+        try:
+            row_rules = compile_rules(rules) if rules else [RowRule(column, rule, value)]
+        except ValueError as e:
+            logger.info(str(e))
             return False
 
-        new_table = in_table[rule_func_map[rule](in_table)].copy()
+        new_table = take_rows(in_table, rules_mask(in_table, row_rules))
 
         if new_table is not None:
             new_table.name = table_name
@@ -106,5 +93,6 @@ op_register.register_op(TableRowExtractOp) \
     .add_output(name="any_table", type="DataTable", desc="placeholder") \
     .add_attr(name="table_name", type="str", desc="新表名") \
     .add_attr(name="column", type="str", desc="规则处理的列名") \
-    .add_attr(name="rule", type="str", desc="规则类型，支持in、not_in、>、<、>=、<=") \
-    .add_attr(name="value", type="str", desc="规则处理的值集合")
+    .add_attr(name="rule", type="str", desc="规则类型，支持=、in、not_in、>、<、>=、<=、contains、contains_any、is_empty") \
+    .add_attr(name="value", type="str", desc="规则处理的值集合") \
+    .add_attr(name="rules", type="list", desc="多个规则，同时满足时提取")
@@ -2,6 +2,7 @@ from video_graph.common.utils.logger import logger
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.row_rules import RowRule, compile_rules, rules_mask, take_rows
 
 
 class TableRowFilterOp(Op):
@@ -14,8 +15,9 @@ class TableRowFilterOp(Op):
         table_name (str): 表的名称
         reverse (bool): 是否反向过滤，默认为 False
         column (str): 列名
-        rule (str): 提取规则，可选值为 "=", "in", ">", "<", "contains", "is_empty"
+        rule (str): 提取规则，可选值为 "=", "in", "not_in", ">", "<", ">=", "<=", "contains", "contains_any", "is_empty"
         value (Union[list, int, float, str]): 提取规则对应的值，类型根据规则而定
+        rules (list, optional): 多个规则，每个规则为包含 column、rule、value 的 dict，同时满足所有规则的行被过滤，设置后忽略 column/rule/value
 
     InputTables:
         in_table: 输入表
@@ -78,40 +80,28 @@ else:
         column = self.attrs.get("column")
         rule = self.attrs.get("rule")
         value = self.attrs.get("value")
+        rules = self.attrs.get("rules")
 
-        rule_func_map = {
-            "=": lambda x: ~x[column].isin([value]) if reverse else x[column].isin([value]),
-            "in": lambda x: ~x[column].isin(value) if reverse else x[column].isin(value),
-            ">": lambda x: x[column] <= value if reverse else x[column] > value,
-            "<": lambda x: x[column] >= value if reverse else x[column] < value,
-            "contains": lambda x: x[column].apply(lambda l: value not in l if l else True) if reverse else x[
-                column].apply(lambda l: value in l if l else False),
-            "is_empty": lambda x: x[column].apply(lambda l: True if l else False) if reverse else x[column].apply(
-                lambda l: False if l else True)
-        }
-
-        rule_type_map = {
-            "=": lambda x: isinstance(x, (int, float, str, bool)),
-            "in": lambda x: isinstance(x, list),
-            ">": lambda x: isinstance(x, (int, float)),
-            "<": lambda x: isinstance(x, (int, float)),
-            "contains": lambda x: isinstance(x, (int, float, str, bool)),
-            "is_empty": lambda x: True
-        }
-
-        if rule not in rule_func_map or not rule_type_map[rule](value) or \
-                column not in in_table.columns:
-            logger.info(f"params error, column:{column}, rule:{rule} value:{value},{type(value)} ")
+        try:
+            # 单个规则时 reverse 作用在规则上(如 > 取反为 <=)，多个规则时对整体结果取反
+            row_rules = compile_rules(rules) if rules else [RowRule(column, rule, value, negate=reverse)]
+        except ValueError as e:
+            logger.info(str(e))
+            return False
+        if any(row_rule.column not in in_table.columns for row_rule in row_rules):
+            logger.info(f"params error, column not found: {[row_rule.column for row_rule in row_rules]}")
             return False
 
-        condition = rule_func_map[rule](in_table)
-        new_df = in_table.drop(in_table[condition].index, inplace=inplace)
-
-        if not inplace:
-            new_table = DataTable(name=table_name, data=new_df)
-            op_context.output_tables.append(new_table)
-        else:
+        # condition 为需要过滤掉的行
+        condition = rules_mask(in_table, row_rules)
+        if rules and reverse:
+            condition = ~condition
+        if inplace:
+            in_table.drop(in_table.index[condition], inplace=True)
             op_context.output_tables.append(in_table)
+        else:
+            new_table = DataTable(name=table_name, data=take_rows(in_table, ~condition))
+            op_context.output_tables.append(new_table)
         return True
 
 
@@ -122,5 +112,6 @@ op_register.register_op(TableRowFilterOp) \
     .add_attr(name="table_name", type="str", desc="新表名") \
     .add_attr(name="reverse", type="bool", desc="是否反向过滤") \
     .add_attr(name="column", type="str", desc="规则处理的列名") \
-    .add_attr(name="rule", type="str", desc="规则类型，支持=、in、>、<、contains、is_empty") \
-    .add_attr(name="value", type="str", desc="规则处理的值集合")
+    .add_attr(name="rule", type="str", desc="规则类型，支持=、in、not_in、>、<、>=、<=、contains、contains_any、is_empty") \
+    .add_attr(name="value", type="str", desc="规则处理的值集合") \
+    .add_attr(name="rules", type="list", desc="多个规则，同时满足时过滤")
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.random_utils import get_rng
 
 
 class TableShuffleOp(Op):
@@ -61,7 +62,8 @@ else:
     def compute(self, op_context: OpContext) -> bool:
         in_table: DataTable = op_context.input_tables[0]
 
-        new_df = in_table.sample(frac=1)
+        # 随机数按 request_id 确定种子，同一请求重放时打散顺序相同
+        new_df = in_table.take(get_rng(op_context, self.name).permutation(len(in_table)))
         new_table = DataTable(name=in_table.name, data=new_df)
 
         op_context.output_tables.append(new_table)
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class JoinTextListOp(Op):
@@ -68,11 +69,7 @@ else:
         joined_text_column = self.attrs.get("joined_text_column", "joined_text")
         join_symbol = self.attrs.get("join_symbol", "")
 
-        in_table[joined_text_column] = None
-        for index, row in in_table.iterrows():
-            text_list = row.get(text_list_column)
-            joined_text = join_symbol.join(text_list)
-            in_table.at[index, joined_text_column] = joined_text
+        assign_column(in_table, joined_text_column, map_columns(in_table, join_symbol.join, text_list_column))
 
         op_context.output_tables.append(in_table)
         return True
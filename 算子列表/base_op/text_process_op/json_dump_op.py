@@ -3,6 +3,7 @@ import json
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class JsonDumpOp(Op):
@@ -63,10 +64,7 @@ else:
         source_column = self.attrs.get("source_column")
         target_column = self.attrs.get("target_column")
 
-        in_table[target_column] = None
-        for index, row in in_table.iterrows():
-            object_col = row.get(source_column)
-            in_table.at[index, target_column] = json.dumps(object_col)
+        assign_column(in_table, target_column, map_columns(in_table, json.dumps, source_column))
 
         op_context.output_tables.append(in_table)
         return True
@@ -1,6 +1,7 @@
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import assign_column, map_columns
 
 
 class SplitTextOp(Op):
@@ -68,11 +69,8 @@ else:
         text_list_column = self.attrs.get("text_list_column", "text_list")
         split_symbol = self.attrs.get("split_symbol", "。")
 
-        in_table[text_list_column] = None
-        for index, row in in_table.iterrows():
-            text = row.get(text_column)
-            text_list = text.split(split_symbol)
-            in_table.at[index, text_list_column] = text_list
+        text_lists = map_columns(in_table, lambda text: text.split(split_symbol), text_column)
+        assign_column(in_table, text_list_column, text_lists)
 
         op_context.output_tables.append(in_table)
         return True
@@ -1,4 +1,4 @@
-import random
+import numpy
 
 from video_graph.common.client.text_video_match_client import text_video_match
 from video_graph.common.utils.kconf import get_kconf_value
@@ -6,6 +6,7 @@ from video_graph.common.utils.logger import logger
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.random_utils import get_rng
 
 
 class TextVideoMatchOp(Op):
@@ -44,17 +45,17 @@ class TextVideoMatchOp(Op):
                               clip_resource_info: list, op_context: OpContext,
                               video_list_column: str, render_video_list_column: str,
                               text_video_match_type_column: str) -> bool:
-        for index, row in shot_table.iterrows():
+        # 一次生成每行的随机打散顺序，随机数按 request_id 确定种子，同一请求重放时匹配结果相同
+        rng = get_rng(op_context, self.name)
+        orders = rng.permuted(numpy.tile(numpy.arange(len(clip_resource_info)), (len(shot_table), 1)), axis=1)
+        for (index, row), order in zip(shot_table.iterrows(), orders.tolist()):
             tts_duration = row.get(tts_duration_column)
 
-            # 随机打散
-            random.shuffle(clip_resource_info)
-
             # 音频-视频时间对齐
             video_list = []
             render_video_list_list = []
             remain_duration = tts_duration
-            for info in clip_resource_info:
+            for info in (clip_resource_info[position] for position in order):
                 video_index, video_blob_key, start_time, end_time = info[0:4]
                 start_time = start_time / 1000.0
                 end_time = end_time / 1000.0
@@ -1,10 +1,9 @@
-import os
-
 from video_graph.common.utils.logger import logger
 from video_graph.common.utils.tools import get_video_base_info
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_WAIT_TIMEOUT, mp4_header_ready, row_file_path, wait_for_file
 
 
 class VideoBaseInfoOp(Op):
@@ -19,6 +18,7 @@ class VideoBaseInfoOp(Op):
         fps_column (str): 视频帧率列名，默认为"fps"
         width_column (str): 视频宽度列名，默认为"width"
         height_column (str): 视频高度列名，默认为"height"
+        wait_timeout (float, optional): FileDownloaderOp 流式下载时等待单个文件的超时(秒)，默认为 600，超时的行按文件不存在处理
 
     InputTables:
         material_table: 视频文件所在的表格
@@ -77,6 +77,7 @@ else:
         fps_column = self.attrs.get("fps_column", "fps")
         width_column = self.attrs.get("width_column", "width")
         height_column = self.attrs.get("height_column", "height")
+        wait_timeout = self.attrs.get("wait_timeout", DEFAULT_WAIT_TIMEOUT)
 
         status = False
         video_index = 0
@@ -86,11 +87,19 @@ else:
         material_table[height_column] = 0
         for index, row in material_table.iterrows():
             video_index += 1
-            video_filename = row.get(video_file_column)
-            if not video_filename or not os.path.exists(video_filename):
+            # FileDownloaderOp 流式下载的文件路径在 pending 列中，moov 写入后即可探测，不必等待下载完成
+            video_filename = row_file_path(row, video_file_column)
+            video_file = wait_for_file(video_filename, ready=mp4_header_ready, timeout=wait_timeout,
+                                       op_context=op_context)
+            if video_file is None:
                 logger.error(f"{video_filename} is not exist")
                 continue
-            duration, fps, width, height = get_video_base_info(video_filename)
+            duration, fps, width, height = get_video_base_info(video_file)
+            if not fps:
+                # 未写完的文件探测失败时等待下载完成后重新探测
+                video_file = wait_for_file(video_filename, timeout=wait_timeout, op_context=op_context)
+                if video_file is not None:
+                    duration, fps, width, height = get_video_base_info(video_file)
 
             material_table.loc[index, video_index_column] = video_index
             material_table.loc[index, duration_column] = duration
@@ -111,4 +120,5 @@ op_register.register_op(VideoBaseInfoOp) \
     .add_attr(name="duration_column", type="str", desc="视频时长列名") \
     .add_attr(name="fps_column", type="str", desc="fps列名") \
     .add_attr(name="width_column", type="str", desc="视频宽度列名") \
-    .add_attr(name="height_column", type="str", desc="视频高度列名")
+    .add_attr(name="height_column", type="str", desc="视频高度列名") \
+    .add_attr(name="wait_timeout", type="float", desc="流式下载时等待单个文件的超时(秒)")
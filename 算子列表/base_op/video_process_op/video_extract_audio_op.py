@@ -4,6 +4,7 @@ from video_graph.common.utils.tools import extract_audio
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_WAIT_TIMEOUT, row_file_path, wait_for_file
 
 
 class VideoExtractAudioOp(Op):
@@ -15,6 +16,7 @@ class VideoExtractAudioOp(Op):
         video_file_column (str, optional): 视频文件路径所在的列名，默认为"video_file_path"。
         audio_file_column (str, optional): 音频文件路径保存的列名，默认为"audio_file_path"。
         audio_type (str, optional): 音频类型，默认为“wav”。
+        wait_timeout (float, optional): FileDownloaderOp 流式下载时等待单个文件的超时(秒)，默认为 600，超时的行不输出音频。
 
     InputTables:
         material_table: 视频文件所在的表格
@@ -66,16 +68,19 @@ else:
         video_file_column = self.attrs.get("video_file_column", "video_file_path")
         audio_file_column = self.attrs.get("audio_file_column", "audio_file_path")
         audio_type = self.attrs.get("audio_type", "wav")
+        wait_timeout = self.attrs.get("wait_timeout", DEFAULT_WAIT_TIMEOUT)
 
         material_table[audio_file_column] = None
         for index, row in material_table.iterrows():
-            video_file = row.get(video_file_column)
-            if not video_file or not os.path.exists(video_file):
+            # FileDownloaderOp 流式下载的文件路径在 pending 列中，逐行等待各自的文件下载完成，不必等整批下载完成
+            video_file = row_file_path(row, video_file_column)
+            readable_file = wait_for_file(video_file, timeout=wait_timeout, op_context=op_context)
+            if readable_file is None:
                 continue
 
             basename, extension = os.path.splitext(video_file)
             audio_filename = f"{basename}.{audio_type}"
-            if not extract_audio(video_file, audio_filename, audio_type):
+            if not extract_audio(readable_file, audio_filename, audio_type):
                 continue
 
             material_table.loc[index, audio_file_column] = audio_filename
@@ -89,4 +94,5 @@ op_register.register_op(VideoExtractAudioOp) \
     .add_output(name="material_table", type="DataTable", desc="素材表") \
     .add_attr(name="video_file_column", type="str", desc="视频文件地址列名") \
     .add_attr(name="audio_file_column", type="str", desc="音频文件地址列名") \
+    .add_attr(name="wait_timeout", type="float", desc="流式下载时等待单个文件的超时(秒)") \
     .set_parallel(True)
@@ -5,6 +5,8 @@ import cv2
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.blob_utils import DEFAULT_WAIT_TIMEOUT, row_file_path, wait_for_file
+from video_graph.ops.op_utils.workspace_utils import get_workspace
 
 
 class VideoExtractCoverOp(Op):
@@ -15,6 +17,7 @@ class VideoExtractCoverOp(Op):
     Attributes:
         video_file_column (str, optional): 视频文件路径所在的列名，默认为"video_file_path"。
         cover_file_column (str, optional): 封面文件路径保存的列名，默认为"cover_file_path"。
+        wait_timeout (float, optional): FileDownloaderOp 流式下载时等待单个文件的超时(秒)，默认为 600，超时的行不输出封面。
 
     InputTables:
         material_table: 视频文件所在的表格
@@ -64,16 +67,20 @@ else:
         material_table: DataTable = op_context.input_tables[0]
         video_file_column = self.attrs.get("video_file_column", "video_file_path")
         cover_file_column = self.attrs.get("cover_file_column", "cover_file_path")
-        file_directory = f"{op_context.process_id}"
+        wait_timeout = self.attrs.get("wait_timeout", DEFAULT_WAIT_TIMEOUT)
+        # 写入请求临时目录 {process_id}/{request_id}，请求结束后由后台线程删除
+        file_directory = get_workspace(op_context).directory
 
         status = False
         material_table[cover_file_column] = None
         for index, row in material_table.iterrows():
-            video_file = row.get(video_file_column)
-            if not os.path.exists(video_file):
+            # FileDownloaderOp 流式下载的文件路径在 pending 列中，第一帧所在的位置无法从已写入的字节数判断，
+            # 等待下载完成后再抽取，避免读到只解码了一部分的帧
+            video_file = row_file_path(row, video_file_column)
+            readable_file = wait_for_file(video_file, timeout=wait_timeout, op_context=op_context)
+            if readable_file is None:
                 continue
-            cap = cv2.VideoCapture(video_file)
-            success, first_frame = cap.read()
+            success, first_frame = cv2.VideoCapture(readable_file).read()
             if success:
                 video_basename = os.path.basename(video_file)
                 video_prefix = os.path.splitext(video_basename)[0]
@@ -90,4 +97,5 @@ op_register.register_op(VideoExtractCoverOp) \
     .add_input(name="material_table", type="DataTable", desc="素材表") \
     .add_output(name="material_table", type="DataTable", desc="素材表") \
     .add_attr(name="video_file_column", type="str", desc="视频文件地址列名") \
-    .add_attr(name="cover_file_column", type="str", desc="封面文件地址列名")
+    .add_attr(name="cover_file_column", type="str", desc="封面文件地址列名") \
+    .add_attr(name="wait_timeout", type="float", desc="流式下载时等待单个文件的超时(秒)")
@@ -3,6 +3,7 @@ from ks_editor_kernel.model_builder.video_project_model_builder import EditScene
 from video_graph.data_table import DataTable
 from video_graph.op import Op, op_register
 from video_graph.op_context import OpContext
+from video_graph.ops.op_utils.table_utils import append_rows, assign_column
 
 
 class CreateMinecraftRequestNewOp(Op):
@@ -37,17 +38,13 @@ class CreateMinecraftRequestNewOp(Op):
         resolution = self.attrs.get("resolution", [720, 1280])
         row_num = self.attrs.get("row_num", 1)
 
-        timeline_table[project_model_builder_column] = None
-        timeline_table[input_file_map_column] = None
-        timeline_table[resolution_column] = None
-        for index in range(row_num):
-            project_model_builder = EditSceneVideoProjectBuilder()
-
-            if timeline_table.shape[0] <= index:
-                timeline_table.loc[index] = None
-            timeline_table.at[index, project_model_builder_column] = project_model_builder
-            timeline_table.at[index, input_file_map_column] = {}
-            timeline_table.at[index, resolution_column] = resolution
+        # 行数不足时一次性补齐，前 row_num 行各自使用独立的 builder 和 input_file_map
+        timeline_table = append_rows(timeline_table, row_num - timeline_table.shape[0])
+        padding = [None] * (timeline_table.shape[0] - row_num)
+        assign_column(timeline_table, project_model_builder_column,
+                      [EditSceneVideoProjectBuilder() for _ in range(row_num)] + padding)
+        assign_column(timeline_table, input_file_map_column, [{} for _ in range(row_num)] + padding)
+        assign_column(timeline_table, resolution_column, [resolution] * row_num + padding)
 
         op_context.output_tables.append(timeline_table)
         return True
@@ -0,0 +1,158 @@
+import functools
+import json
+
+import numpy
+import pandas
+
+from video_graph.data_table import DataTable
+from video_graph.ops.light_function.function_manager import FunctionManager
+from video_graph.ops.op_utils.table_utils import assign_column
+
+# 进程内缓存的聚合规则数量上限
+AGG_RULES_CACHE_SIZE = 256
+
+
+# 与 FunctionManager 中 list_merge 一致：按行顺序拼接组内各行的 list；
+# 一次遍历把每行的 list 追加到所属组，不再按组切分后逐组调用 Python 函数。列中有非 list 值时返回 None
+def list_merge(values, codes, group_num):
+    if set(map(type, values)) != {list}:
+        return None
+    merged = [[] for _ in range(group_num)]
+    for code, value in zip(codes.tolist(), values):
+        if code >= 0:
+            merged[code].extend(value)
+    return merged
+
+
+# 函数名 -> (按组号整列计算的聚合, 与之等价的 FunctionManager 函数)，入参为 (列值 object 数组, 每行组号, 组数)，
+# 返回每组的结果，返回 None 时退回逐组调用；FunctionManager 中该函数名当前对应的函数不是登记的函数时不使用整列实现
+VECTORIZED_AGGREGATIONS = {}
+
+
+# 用样例分组核对整列实现与 FunctionManager 函数的结果一致
+def _is_equivalent(aggregation, function):
+    values = numpy.empty(4, dtype=object)
+    values[:] = [[1, 2], [3], [4, 5], []]
+    codes = numpy.array([0, 1, 0, 1])
+    try:
+        expected = [function(pandas.Series(values[codes == code])) for code in range(2)]
+        return aggregation(values, codes, 2) == [list(value) for value in expected]
+    except Exception:
+        return False
+
+
+def register_aggregation(function_name: str, aggregation, function=None) -> bool:
+    """
+    注册按组号整列计算的聚合，仅在 FunctionManager 中的同名函数就是 function 时代替它
+
+    Args:
+        function_name (str): agg_rules 中使用的函数名
+        aggregation (callable): 入参为 (列值 object 数组, 每行组号, 组数)，返回每组结果的 list，无法处理时返回 None
+        function (callable, optional): 与之等价的 FunctionManager 函数，默认为注册时 FunctionManager 中的同名函数
+
+    Returns:
+        bool: 是否注册成功，没有同名函数或样例结果不一致时不注册
+    """
+    function = function or FunctionManager().get_function(function_name)
+    if function is None or not _is_equivalent(aggregation, function):
+        return False
+    VECTORIZED_AGGREGATIONS[function_name] = (aggregation, function)
+    return True
+
+
+register_aggregation("list_merge", list_merge)
+
+
+class AggRule:
+    """
+    一条解析后的聚合规则，聚合函数在每次使用时从 FunctionManager 查找，之后注册的函数同样生效
+
+    Attributes:
+        output (str): 输出列名
+        column (str): 聚合的列名
+        function_name (str): 聚合函数名
+    """
+
+    def __init__(self, output, column, function_name):
+        self.output = output
+        self.column = column
+        self.function_name = function_name
+
+    # pandas 聚合参数：FunctionManager 中的函数，没有时按 pandas 内置聚合名处理(sum/mean/max/first 等)
+    @property
+    def function(self):
+        return FunctionManager().get_function(self.function_name) or self.function_name
+
+    # 按组号整列计算的聚合，只在 FunctionManager 中的函数仍是登记时核对过的函数时使用
+    @property
+    def vectorized(self):
+        aggregation, function = VECTORIZED_AGGREGATIONS.get(self.function_name, (None, None))
+        if aggregation is None or self.function is not function:
+            return None
+        return aggregation
+
+
+@functools.lru_cache(maxsize=AGG_RULES_CACHE_SIZE)
+def parse_agg_rules(agg_rules: str) -> tuple:
+    """
+    解析聚合规则，相同的规则在进程内只解析一次
+
+    Args:
+        agg_rules (str): JSON 格式的聚合规则，键为列名，值为以下之一:
+            函数名，输出列名与列名相同；
+            函数名列表，输出列名为 列名_函数名；
+            dict，键为输出列名，值为函数名
+
+    Returns:
+        tuple: AggRule 列表，按规则中的顺序排列
+    """
+    rules = []
+    for column, functions in json.loads(agg_rules).items():
+        if isinstance(functions, str):
+            rules.append(AggRule(column, column, functions))
+        elif isinstance(functions, list):
+            rules.extend(AggRule(f"{column}_{function_name}", column, function_name) for function_name in functions)
+        elif isinstance(functions, dict):
+            rules.extend(AggRule(output, column, function_name) for output, function_name in functions.items())
+        else:
+            raise ValueError(f"invalid agg rule for column {column}: {functions}")
+    return tuple(rules)
+
+
+def group_aggregate(table: DataTable, group_by_columns: list, agg_rules: tuple, sort: bool = True):
+    """
+    按列分组聚合：有整列实现的聚合按组号一次计算，其余聚合交给 pandas 的命名聚合，
+    pandas 内置聚合名(sum/mean/max 等)走 pandas 的 C 实现
+
+    Args:
+        table (DataTable): 输入表格
+        group_by_columns (list): 分组列名
+        agg_rules (tuple): parse_agg_rules 解析出的规则
+        sort (bool, optional): 是否按分组列排序输出，False 时按各组首次出现的顺序输出，省去对分组键的排序
+
+    Returns:
+        pandas.DataFrame: 分组列和各输出列组成的表格
+    """
+    grouped = table.groupby(group_by_columns, sort=sort)
+    vectorized = {}
+    # 每次调用时按 FunctionManager 当前注册的函数确定是否使用整列实现
+    aggregations = [(rule, rule.vectorized) for rule in agg_rules]
+    # 空表交给 pandas，保持与原先一致的空结果列类型
+    if len(table) and any(aggregation is not None for _, aggregation in aggregations):
+        # 分组键含空值的行不属于任何组，组号为 -1
+        codes = grouped.ngroup().fillna(-1).to_numpy(dtype=numpy.int64)
+        group_num = grouped.ngroups
+        for rule, aggregation in aggregations:
+            if aggregation is not None:
+                values = aggregation(table[rule.column].to_numpy(dtype=object), codes, group_num)
+                if values is not None:
+                    vectorized[rule.output] = values
+
+    named_aggs = {rule.output: (rule.column, rule.function) for rule in agg_rules if rule.output not in vectorized}
+    if named_aggs:
+        new_df = grouped.agg(**named_aggs)
+    else:
+        new_df = grouped.size().to_frame().iloc[:, :0]
+    for output, values in vectorized.items():
+        assign_column(new_df, output, values)
+    return new_df[[rule.output for rule in agg_rules]].reset_index()
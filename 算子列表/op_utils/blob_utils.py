@@ -0,0 +1,514 @@
+import copy
+import fcntl
+import hashlib
+import os
+import stat
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# 单个算子内同时进行的传输数量默认上限
+DEFAULT_CONCURRENCY = 8
+# 本地缓存默认的容量上限
+DEFAULT_CACHE_MAX_BYTES = 10 * 1024 ** 3
+# 下载中的临时文件后缀，缓存目录加载时清理已退出进程遗留的临时文件
+TMP_SUFFIX = ".tmp"
+# 临时文件超过该时长(秒)没有写入时视为遗留文件，即使文件名中的进程号仍存在(可能已被复用)
+STALE_TMP_SECONDS = 600
+# 缓存文件对应的锁文件后缀，同一节点上的多个进程按 key 加 fcntl 锁，同一 key 只传输一次
+LOCK_SUFFIX = ".lock"
+# 计算文件哈希时每次读取的字节数
+DIGEST_CHUNK_SIZE = 1024 * 1024
+# 流式下载时下游算子检查文件是否可读的间隔(秒)
+STREAM_POLL_INTERVAL = 0.02
+# 流式下载时下游算子等待单个文件的默认超时(秒)，超时的行按失败处理
+DEFAULT_WAIT_TIMEOUT = 600
+# 流式下载中的文件后缀，下载成功后改名为目标路径，目标路径存在即表示文件完整
+PART_SUFFIX = ".part"
+# 流式下载时保存目标路径的列名后缀，未适配流式下载的算子读取原列名时得不到未下载完的文件
+PENDING_SUFFIX = "_pending"
+
+
+class TransferTask:
+    """
+    一次文件传输任务及其结果，同一文件被多行引用时只传输一次
+
+    Attributes:
+        resource_id (str): 日志中展示的资源标识，一般为 bbs 资源 id
+        client: Blob 存储客户端，同一 db-table 的任务共享一个客户端及其连接
+        key (str): Blob Key
+        file_path (str): 本地文件路径
+        cache_key (str, optional): 本地缓存的 key，为 None 时不使用缓存
+        rows (list): 引用该文件的行号
+        status (bool): 是否传输成功
+        error (Exception): 传输时抛出的异常
+        elapsed (float): 传输耗时(秒)
+        cache_hit (bool): 是否命中缓存(本地缓存或存储中已有的同内容对象)，命中时没有实际传输
+        evicted (int): 本次写入缓存时淘汰的文件数
+    """
+
+    def __init__(self, resource_id, client, key, file_path, cache_key=None):
+        self.resource_id = resource_id
+        self.client = client
+        self.key = key
+        self.file_path = file_path
+        self.cache_key = cache_key
+        self.rows = []
+        self.status = None
+        self.error = None
+        self.elapsed = 0.0
+        self.cache_hit = False
+        self.evicted = 0
+
+
+def run_transfers(tasks: list, transfer, concurrency: int = DEFAULT_CONCURRENCY, on_done=None) -> list:
+    """
+    用线程池并发执行文件传输，同时进行的传输数量不超过 concurrency
+
+    Args:
+        tasks (list): TransferTask 列表
+        transfer (callable): 入参为 TransferTask，返回 False 表示失败；抛出的异常记录到任务上，不影响其他任务
+        concurrency (int, optional): 最大并发数，小于等于 1 时在当前线程逐个执行
+        on_done (callable, optional): 每个任务结束后在当前线程中调用，入参为 TransferTask，用于逐行上报进度和失败
+
+    Returns:
+        list: 传入的 tasks，status/error/elapsed 已填充
+    """
+    def run(task):
+        start = time.monotonic()
+        try:
+            task.status = transfer(task) is not False
+        except Exception as error:
+            task.status, task.error = False, error
+        task.elapsed = time.monotonic() - start
+        return task
+
+    if concurrency <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            run(task)
+            if on_done is not None:
+                on_done(task)
+        return tasks
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(tasks))) as executor:
+        for future in as_completed([executor.submit(run, task) for task in tasks]):
+            if on_done is not None:
+                on_done(future.result())
+    return tasks
+
+
+def file_digest(file_path: str) -> str:
+    """
+    分块计算文件内容的 sha256，用于按内容去重，不会一次把大文件读入内存
+
+    Args:
+        file_path (str): 本地文件路径
+
+    Returns:
+        str: 十六进制的 sha256
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 进程是否存在；pid 为 None 时视为不存在
+def _pid_alive(pid):
+    if pid is None:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class BlobCache:
+    """
+    节点本地的 Blob 文件缓存，按 db-table-key 的哈希存放文件，同一节点上的多个进程共用缓存目录；
+    总大小按目录中的实际占用计算，超过上限时按访问时间淘汰最久未使用的文件。同一 key 的并发获取只传输一次：
+    进程内的其他线程等待传输完成，其他进程等待同一 key 的锁文件。缓存文件为只读，
+    命中时以硬链接的方式放到调用方指定的路径，淘汰只删除缓存中的链接，不影响正在使用的文件
+
+    Attributes:
+        root (str): 缓存目录
+        max_bytes (int): 缓存总大小上限(字节)
+        hits (int): 本进程累计命中次数
+        misses (int): 本进程累计未命中(实际传输)次数
+        evictions (int): 本进程累计淘汰的文件数
+    """
+
+    def __init__(self, root, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # 缓存文件路径 -> 传输完成事件，用于合并本进程内同一 key 的并发获取
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._remove_stale_tmp()
+        self._evict()
+
+    # 清理已退出进程遗留的临时文件；临时文件名中带有写入进程的 pid，仍在下载的文件不能删除
+    def _remove_stale_tmp(self):
+        now = time.time()
+        for directory, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                if not file_name.endswith(TMP_SUFFIX):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    pid = int(file_name[:-len(TMP_SUFFIX)].rsplit(".", 1)[1].split("-", 1)[0])
+                except (IndexError, ValueError):
+                    pid = None
+                try:
+                    if _pid_alive(pid) and now - os.stat(path).st_mtime < STALE_TMP_SECONDS:
+                        continue
+                    os.remove(path)
+                except OSError:
+                    continue
+
+    # 缓存文件路径：按 key 的 sha256 分两级目录存放，保留原文件后缀，便于下游按后缀识别格式
+    def cache_path(self, cache_key):
+        digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+        suffix = os.path.splitext(cache_key)[1]
+        return os.path.join(self.root, digest[:2], digest + suffix)
+
+    # 按目录中的实际占用淘汰访问时间最早的文件直到总大小不超过上限，包括其他进程写入的文件；返回淘汰的文件数
+    def _evict(self, keep=None):
+        files = []
+        total = 0
+        for directory, _, file_names in os.walk(self.root):
+            for file_name in file_names:
+                if file_name.endswith(TMP_SUFFIX) or file_name.endswith(LOCK_SUFFIX):
+                    continue
+                path = os.path.join(directory, file_name)
+                try:
+                    file_stat = os.stat(path)
+                except OSError:
+                    continue
+                files.append((file_stat.st_atime, path, file_stat.st_size))
+                total += file_stat.st_size
+        evicted = 0
+        for _, path, size in sorted(files):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            try:
+                os.remove(f"{path}{LOCK_SUFFIX}")
+            except OSError:
+                pass
+            total -= size
+            evicted += 1
+        with self._lock:
+            self.evictions += evicted
+        return evicted
+
+    # 将缓存文件以硬链接放到 target_path，失败(如跨文件系统)时直接返回只读的缓存路径；缓存文件已被淘汰时返回 None
+    def _expose(self, path, target_path):
+        if target_path is None:
+            return path if os.path.exists(path) else None
+        try:
+            if os.path.lexists(target_path):
+                os.remove(target_path)
+            os.link(path, target_path)
+            return target_path
+        except OSError:
+            return path if os.path.exists(path) else None
+
+    # 缓存文件存在(包括其他进程写入的)时返回对外路径，并更新访问时间用于淘汰排序；不存在时返回 None
+    def _hit(self, path, target_path):
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        try:
+            os.utime(path, (time.time(), file_stat.st_mtime))
+        except OSError:
+            pass
+        file_path = self._expose(path, target_path)
+        if file_path is not None:
+            with self._lock:
+                self.hits += 1
+        return file_path
+
+    def fetch(self, cache_key: str, fetch_func, target_path: str = None) -> tuple:
+        """
+        从缓存获取文件，未命中时调用 fetch_func 传输到临时文件后加入缓存
+
+        Args:
+            cache_key (str): 缓存 key，一般为 db-table-key
+            fetch_func (callable): 入参为临时文件路径，返回 False 表示传输失败
+            target_path (str, optional): 对外使用的路径，以硬链接指向缓存文件；为 None 时直接返回缓存路径
+
+        Returns:
+            tuple: (文件路径, 是否命中, 本次淘汰的文件数)，传输失败时文件路径为 None
+        """
+        path = self.cache_path(cache_key)
+        file_path = self._hit(path, target_path)
+        if file_path is not None:
+            return file_path, True, 0
+        with self._lock:
+            event = self._inflight.get(path)
+            if event is None:
+                self._inflight[path] = threading.Event()
+        if event is not None:
+            # 本进程的其他线程正在传输同一个 key，等待完成后重新检查缓存，传输失败时不再重复传输
+            event.wait()
+            file_path = self._hit(path, target_path)
+            return file_path, file_path is not None, 0
+
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}{LOCK_SUFFIX}", "a") as lock_file:
+                # 其他进程正在传输同一个 key 时等待其完成，拿到锁后重新检查缓存；锁在文件关闭时释放
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                file_path = self._hit(path, target_path)
+                if file_path is not None:
+                    return file_path, True, 0
+                tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}{TMP_SUFFIX}"
+                try:
+                    if fetch_func(tmp_path) is False or not os.path.exists(tmp_path):
+                        return None, False, 0
+                    os.chmod(tmp_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+                    os.replace(tmp_path, path)
+                finally:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                with self._lock:
+                    self.misses += 1
+                file_path = self._expose(path, target_path)
+            return file_path, False, self._evict(keep=path)
+        finally:
+            with self._lock:
+                self._inflight.pop(path).set()
+
+
+# 按目录共享的进程内缓存
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_blob_cache(root: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> BlobCache:
+    """
+    获取按目录共享的本地 Blob 缓存，同一进程内的请求共用一个缓存
+
+    Args:
+        root (str): 缓存目录
+        max_bytes (int, optional): 缓存总大小上限(字节)，以最近一次调用传入的值为准
+
+    Returns:
+        BlobCache: 同一目录共享的缓存
+    """
+    root = os.path.abspath(root)
+    with _caches_lock:
+        if root not in _caches:
+            _caches[root] = BlobCache(root, max_bytes)
+        cache = _caches[root]
+    if max_bytes != cache.max_bytes:
+        lowered = max_bytes < cache.max_bytes
+        cache.max_bytes = max_bytes
+        # 调小上限时立即按新的上限淘汰
+        if lowered:
+            cache._evict()
+    return cache
+
+
+class StreamingFile:
+    """
+    后台下载中的文件，下载内容先写入 {file_path}.part，成功后改名为 file_path
+
+    Attributes:
+        file_path (str): 下载完成后的本地路径
+        done (threading.Event): 下载结束(成功或失败)时触发
+        status (bool): 是否下载成功，下载结束前为 None
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.done = threading.Event()
+        self.status = None
+
+
+# 后台下载中的文件：本地路径 -> StreamingFile，下载结束后移除
+_streaming = {}
+_streaming_lock = threading.Lock()
+
+
+def pending_column(column: str) -> str:
+    """
+    流式下载时保存目标路径的列名
+
+    Args:
+        column (str): 下载完成后保存文件路径的列名
+
+    Returns:
+        str: 列名加 PENDING_SUFFIX
+    """
+    return f"{column}{PENDING_SUFFIX}"
+
+
+def row_file_path(row, column: str):
+    """
+    取一行的文件路径：原列没有路径时取流式下载中的目标路径(pending_column)，需用 wait_for_file 等待后再读取
+
+    Args:
+        row: 表格的一行
+        column (str): 文件路径列名
+
+    Returns:
+        文件路径，两列都没有时为 None
+    """
+    file_path = row.get(column)
+    if isinstance(file_path, str) and file_path:
+        return file_path
+    return row.get(pending_column(column))
+
+
+def start_streaming(tasks: list, transfer, concurrency: int = DEFAULT_CONCURRENCY, on_done=None) -> threading.Thread:
+    """
+    在后台线程中执行 run_transfers，调用方不等待下载完成；下游算子通过 wait_for_file 等待各自的文件，
+    每个文件下载结束即可处理，不必等整批下载完成。transfer 写入 {file_path}.part，成功后改名为 file_path，
+    目标路径存在即表示文件完整，其他进程中的算子同样可以按文件判断；下载失败时删除已写入的部分文件
+
+    Args:
+        tasks (list): TransferTask 列表，下载过程中 file_path 不会改变
+        transfer (callable): 同 run_transfers，入参为 file_path 改为 .part 路径的任务副本
+        concurrency (int, optional): 最大并发数
+        on_done (callable, optional): 每个任务结束后在后台线程中调用，入参为 TransferTask；
+            此时调用方算子可能已经返回，不能再上报算子的监控指标
+
+    Returns:
+        threading.Thread: 执行下载的后台线程
+    """
+    with _streaming_lock:
+        for task in tasks:
+            _streaming[task.file_path] = StreamingFile(task.file_path)
+    # 先创建空的 .part 文件，其他进程中的算子据此判断文件仍在下载
+    for task in tasks:
+        open(f"{task.file_path}{PART_SUFFIX}", "wb").close()
+
+    # 在任务副本上传输，下载过程中其他线程读到的 task.file_path 始终是目标路径
+    def stream(task):
+        part_task = copy.copy(task)
+        part_task.file_path = f"{task.file_path}{PART_SUFFIX}"
+        if transfer(part_task) is False:
+            return False
+        os.replace(part_task.file_path, task.file_path)
+        return True
+
+    def finish(task):
+        part_path = f"{task.file_path}{PART_SUFFIX}"
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        with _streaming_lock:
+            streaming = _streaming.pop(task.file_path)
+        streaming.status = task.status
+        streaming.done.set()
+        if on_done is not None:
+            on_done(task)
+
+    thread = threading.Thread(target=run_transfers, args=(tasks, stream, concurrency, finish),
+                              name="streaming-download", daemon=True)
+    thread.start()
+    return thread
+
+
+def wait_for_file(file_path: str, ready=None, timeout: float = DEFAULT_WAIT_TIMEOUT, op_context=None) -> str:
+    """
+    等待文件可以处理：文件已存在时直接返回；流式下载中(本进程登记或存在 .part 文件)时等待下载结束，
+    或在下载过程中 ready 对 .part 文件返回 True 时提前返回 .part 路径，用于在文件完整落地前探测文件头。
+    其他进程下载的文件只能按 .part 文件判断，下载进程崩溃遗留的 .part 文件会让调用方一直等到 timeout；
+    排队中的任务的 .part 文件同样长时间不更新，无法按修改时间区分，因此不按文件的新旧提前判定失败
+
+    Args:
+        file_path (str): 本地文件路径
+        ready (callable, optional): 入参为文件路径，返回 True 表示已写入的内容足够开始处理，如 mp4_header_ready
+        timeout (float, optional): 最长等待时间(秒)，默认为 600，为 None 时不超时
+        op_context (OpContext, optional): 传入时在调用方算子内上报等待耗时 stream_wait(微秒)，
+            extra1 为 ready/done/failed/timeout
+
+    Returns:
+        str: 可以处理的文件路径，文件不存在、下载失败或等待超时时为 None
+    """
+    if not isinstance(file_path, str) or not file_path:
+        return None
+    part_path = f"{file_path}{PART_SUFFIX}"
+    with _streaming_lock:
+        streaming = _streaming.get(file_path)
+    start = time.monotonic()
+    waited = False
+    while True:
+        if os.path.exists(file_path):
+            result, outcome = file_path, "done"
+            break
+        if streaming is not None:
+            downloading = not streaming.done.is_set()
+        else:
+            downloading = os.path.exists(part_path)
+        if not downloading:
+            # 检查文件与检查下载状态之间 .part 可能刚好改名为 file_path，下载已成功
+            if os.path.exists(file_path):
+                result, outcome = file_path, "done"
+            else:
+                result, outcome = None, "failed"
+            break
+        if ready is not None and ready(part_path):
+            result, outcome = part_path, "ready"
+            break
+        remaining = None if timeout is None else timeout - (time.monotonic() - start)
+        if remaining is not None and remaining <= 0:
+            result, outcome = None, "timeout"
+            break
+        waited = True
+        interval = STREAM_POLL_INTERVAL if ready is not None or streaming is None else remaining
+        if streaming is not None:
+            streaming.done.wait(interval)
+        else:
+            time.sleep(interval)
+    if waited and op_context is not None:
+        op_context.perf_ctx("stream_wait", micros=int((time.monotonic() - start) * 1e6), extra1=outcome)
+    return result
+
+
+def mp4_header_ready(file_path: str) -> bool:
+    """
+    判断写入中的 mp4/mov 文件是否已包含完整的 moov(时长、帧率、分辨率等元信息)；
+    按顶层 box 依次跳过，moov 在 mdat 之后(未做 faststart)时需等 mdat 和 moov 都写入
+
+    Args:
+        file_path (str): 本地文件路径
+
+    Returns:
+        bool: 已写入的内容是否足够
+    """
+    try:
+        with open(file_path, "rb") as file:
+            file_size = os.fstat(file.fileno()).st_size
+            offset = 0
+            while offset + 8 <= file_size:
+                file.seek(offset)
+                box_size, box_type = struct.unpack(">I4s", file.read(8))
+                if box_size == 1:
+                    if offset + 16 > file_size:
+                        return False
+                    box_size = struct.unpack(">Q", file.read(8))[0]
+                if box_type == b"moov":
+                    return box_size > 0 and offset + box_size <= file_size
+                if box_size < 8:
+                    return False
+                offset += box_size
+    except OSError:
+        pass
+    return False
@@ -0,0 +1,345 @@
+import ast
+import functools
+import io
+import operator
+import tokenize
+
+import numpy
+import pandas
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+from video_graph.data_table import DataTable
+from video_graph.ops.op_utils.row_rules import take_rows
+
+# 支持直接编译的运算，超出范围的表达式(函数调用、属性访问、@变量、反引号列名等)交给 pandas 解析
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+UNARY_OPERATORS = {ast.Not: operator.invert, ast.Invert: operator.invert, ast.USub: operator.neg, ast.UAdd: operator.pos}
+COMPARE_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+# 与列表或字符串比较时按 isin 计算，与 pandas 一致：== 和 in 为包含，!= 和 not in 为不包含
+MEMBERSHIP_OPERATORS = {ast.Eq: False, ast.In: False, ast.NotEq: True, ast.NotIn: True}
+CONSTANT_TYPES = (bool, int, float, str)
+# 行数少于该值时 numexpr 的调用开销大于收益，与 pandas 内部启用 numexpr 的阈值一致
+NUMEXPR_MIN_ROWS = 10000
+# 进程内缓存的表达式数量上限
+EXPRESSION_CACHE_SIZE = 1024
+# any_row 分块判断时每块的行数
+ANY_CHUNK_SIZE = 4096
+
+
+class CompiledExpression:
+    """
+    编译后的表达式，按表达式文本和引用列的类型缓存，执行时直接按列计算，不再经过 pandas 的解析流程
+
+    Attributes:
+        expression (str): 原始表达式
+        statements (tuple): 每行语句的 (赋值列名, 引用列名, 计算函数, numexpr 表达式)，
+            不是赋值语句时赋值列名为 None，引用列不全为数值类型或含 numexpr 不支持的运算时 numexpr 表达式为 None
+    """
+
+    def __init__(self, expression, statements):
+        self.expression = expression
+        self.statements = statements
+
+    # 是否为单个条件表达式，query 和 any_row 只接受这种形式
+    @property
+    def is_condition(self):
+        return len(self.statements) == 1 and self.statements[0][0] is None
+
+    # 计算一条语句，rows 为 None 时计算整列，否则只计算 rows 切片内的行
+    def _run(self, statement, table, engine=None, rows=None):
+        _, columns, func, numexpr_source = statement
+        if numexpr_source is not None and engine != "python" \
+                and (engine == "numexpr" or len(table) >= NUMEXPR_MIN_ROWS):
+            arrays = {column: table[column].to_numpy() for column in columns}
+            if rows is not None:
+                arrays = {column: values[rows] for column, values in arrays.items()}
+            return numexpr.evaluate(numexpr_source, local_dict=arrays)
+        if rows is None:
+            return func({column: table[column] for column in columns})
+        return func({column: table[column].iloc[rows] for column in columns})
+
+    # 计算条件表达式的布尔掩码，结果不是与行数一致的布尔数组时返回 None，由调用方交给 pandas 处理
+    def mask(self, table, engine=None, rows=None):
+        result = self._run(self.statements[0], table, engine, rows)
+        mask = result.to_numpy() if isinstance(result, pandas.Series) else result
+        expected = len(table) if rows is None else len(range(len(table))[rows])
+        if not isinstance(mask, numpy.ndarray) or mask.dtype != bool or mask.shape != (expected,):
+            return None
+        return mask
+
+    # 执行表达式，语义与 DataFrame.eval 一致：没有赋值时返回计算结果，有赋值时写入原表或副本
+    def evaluate(self, table, engine=None, inplace=False):
+        if self.statements[0][0] is None:
+            result = self._run(self.statements[0], table, engine)
+            # numexpr 返回 ndarray，与 DataFrame.eval 一致包装为按原表索引的 Series
+            return pandas.Series(result, index=table.index) if isinstance(result, numpy.ndarray) else result
+        # 与 pandas 一致使用浅拷贝，赋值只替换副本中的列，不修改原表数据
+        target_table = table if inplace else table.copy(deep=False)
+        for statement in self.statements:
+            target_table[statement[0]] = self._run(statement, table, engine)
+        return None if inplace else target_table
+
+
+# 与 pandas 的预处理一致：& 和 | 替换为 and/or，使其优先级低于比较运算，"a > 1 & b < 2" 无需加括号
+def _preparse(expression):
+    tokens = []
+    for token in tokenize.generate_tokens(io.StringIO(expression).readline):
+        if token.type == tokenize.OP and token.string in ("&", "|"):
+            tokens.append((tokenize.NAME, "and" if token.string == "&" else "or"))
+        else:
+            tokens.append((token.type, token.string))
+    return tokenize.untokenize(tokens)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _parse_expression(expression):
+    # 局部变量和反引号列名需要 pandas 的作用域解析
+    if not isinstance(expression, str) or "@" in expression or "`" in expression:
+        return None
+    try:
+        module = ast.parse(_preparse(expression.strip()), mode="exec")
+    except (SyntaxError, tokenize.TokenError):
+        return None
+
+    statements = []
+    assigned = set()
+    for node in module.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            target, node = node.targets[0].id, node.value
+        elif isinstance(node, ast.Expr) and len(module.body) == 1:
+            target, node = None, node.value
+        else:
+            return None
+        columns = sorted({name.id for name in ast.walk(node) if isinstance(name, ast.Name)})
+        # 引用前面语句赋值的列时逐行依赖计算结果，交给 pandas 处理
+        if not columns or assigned.intersection(columns):
+            return None
+        try:
+            func = _build(node)
+        except ValueError:
+            return None
+        statements.append((target, tuple(columns), func, _numexpr_source(node)))
+        assigned.add(target)
+    return tuple(statements) or None
+
+
+# 将语法树节点编译为按列计算的函数，入参为 列名 -> Series 的字典；遇到不支持的节点抛出 ValueError
+def _build(node):
+    if isinstance(node, ast.Name):
+        name = node.id
+        return lambda columns: columns[name]
+    if isinstance(node, ast.Constant) and type(node.value) in CONSTANT_TYPES:
+        value = node.value
+        return lambda columns: value
+    if isinstance(node, ast.BoolOp):
+        func = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+        parts = [_build(value) for value in node.values]
+        return lambda columns: functools.reduce(func, [part(columns) for part in parts])
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+        func, operand = UNARY_OPERATORS[type(node.op)], _build(node.operand)
+        # 常量取负直接计算，not/~ 作用于常量时与 pandas 的按位取反语义不同，不支持
+        if isinstance(node.operand, ast.Constant):
+            if not isinstance(node.op, (ast.USub, ast.UAdd)) or isinstance(node.operand.value, (bool, str)):
+                raise ValueError(f"unsupported unary operand: {ast.dump(node)}")
+            value = func(node.operand.value)
+            return lambda columns: value
+        return lambda columns: func(operand(columns))
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+        func, left, right = BINARY_OPERATORS[type(node.op)], _build(node.left), _build(node.right)
+        return lambda columns: func(left(columns), right(columns))
+    if isinstance(node, ast.Compare):
+        # 链式比较 a < b < c 拆为 (a < b) & (b < c)
+        parts = [_build_compare(left, op, right)
+                 for left, op, right in zip([node.left] + node.comparators, node.ops, node.comparators)]
+        if len(parts) == 1:
+            return parts[0]
+        return lambda columns: functools.reduce(operator.and_, [part(columns) for part in parts])
+    raise ValueError(f"unsupported expression node: {ast.dump(node)}")
+
+
+def _build_compare(left_node, op, right_node):
+    # pandas 对常量在左侧的成员比较有单独的改写规则，交给 pandas 处理
+    if isinstance(left_node, (ast.Constant, ast.List, ast.Tuple)) \
+            and (_is_membership(left_node, op) or _is_membership(right_node, op)):
+        raise ValueError(f"unsupported membership comparison: {ast.dump(left_node)}")
+    if _is_membership(right_node, op):
+        elements = right_node.elts if isinstance(right_node, (ast.List, ast.Tuple)) else [right_node]
+        values = [element.value for element in elements
+                  if isinstance(element, ast.Constant) and type(element.value) in CONSTANT_TYPES]
+        if type(op) not in MEMBERSHIP_OPERATORS or len(values) != len(elements):
+            raise ValueError(f"unsupported membership comparison: {ast.dump(right_node)}")
+        negate, left = MEMBERSHIP_OPERATORS[type(op)], _build(left_node)
+        if negate:
+            return lambda columns: ~left(columns).isin(values)
+        return lambda columns: left(columns).isin(values)
+    if type(op) not in COMPARE_OPERATORS:
+        raise ValueError(f"unsupported compare operator: {ast.dump(op)}")
+    func, left, right = COMPARE_OPERATORS[type(op)], _build(left_node), _build(right_node)
+    return lambda columns: func(left(columns), right(columns))
+
+
+# 与列表比较、in/not in 以及与字符串的 ==/!= 按 isin 计算
+def _is_membership(node, op):
+    if isinstance(node, (ast.List, ast.Tuple)) or type(op) in (ast.In, ast.NotIn):
+        return True
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and type(op) in MEMBERSHIP_OPERATORS
+
+
+# 生成 numexpr 表达式：布尔运算改为按位运算，链式比较展开；含字符串、列表、整除或一元 + 时返回 None
+def _numexpr_source(node):
+    if numexpr is None:
+        return None
+    for child in ast.walk(node):
+        if isinstance(child, (ast.List, ast.Tuple, ast.FloorDiv, ast.UAdd)) \
+                or isinstance(child, ast.Constant) and isinstance(child.value, str):
+            return None
+    return ast.unparse(_to_numexpr(node))
+
+
+def _to_numexpr(node):
+    if isinstance(node, ast.BoolOp):
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        return functools.reduce(lambda left, right: ast.BinOp(left, op, right), map(_to_numexpr, node.values))
+    if isinstance(node, ast.UnaryOp):
+        op = ast.Invert() if isinstance(node.op, ast.Not) else node.op
+        return ast.UnaryOp(op, _to_numexpr(node.operand))
+    if isinstance(node, ast.BinOp):
+        return ast.BinOp(_to_numexpr(node.left), node.op, _to_numexpr(node.right))
+    if isinstance(node, ast.Compare):
+        operands = [_to_numexpr(operand) for operand in [node.left] + node.comparators]
+        parts = [ast.Compare(left, [op], [right]) for left, op, right in zip(operands, node.ops, operands[1:])]
+        return functools.reduce(lambda left, right: ast.BinOp(left, ast.BitAnd(), right), parts)
+    return node
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression: str, schema: tuple) -> CompiledExpression:
+    """
+    编译 query/eval 表达式，相同表达式和列类型在进程内只编译一次
+
+    Args:
+        expression (str): pandas query/eval 语法的表达式
+        schema (tuple): 表达式引用列的 (列名, dtype)，列不存在时 dtype 为 None
+
+    Returns:
+        CompiledExpression: 编译后的表达式，表达式超出支持范围或引用列不适合直接计算时返回 None
+    """
+    statements = _parse_expression(expression)
+    dtypes = dict(schema)
+    if statements is None or any(dtype is None or dtype.kind in "mM" for dtype in dtypes.values()):
+        return None
+    # numexpr 只处理 numpy 数值列，其余情况按 python 引擎计算
+    numeric = all(isinstance(dtype, numpy.dtype) and dtype.kind in "biuf" for dtype in dtypes.values())
+    return CompiledExpression(expression, tuple(
+        (target, columns, func, numexpr_source if numeric else None)
+        for target, columns, func, numexpr_source in statements))
+
+
+def get_compiled_expression(table: DataTable, expression: str) -> CompiledExpression:
+    """
+    按表格的列类型获取编译后的表达式
+
+    Args:
+        table (DataTable): 输入表格
+        expression (str): pandas query/eval 语法的表达式
+
+    Returns:
+        CompiledExpression: 编译后的表达式，无法直接计算时返回 None
+    """
+    statements = _parse_expression(expression)
+    if statements is None or not table.columns.is_unique:
+        return None
+    columns = sorted({column for statement in statements for column in statement[1]})
+    schema = tuple((column, table[column].dtype if column in table.columns else None) for column in columns)
+    return compile_expression(expression, schema)
+
+
+def query_table(table: DataTable, expression: str, engine: str = None, inplace: bool = False):
+    """
+    按条件表达式过滤行，结果与 DataFrame.query 一致
+
+    Args:
+        table (DataTable): 输入表格
+        expression (str): 条件表达式
+        engine (str, optional): python/numexpr，默认根据行数和列类型自动选择
+        inplace (bool, optional): 是否在原表上删除不满足条件的行
+
+    Returns:
+        pandas.DataFrame: 满足条件的行，inplace 为 True 时返回 None
+    """
+    compiled = get_compiled_expression(table, expression)
+    mask = compiled.mask(table, engine) if compiled is not None and compiled.is_condition else None
+    # 行索引有重复时按标签删除会多删，交给 pandas 处理
+    if mask is None or inplace and not table.index.is_unique:
+        return table.query(expression, inplace=inplace, engine=engine)
+    if inplace:
+        table.drop(table.index[~mask], inplace=True)
+        return None
+    return take_rows(table, mask)
+
+
+def eval_table(table: DataTable, expression: str, engine: str = None, inplace: bool = False):
+    """
+    计算表达式或按表达式赋值，结果与 DataFrame.eval 一致
+
+    Args:
+        table (DataTable): 输入表格
+        expression (str): 表达式，支持多行 "列名 = 表达式" 形式的赋值
+        engine (str, optional): python/numexpr，默认根据行数和列类型自动选择
+        inplace (bool, optional): 有赋值时是否直接修改原表
+
+    Returns:
+        没有赋值时为计算结果；有赋值时为赋值后的表格，inplace 为 True 时返回 None
+    """
+    compiled = get_compiled_expression(table, expression)
+    # 没有赋值却要求 inplace 时由 pandas 抛出对应的错误
+    if compiled is None or inplace and compiled.statements[0][0] is None:
+        return table.eval(expression, engine=engine, inplace=inplace)
+    return compiled.evaluate(table, engine, inplace)
+
+
+def any_row(table: DataTable, expression: str, engine: str = None, chunk_size: int = ANY_CHUNK_SIZE) -> bool:
+    """
+    判断是否存在满足条件的行，按块计算条件，遇到满足条件的块即返回，不生成过滤后的表格
+
+    Args:
+        table (DataTable): 输入表格
+        expression (str): 条件表达式
+        engine (str, optional): python/numexpr，默认根据行数和列类型自动选择
+        chunk_size (int, optional): 每块的行数，默认 4096
+
+    Returns:
+        bool: 存在满足条件的行时为 True
+    """
+    compiled = get_compiled_expression(table, expression)
+    if compiled is not None and compiled.is_condition:
+        chunk_size = max(1, chunk_size)
+        for start in range(0, len(table), chunk_size):
+            rows = None if chunk_size >= len(table) else slice(start, start + chunk_size)
+            mask = compiled.mask(table, engine, rows)
+            if mask is None:
+                break
+            if mask.any():
+                return True
+        else:
+            return False
+    return not table.query(expression, engine=engine).empty
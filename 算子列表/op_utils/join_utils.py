@@ -0,0 +1,141 @@
+import weakref
+
+import numpy
+import pandas
+from pandas.api.extensions import take
+
+from video_graph.data_table import DataTable
+
+JOIN_HOWS = ('left', 'right', 'inner', 'outer')
+# 与 pandas.merge 默认一致的重名列后缀
+SUFFIXES = ('_x', '_y')
+
+# (id(table), key_columns) -> (签名, pandas.Index)，表被回收时通过 weakref.finalize 清理
+_key_indexes = {}
+
+
+def normalize_keys(on=None, left_on=None, right_on=None):
+    """
+    统一 join 列参数，on 与 left_on/right_on 都支持单列名或列名列表
+
+    Args:
+        on (str/list, optional): 两表同名的 join 列
+        left_on (str/list, optional): 左表的 join 列
+        right_on (str/list, optional): 右表的 join 列
+
+    Returns:
+        tuple: (left_on, right_on)，均为列名列表
+    """
+    if on is not None:
+        left_on = right_on = on
+    left_on = [left_on] if isinstance(left_on, str) else list(left_on or [])
+    right_on = [right_on] if isinstance(right_on, str) else list(right_on or [])
+    if not left_on or len(left_on) != len(right_on):
+        raise ValueError(f"invalid join keys: left_on={left_on}, right_on={right_on}")
+    return left_on, right_on
+
+
+def get_key_index(table: DataTable, key_columns: list, reuse: bool = False) -> pandas.Index:
+    """
+    获取表格 join 列组成的 pandas.Index，Index 在首次查找时建立哈希表并缓存在对象上
+
+    Args:
+        table (DataTable): 表格
+        key_columns (list): join 列，多列时返回 MultiIndex
+        reuse (bool, optional): 是否在进程内复用同一张表已建立的 Index，表的行数或列变化时重建；
+            只适用于两次 join 之间不会原地修改 join 列的表
+
+    Returns:
+        pandas.Index: join 列组成的 Index
+    """
+    cache_key = (id(table), tuple(key_columns))
+    signature = (len(table), tuple(table.columns))
+    if reuse:
+        cached = _key_indexes.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    if len(key_columns) == 1:
+        key_index = pandas.Index(table[key_columns[0]])
+    else:
+        key_index = pandas.MultiIndex.from_arrays([table[column] for column in key_columns])
+
+    if reuse:
+        if cache_key not in _key_indexes:
+            weakref.finalize(table, _key_indexes.pop, cache_key, None)
+        _key_indexes[cache_key] = (signature, key_index)
+    return key_index
+
+
+# 计算两表的行对应关系，返回 (左表行号, 右表行号, 合并后的 join 列值)，行号为 None 表示原样保留，-1 表示缺失；
+# 无法走快速路径时返回 None
+def join_indexers(left, right, left_on, right_on, how, reuse_index=False):
+    left_dtypes = [left[column].dtype for column in left_on]
+    right_dtypes = [right[column].dtype for column in right_on]
+    # join 列类型不一致时由 pandas.merge 处理类型转换或报错
+    if how not in JOIN_HOWS or left_dtypes != right_dtypes:
+        return None
+    left_index = get_key_index(left, left_on, reuse_index)
+    right_index = get_key_index(right, right_on, reuse_index)
+
+    # 单列且两表都已按 join 列升序排列：使用归并 join，不需要建哈希表
+    if len(left_on) == 1 and left_index.is_monotonic_increasing and right_index.is_monotonic_increasing:
+        join_index, left_indexer, right_indexer = left_index.join(right_index, how=how, return_indexers=True)
+        return left_indexer, right_indexer, join_index
+
+    # 右表 join 列唯一：用右表 Index 的哈希表查找左表的每一行
+    if how in ('left', 'inner') and right_index.is_unique:
+        right_indexer = right_index.get_indexer(left_index)
+        if how == 'left':
+            return None, right_indexer, None
+        matched = right_indexer != -1
+        if matched.all():
+            return None, right_indexer, None
+        return numpy.flatnonzero(matched), right_indexer[matched], None
+    return None
+
+
+# 按行号取出表格的各列，行号为 None 时复用原列数据，不做拷贝
+def _take_rows(table, indexer, length):
+    if indexer is None:
+        return table.set_axis(pandas.RangeIndex(length), axis=0)
+    columns = {column: take(table[column].array, indexer, allow_fill=True) for column in table.columns}
+    return pandas.DataFrame(columns, index=pandas.RangeIndex(length), columns=table.columns)
+
+
+def join_tables(left: DataTable, right: DataTable, on=None, left_on=None, right_on=None, how: str = 'inner',
+                reuse_index: bool = False) -> pandas.DataFrame:
+    """
+    两表 join，结果与 pandas.merge 一致；右表 join 列唯一或两表已按 join 列排序时，
+    直接计算行号对应关系并按列拼接，行顺序不变的一侧复用原列数据
+
+    Args:
+        left (DataTable): 左表
+        right (DataTable): 右表
+        on (str/list, optional): 两表同名的 join 列
+        left_on (str/list, optional): 左表的 join 列
+        right_on (str/list, optional): 右表的 join 列
+        how (str, optional): join 方式，left/right/inner/outer，默认 inner
+        reuse_index (bool, optional): 是否复用表格上已建立的 join 列 Index
+
+    Returns:
+        pandas.DataFrame: join 后的表格
+    """
+    left_on, right_on = normalize_keys(on, left_on, right_on)
+    indexers = join_indexers(left, right, left_on, right_on, how, reuse_index)
+    if indexers is None:
+        return pandas.merge(left, right, left_on=left_on, right_on=right_on, how=how)
+    left_indexer, right_indexer, join_index = indexers
+    length = len(left) if left_indexer is None else len(left_indexer)
+
+    # 两表同名的 join 列只保留一列，其余重名列加后缀
+    shared_keys = [left_key for left_key, right_key in zip(left_on, right_on) if left_key == right_key]
+    overlap = (set(left.columns) & set(right.columns)) - set(shared_keys)
+    left_part = _take_rows(left, left_indexer, length)
+    right_part = _take_rows(right.drop(columns=shared_keys), right_indexer, length)
+    if how in ('right', 'outer') and shared_keys and join_index is not None:
+        left_part[shared_keys[0]] = join_index.array
+    if overlap:
+        left_part = left_part.rename(columns={column: column + SUFFIXES[0] for column in overlap})
+        right_part = right_part.rename(columns={column: column + SUFFIXES[1] for column in overlap})
+    return pandas.concat([left_part, right_part], axis=1)
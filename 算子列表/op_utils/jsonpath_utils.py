@@ -0,0 +1,133 @@
+import functools
+import re
+
+import jsonpath
+
+# 简单路径：$ 之后只由 .key、['key']、[数字] 组成，不含通配符、递归、切片和过滤表达式
+SIMPLE_PATH_PATTERN = re.compile(r"\$(?:\.[\w-]+|\['[\w-]+'\]|\[\d+\])+")
+SIMPLE_STEP_PATTERN = re.compile(r"\.([\w-]+)|\['([\w-]+)'\]|\[(\d+)\]")
+# 进程内缓存的表达式数量上限
+PATH_CACHE_SIZE = 1024
+
+
+class JsonPath:
+    """
+    编译后的 jsonpath 表达式，简单路径直接按 key/下标逐级取值，复杂表达式交给 jsonpath 库
+
+    Attributes:
+        expr (str): 原始 jsonpath 表达式
+        steps (tuple, optional): 简单路径拆分出的 key 序列，复杂表达式为 None
+    """
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.steps = None
+        if SIMPLE_PATH_PATTERN.fullmatch(expr):
+            self.steps = tuple(key or quoted_key or index
+                               for key, quoted_key, index in SIMPLE_STEP_PATTERN.findall(expr))
+
+    # 返回全部匹配结果，没有匹配时返回空列表(jsonpath 库返回 False)
+    def find(self, value) -> list:
+        if self.steps is None:
+            return jsonpath.jsonpath(value, self.expr) or []
+        # 与 jsonpath 库一致：根对象为空时不匹配
+        if not value:
+            return []
+        for step in self.steps:
+            found, value = _step(value, step)
+            if not found:
+                return []
+        return [value]
+
+    # 返回第一个匹配结果，没有匹配时返回 default
+    def first(self, value, default=None):
+        values = self.find(value)
+        return values[0] if values else default
+
+
+class JsonPathSet:
+    """
+    一组 jsonpath 表达式，简单路径合并为前缀树，一次遍历取出全部路径的值
+
+    Attributes:
+        exprs (tuple): jsonpath 表达式，为空的表达式不提取
+    """
+
+    def __init__(self, exprs):
+        self.exprs = tuple(exprs)
+        # 前缀树节点：{step: (子节点, [结束于该节点的表达式下标])}
+        self._trie = {}
+        # [(表达式下标, JsonPath)]，无法走前缀树的复杂表达式
+        self._complex = []
+        for position, expr in enumerate(self.exprs):
+            if not expr:
+                continue
+            path = compile_path(expr)
+            if path.steps is None:
+                self._complex.append((position, path))
+                continue
+            node, ends = self._trie, None
+            for step in path.steps:
+                child = node.setdefault(step, ({}, []))
+                node, ends = child
+            ends.append(position)
+
+    # 按表达式顺序返回每个路径的第一个匹配结果，没有匹配时为 default
+    def first(self, value, default=None) -> list:
+        results = [default] * len(self.exprs)
+        if value and self._trie:
+            _walk(self._trie, value, results)
+        for position, path in self._complex:
+            results[position] = path.first(value, default)
+        return results
+
+
+def _walk(node, value, results):
+    for step, (child, ends) in node.items():
+        found, child_value = _step(value, step)
+        if not found:
+            continue
+        for position in ends:
+            results[position] = child_value
+        if child:
+            _walk(child, child_value, results)
+
+
+# 取一级 key，规则与 jsonpath 库一致：dict 按字符串 key 取值，list 只接受非负整数下标
+def _step(value, step):
+    if isinstance(value, dict):
+        if step in value:
+            return True, value[step]
+    elif isinstance(value, list) and step.isdigit():
+        index = int(step)
+        if index < len(value):
+            return True, value[index]
+    return False, None
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(expr: str) -> JsonPath:
+    """
+    编译 jsonpath 表达式，相同表达式在进程内只解析一次
+
+    Args:
+        expr (str): jsonpath 表达式，如 $.clips_info[0].video_clips
+
+    Returns:
+        JsonPath: 编译后的表达式
+    """
+    return JsonPath(expr)
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_paths(exprs: tuple) -> JsonPathSet:
+    """
+    编译一组 jsonpath 表达式，用于一次遍历提取多个路径
+
+    Args:
+        exprs (tuple): jsonpath 表达式，需为 tuple 以便缓存
+
+    Returns:
+        JsonPathSet: 编译后的表达式集合
+    """
+    return JsonPathSet(exprs)
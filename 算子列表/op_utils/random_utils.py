@@ -0,0 +1,60 @@
+import hashlib
+import threading
+
+import numpy
+
+from video_graph.op_context import OpContext
+
+# 随机数生成器缓存在 op_context 上的属性名：{流名称: numpy.random.Generator}
+CONTEXT_ATTR = "random_generators"
+_lock = threading.Lock()
+
+
+# 将字符串稳定地转为整数种子，不受 PYTHONHASHSEED 影响，同一字符串在任何进程中结果相同
+def _stable_hash(text):
+    return int.from_bytes(hashlib.sha256(str(text).encode("utf-8")).digest()[:16], "little")
+
+
+def get_rng(op_context: OpContext, stream: str = None) -> numpy.random.Generator:
+    """
+    获取按 request_id 确定种子的随机数生成器，同一请求重放时得到相同的随机结果；
+    生成器缓存在 op_context 上，同一请求内同名的流共享一个生成器
+
+    Args:
+        op_context (OpContext): 算子上下文，以 request_id 作为种子
+        stream (str, optional): 流名称，一般为算子名；不同的流互相独立，
+            并行算子各自使用自己的流，结果不受执行顺序影响，也不会跨线程共享同一个生成器
+
+    Returns:
+        numpy.random.Generator: 随机数生成器
+    """
+    generators = getattr(op_context, CONTEXT_ATTR, None)
+    if generators is None or stream not in generators:
+        with _lock:
+            generators = getattr(op_context, CONTEXT_ATTR, None)
+            if generators is None:
+                generators = {}
+                setattr(op_context, CONTEXT_ATTR, generators)
+            if stream not in generators:
+                spawn_key = () if stream is None else (_stable_hash(stream),)
+                seed = numpy.random.SeedSequence(_stable_hash(op_context.request_id), spawn_key=spawn_key)
+                generators[stream] = numpy.random.default_rng(seed)
+    return generators[stream]
+
+
+def choose_each(rng: numpy.random.Generator, sequences: list) -> list:
+    """
+    从每个序列中各随机选取一个元素，一次生成所有下标，替代逐行 random.choice
+
+    Args:
+        rng (numpy.random.Generator): 随机数生成器
+        sequences (list): 序列列表，元素为 list/tuple 等支持下标访问的序列
+
+    Returns:
+        list: 每个序列中选出的元素，序列为空时抛出 IndexError，与 random.choice 一致
+    """
+    lengths = numpy.fromiter(map(len, sequences), dtype=numpy.int64, count=len(sequences))
+    if (lengths == 0).any():
+        raise IndexError("Cannot choose from an empty sequence")
+    positions = rng.integers(lengths) if len(sequences) else lengths
+    return [sequence[position] for sequence, position in zip(sequences, positions.tolist())]
@@ -0,0 +1,125 @@
+import threading
+import time
+
+# 批量读取方式：mget 一次请求多个 key，仅适用于单节点；pipeline 在一次往返中发送多个 GET，集群客户端会按节点拆分；single 逐个 GET
+BATCH_MODES = ('mget', 'pipeline', 'single')
+DEFAULT_CHUNK_SIZE = 100
+
+
+class TTLCache:
+    """
+    进程内短时缓存，按写入时间过期，超过容量时先清理过期项，仍然超过时清空
+
+    Attributes:
+        max_size (int): 最多缓存的 key 数量
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        # key -> (过期时间, value)
+        self._items = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        if item[0] < time.monotonic():
+            with self._lock:
+                self._items.pop(key, None)
+            return None
+        return item[1]
+
+    def set(self, key, value, ttl):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._items) >= self.max_size:
+                self._items = {k: item for k, item in self._items.items() if item[0] >= now}
+                if len(self._items) >= self.max_size:
+                    self._items = {}
+            self._items[key] = (now + ttl, value)
+
+
+# 按集群名共享的进程内缓存
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_ttl_cache(name: str) -> TTLCache:
+    """
+    获取按名称共享的进程内缓存
+
+    Args:
+        name (str): 缓存名称，一般为 Redis 集群名
+
+    Returns:
+        TTLCache: 同名共享的缓存
+    """
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = TTLCache()
+        return _caches[name]
+
+
+# 集群客户端(redis-py 的 RedisCluster 等)的 mget 要求所有 key 在同一个 slot，否则报 CROSSSLOT
+def is_cluster_client(redis_client):
+    return hasattr(redis_client, 'nodes_manager') or hasattr(redis_client, 'mget_nonatomic')
+
+
+def batch_get(redis_client, keys: list, chunk_size: int = DEFAULT_CHUNK_SIZE, mode: str = 'pipeline',
+              cache: TTLCache = None, cache_ttl: float = 0) -> list:
+    """
+    批量读取 Redis 字符串 Value，key 去重后按 chunk_size 分块，每块一次网络往返
+
+    Args:
+        redis_client: redis 客户端，需支持 get/mget/pipeline
+        keys (list): Redis Key 列表，为空的 key 不读取
+        chunk_size (int, optional): 每次请求的 key 数量，默认 100
+        mode (str, optional): 读取方式，可选 mget/pipeline/single，默认 pipeline；
+            mget 只适用于单节点，集群客户端或返回 CROSSSLOT 错误时改用 pipeline
+        cache (TTLCache, optional): 进程内缓存，只缓存存在的 key
+        cache_ttl (float, optional): 缓存时间(秒)，0 表示不使用缓存
+
+    Returns:
+        list: 与 keys 一一对应的 Value，key 为空或不存在时为 None
+    """
+    if mode not in BATCH_MODES:
+        raise ValueError(f"unsupported redis batch mode: {mode}")
+    if mode == 'mget' and is_cluster_client(redis_client):
+        mode = 'pipeline'
+    use_cache = cache is not None and cache_ttl > 0
+    values = {}
+    pending = []
+    for key in dict.fromkeys(key for key in keys if key):
+        value = cache.get(key) if use_cache else None
+        if value is None:
+            pending.append(key)
+        else:
+            values[key] = value
+
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        chunk_values = None
+        if mode == 'mget':
+            try:
+                chunk_values = redis_client.mget(chunk)
+            except Exception as error:
+                if 'CROSSSLOT' not in str(error):
+                    raise
+                mode = 'pipeline'
+        if mode == 'pipeline':
+            pipeline = redis_client.pipeline(transaction=False)
+            for key in chunk:
+                pipeline.get(key)
+            chunk_values = pipeline.execute()
+        elif mode == 'single':
+            chunk_values = [redis_client.get(key) for key in chunk]
+        for key, value in zip(chunk, chunk_values):
+            if isinstance(value, bytes):
+                value = value.decode('utf-8')
+            values[key] = value
+            if use_cache and value is not None:
+                cache.set(key, value, cache_ttl)
+
+    return [values.get(key) if key else None for key in keys]
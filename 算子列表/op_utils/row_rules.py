@@ -0,0 +1,153 @@
+import numpy
+import pandas
+
+from video_graph.data_table import DataTable
+
+# 各规则对 value 类型的要求
+RULE_VALUE_TYPES = {
+    "=": (int, float, str, bool),
+    "in": list,
+    "not_in": list,
+    ">": (int, float),
+    "<": (int, float),
+    ">=": (int, float),
+    "<=": (int, float),
+    "contains": (int, float, str, bool),
+    "contains_any": list,
+    "is_empty": object,
+}
+# 取反时有对应规则的直接换成对应规则，保持与原先 reverse 写法一致(如 > 取反为 <=，NaN 两边都不满足)
+RULE_COMPLEMENTS = {">": "<=", "<": ">=", ">=": "<", "<=": ">", "in": "not_in", "not_in": "in"}
+
+
+class RowRule:
+    """
+    编译后的行规则，对整列计算布尔掩码
+
+    Attributes:
+        column (str): 规则处理的列名
+        rule (str): 规则类型，见 RULE_VALUE_TYPES
+        value: 规则对应的值
+        negate (bool): 是否对结果取反
+    """
+
+    def __init__(self, column, rule, value=None, negate=False):
+        if rule not in RULE_VALUE_TYPES or not isinstance(value, RULE_VALUE_TYPES[rule]):
+            raise ValueError(f"params error, column:{column}, rule:{rule} value:{value},{type(value)}")
+        if negate and rule in RULE_COMPLEMENTS:
+            rule, negate = RULE_COMPLEMENTS[rule], False
+        self.column = column
+        self.rule = rule
+        self.value = value
+        self.negate = negate
+
+    # 计算满足规则的行，exploded 为同一次计算中 列名 -> explode 结果的缓存
+    def mask(self, table, exploded=None):
+        series = table[self.column]
+        if self.rule == "=":
+            mask = series.isin([self.value])
+        elif self.rule == "in":
+            mask = series.isin(self.value)
+        elif self.rule == "not_in":
+            mask = ~series.isin(self.value)
+        elif self.rule == ">":
+            mask = series > self.value
+        elif self.rule == "<":
+            mask = series < self.value
+        elif self.rule == ">=":
+            mask = series >= self.value
+        elif self.rule == "<=":
+            mask = series <= self.value
+        elif self.rule == "contains":
+            mask = _contains(series, self.value)
+        elif self.rule == "contains_any":
+            mask = _contains_any(series, self.column, self.value, exploded)
+        else:
+            mask = is_empty(series)
+        mask = numpy.asarray(mask, dtype=bool)
+        return ~mask if self.negate else mask
+
+
+# regex=False 时逐元素执行 value in x：字符串为子串匹配，list/dict 为成员判断，None 和不支持 in 的值为 False
+def _contains(series, value):
+    try:
+        return series.str.contains(value, regex=False, na=False)
+    except AttributeError:
+        # 列中没有字符串/list 等类型时 pandas 不允许使用 .str
+        return numpy.zeros(len(series), dtype=bool)
+
+
+# list 列中包含 values 任一元素的行：explode 后按哈希查找，再按 explode 保留的行号回填
+def _contains_any(series, column, values, exploded=None):
+    if exploded is not None and column in exploded:
+        flat = exploded[column]
+    else:
+        flat = series.reset_index(drop=True).explode()
+        if exploded is not None:
+            exploded[column] = flat
+    mask = numpy.zeros(len(series), dtype=bool)
+    mask[flat.index[flat.isin(values).to_numpy()]] = True
+    return mask
+
+
+def is_empty(series: pandas.Series) -> numpy.ndarray:
+    """
+    按列判断是否为空，与逐行 not x 一致：None、空字符串、空列表/字典、0/False 为空，NaN 不为空
+
+    Args:
+        series (pandas.Series): 列数据
+
+    Returns:
+        numpy.ndarray: 为空的行为 True
+    """
+    values = series.to_numpy()
+    if values.dtype.kind not in 'biuf':
+        values = series.to_numpy(dtype=object)
+    # numpy 将 object 数组转为 bool 时逐元素调用 Python 的真值判断
+    return ~values.astype(bool)
+
+
+def compile_rules(rules: list) -> list:
+    """
+    编译一组行规则
+
+    Args:
+        rules (list): 规则列表，每个规则为 dict，包含 column、rule、value，可选 reverse 表示取反
+
+    Returns:
+        list: RowRule 列表，规则或 value 类型不合法时抛出 ValueError
+    """
+    return [RowRule(rule.get("column"), rule.get("rule"), rule.get("value"), rule.get("reverse", False))
+            for rule in rules]
+
+
+def rules_mask(table: DataTable, rules: list) -> numpy.ndarray:
+    """
+    计算同时满足所有规则的行，同一列的 explode 结果在各规则间共享
+
+    Args:
+        table (DataTable): 输入表格
+        rules (list): RowRule 列表
+
+    Returns:
+        numpy.ndarray: 布尔掩码，满足所有规则的行为 True
+    """
+    mask = numpy.ones(len(table), dtype=bool)
+    exploded = {}
+    for rule in rules:
+        mask &= rule.mask(table, exploded)
+    return mask
+
+
+def take_rows(table: DataTable, mask: numpy.ndarray) -> DataTable:
+    """
+    按布尔掩码一次性取出行，不生成中间表
+
+    Args:
+        table (DataTable): 输入表格
+        mask (numpy.ndarray): 布尔掩码
+
+    Returns:
+        DataTable: 取出的行组成的新表
+    """
+    return table.take(numpy.flatnonzero(mask))
@@ -0,0 +1,93 @@
+import numpy
+import pandas
+
+from video_graph.data_table import DataTable
+
+
+def column_values(table: DataTable, column_name: str) -> list:
+    """
+    按列取出所有行的值，等价于逐行 row.get(column_name)
+
+    Args:
+        table (DataTable): 输入表格
+        column_name (str): 列名，列不存在时返回全为 None 的列表
+
+    Returns:
+        list: 该列各行的 Python 原生值
+    """
+    if column_name is None or column_name not in table.columns:
+        return [None] * len(table)
+    return table[column_name].tolist()
+
+
+def map_columns(table: DataTable, func, *column_names: str) -> list:
+    """
+    按列批量执行行级函数，替代 iterrows 逐行构造 Series 的写法
+
+    Args:
+        table (DataTable): 输入表格
+        func (callable): 行级函数，入参依次为 column_names 各列在该行的值
+        column_names (str): 参与计算的列名
+
+    Returns:
+        list: 每行的计算结果
+    """
+    columns = [column_values(table, column_name) for column_name in column_names]
+    return [func(*values) for values in zip(*columns)]
+
+
+def assign_column(table: DataTable, column_name: str, values, dtype=object) -> DataTable:
+    """
+    一次性写入整列，替代先置 None 再逐行 .at/.loc 写回的写法
+
+    Args:
+        table (DataTable): 输入表格，原地修改
+        column_name (str): 列名，已存在时覆盖
+        values (list/numpy.ndarray): 与表格行数相同的列值，list 中的 list/dict 元素按对象原样保存
+        dtype (optional): 列类型，默认 object 与原先逐行写入的结果一致，数值列可传入 None 保留 numpy 类型
+
+    Returns:
+        DataTable: 输入表格本身
+    """
+    table[column_name] = pandas.Series(values, index=table.index, dtype=dtype)
+    return table
+
+
+# 各类型列新增行的默认值：数值列为 0，bool 列为 False，时间列为 NaT，其余列为 None
+def default_value(dtype):
+    if isinstance(dtype, numpy.dtype):
+        if dtype.kind in 'iuf':
+            return 0
+        if dtype.kind == 'b':
+            return False
+        if dtype.kind in 'mM':
+            return numpy.datetime64('NaT') if dtype.kind == 'M' else numpy.timedelta64('NaT')
+    return None
+
+
+def append_rows(table: DataTable, row_num: int, values: dict = None) -> DataTable:
+    """
+    在表格末尾一次性追加多行，替代逐行 table.loc[len(table)] = ... 每次都重新分配所有列的写法，
+    新行的行索引从 len(table) 开始，与逐行追加一致
+
+    Args:
+        table (DataTable): 输入表格
+        row_num (int): 追加的行数
+        values (dict, optional): 列名 -> 新行的值，未指定的列按列类型取默认值，见 default_value
+
+    Returns:
+        DataTable: 追加行后的新表格，表名与输入表格相同；列类型保持不变，整数列不会被提升为 float/object
+    """
+    if row_num <= 0:
+        return table
+    values = values or {}
+    index = pandas.RangeIndex(len(table), len(table) + row_num)
+    columns = {}
+    for column in table.columns:
+        if column in values:
+            columns[column] = pandas.Series([values[column]] * row_num, index=index, dtype=object)
+        else:
+            dtype = table[column].dtype
+            columns[column] = pandas.Series([default_value(dtype)] * row_num, index=index, dtype=dtype)
+    new_rows = pandas.DataFrame(columns, index=index, columns=table.columns)
+    return DataTable(name=table.name, data=pandas.concat([table, new_rows]))
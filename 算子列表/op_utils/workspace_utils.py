@@ -0,0 +1,238 @@
+import os
+import queue
+import shutil
+import threading
+import time
+import uuid
+import weakref
+
+from video_graph.common.utils.logger import logger
+from video_graph.op_context import OpContext
+
+# 单个请求临时目录的默认磁盘配额
+DEFAULT_QUOTA_BYTES = 20 * 1024 ** 3
+# 使用临时目录的 OpContext 都已释放(请求已结束，包括异常退出)且超过该时长(秒)未被访问时，由后台线程回收
+DEFAULT_IDLE_TTL = 3600
+# 后台线程检查空闲临时目录的间隔(秒)
+REAP_INTERVAL = 60
+# 两次统计磁盘占用的最小间隔(秒)，间隔内的配额检查复用上次的统计结果
+QUOTA_CHECK_INTERVAL = 10
+# 待删除文件或目录改名后的后缀，改名后原路径可立即被重新使用
+TOMBSTONE_SUFFIX = ".removing"
+
+
+class WorkspaceQuotaExceeded(OSError):
+    """
+    请求临时目录的磁盘占用超过配额
+    """
+
+
+class Workspace:
+    """
+    单个请求的临时目录，同一请求内的算子共用，请求结束后由后台线程整体删除，不阻塞请求；
+    持有使用过该目录的 OpContext 的弱引用，只要请求仍在执行就不会被回收
+
+    Attributes:
+        directory (str): 临时目录，为 {process_id}/{request_id}
+        quota_bytes (int): 磁盘占用上限(字节)
+        idle_ttl (float): 请求结束且超过该时长(秒)未被访问时自动回收
+        last_used (float): 最近一次访问的时间(time.monotonic)
+    """
+
+    def __init__(self, directory, quota_bytes=DEFAULT_QUOTA_BYTES, idle_ttl=DEFAULT_IDLE_TTL):
+        self.directory = directory
+        self.quota_bytes = quota_bytes
+        self.idle_ttl = idle_ttl
+        self.last_used = time.monotonic()
+        self._contexts = weakref.WeakSet()
+        self._usage = 0
+        self._usage_checked = None
+        os.makedirs(directory, exist_ok=True)
+
+    def attach(self, op_context: OpContext):
+        """
+        记录使用该目录的 OpContext 并刷新访问时间，OpContext 被释放前目录不会被回收
+
+        Args:
+            op_context (OpContext): 算子上下文
+        """
+        self._contexts.add(op_context)
+        self.last_used = time.monotonic()
+
+    # 是否为已结束请求遗留的目录：使用过的 OpContext 都已释放且空闲超时
+    def orphaned(self, now):
+        return len(self._contexts) == 0 and now - self.last_used > self.idle_ttl
+
+    def path(self, file_name: str) -> str:
+        """
+        临时目录下的文件路径
+
+        Args:
+            file_name (str): 文件名
+
+        Returns:
+            str: 文件路径
+        """
+        self.last_used = time.monotonic()
+        return os.path.join(self.directory, file_name)
+
+    # 当前磁盘占用(字节)，包括子目录中的文件
+    def usage(self):
+        total = 0
+        for directory, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                try:
+                    total += os.stat(os.path.join(directory, file_name)).st_size
+                except OSError:
+                    continue
+        return total
+
+    def check_quota(self, force: bool = False):
+        """
+        检查磁盘占用，超过配额时抛出 WorkspaceQuotaExceeded；统计需要遍历目录，
+        距上次统计不足 QUOTA_CHECK_INTERVAL 秒时复用上次的结果
+
+        Args:
+            force (bool, optional): 是否忽略间隔重新统计，默认为 False
+        """
+        now = time.monotonic()
+        if force or self._usage_checked is None or now - self._usage_checked >= QUOTA_CHECK_INTERVAL:
+            self._usage = self.usage()
+            self._usage_checked = now
+        if self._usage > self.quota_bytes:
+            raise WorkspaceQuotaExceeded(f"workspace {self.directory} uses {self._usage} bytes, "
+                                         f"exceeds quota {self.quota_bytes} bytes")
+
+
+# 临时目录 -> Workspace，进程内所有请求共享
+_workspaces = {}
+_lock = threading.Lock()
+# 待删除的文件或目录，由后台线程删除
+_removals = queue.Queue()
+_reaper = None
+
+
+# 删除文件或目录，不存在时忽略
+def _remove(path):
+    try:
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif os.path.lexists(path):
+            os.remove(path)
+    except Exception as error:
+        logger.error(f"remove {path} failed, error:{error!r}")
+
+
+# 将文件或目录改名为同目录下唯一的待删除路径，原路径可立即被重新创建；不存在或改名失败时返回 None
+def _tombstone(path):
+    try:
+        if not os.path.lexists(path):
+            return None
+        tombstone = f"{path.rstrip(os.sep)}.{uuid.uuid4().hex}{TOMBSTONE_SUFFIX}"
+        os.rename(path, tombstone)
+        return tombstone
+    except Exception as error:
+        logger.error(f"rename {path} for removal failed, error:{error!r}")
+        return None
+
+
+# 后台线程：删除排队的文件，并定期回收已结束请求遗留的临时目录
+def _reap():
+    last_sweep = time.monotonic()
+    while True:
+        try:
+            _remove(_removals.get(timeout=REAP_INTERVAL))
+        except queue.Empty:
+            pass
+        now = time.monotonic()
+        if now - last_sweep < REAP_INTERVAL:
+            continue
+        last_sweep = now
+        # 在锁内改名，避免同一请求此时重新获取到即将被删除的目录
+        with _lock:
+            expired = [directory for directory, workspace in _workspaces.items() if workspace.orphaned(now)]
+            tombstones = []
+            for directory in expired:
+                del _workspaces[directory]
+                tombstones.append(_tombstone(directory))
+        for directory, tombstone in zip(expired, tombstones):
+            logger.info(f"workspace {directory} idle timeout, removed")
+            if tombstone is not None:
+                _remove(tombstone)
+
+
+# 首次使用时启动后台线程
+def _start_reaper():
+    global _reaper
+    if _reaper is None:
+        with _lock:
+            if _reaper is None:
+                _reaper = threading.Thread(target=_reap, name="workspace-reaper", daemon=True)
+                _reaper.start()
+
+
+def remove_in_background(path: str):
+    """
+    将文件或目录改名后交给后台线程删除，调用方不等待删除完成，原路径可立即被重新使用
+
+    Args:
+        path (str): 文件或目录路径
+    """
+    tombstone = _tombstone(path)
+    if tombstone is None:
+        return
+    _start_reaper()
+    _removals.put(tombstone)
+
+
+def get_workspace(op_context: OpContext, quota_bytes: int = None, idle_ttl: float = None) -> Workspace:
+    """
+    获取当前请求的临时目录，不存在时创建，并检查磁盘配额；同一进程内 request_id 相同的算子得到同一个目录，
+    op_context 被释放前该目录不会被后台线程回收
+
+    Args:
+        op_context (OpContext): 算子上下文，按 process_id 和 request_id 确定目录
+        quota_bytes (int, optional): 设置磁盘占用上限(字节)，默认为 20GB
+        idle_ttl (float, optional): 设置请求结束后空闲多久(秒)自动回收，默认为 3600
+
+    Returns:
+        Workspace: 当前请求的临时目录
+    """
+    directory = os.path.join(str(op_context.process_id), str(op_context.request_id))
+    with _lock:
+        workspace = _workspaces.get(directory)
+        if workspace is None:
+            workspace = _workspaces[directory] = Workspace(directory)
+        workspace.attach(op_context)
+        # 目录可能被 TempFileRemoveOp 等删除，确保存在
+        os.makedirs(directory, exist_ok=True)
+    if quota_bytes is not None:
+        workspace.quota_bytes = quota_bytes
+    if idle_ttl is not None:
+        workspace.idle_ttl = idle_ttl
+    _start_reaper()
+    workspace.check_quota()
+    return workspace
+
+
+def release_workspace(op_context: OpContext) -> bool:
+    """
+    请求结束时释放临时目录：改名后由后台线程删除，之后同一请求再获取时得到新建的空目录；
+    未释放的目录在请求结束且空闲超时后同样会被回收
+
+    Args:
+        op_context (OpContext): 算子上下文
+
+    Returns:
+        bool: 该请求是否有临时目录
+    """
+    directory = os.path.join(str(op_context.process_id), str(op_context.request_id))
+    with _lock:
+        workspace = _workspaces.pop(directory, None)
+        if workspace is None:
+            return False
+        tombstone = _tombstone(directory)
+    if tombstone is not None:
+        _start_reaper()
+        _removals.put(tombstone)
+    return True